@@ -9,11 +9,13 @@ from __future__ import annotations
 import tkinter as tk
 from tkinter import ttk, messagebox
 from itertools import permutations
+import heapq
 import time
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 import math
-import threading
 
 
 # -----------------------------
@@ -37,6 +39,7 @@ class ScheduleResult:
         self.total_delay = total_delay
         self.computation_time = computation_time
         self.candidates = candidates  # 試した候補数
+        self.lower_bound: Optional[int] = None  # 下界と一致して最適と分かったときの下界（総当たりは省略）
         self.schedule: List[Tuple[Task, int, int, int]] = []  # (task, start, end, delay)
         self._calculate_schedule()
 
@@ -79,6 +82,39 @@ def calculate_total_delay(order: List[Task]) -> int:
     return total_delay
 
 
+def lower_bound_total_delay(tasks: List[Task]) -> int:
+    """
+    遅延合計の最適値の下界（O(n log n)）。次の最大値:
+    - k 番目に早い完了時刻（短い順）と k 番目に早い締切を組にした遅延の合計
+    - 締切順の最大遅延（どの順序でも最大遅延はこれ以上、遅延合計は最大遅延以上）
+    - Moore–Hodgson 法の遅延件数（遅延するタスクは少なくとも1分遅れる）
+    """
+    pairing = 0
+    t = 0
+    for p, d in zip(sorted(task.duration for task in tasks), sorted(task.deadline for task in tasks)):
+        t += p
+        pairing += max(0, t - d)
+
+    edd = sorted(tasks, key=lambda task: task.deadline)
+    max_delay = 0
+    t = 0
+    for task in edd:
+        t += task.duration
+        max_delay = max(max_delay, t - task.deadline)
+
+    late_count = 0
+    t = 0
+    on_time: List[int] = []  # 間に合わせるタスクの -所要時間（最も長いものを取り出す）
+    for task in edd:
+        heapq.heappush(on_time, -task.duration)
+        t += task.duration
+        if t > task.deadline:
+            t += heapq.heappop(on_time)
+            late_count += 1
+
+    return max(pairing, max_delay, late_count)
+
+
 def improve_by_swaps(order: List[Task], max_iters: int = 4000) -> Tuple[List[Task], int]:
     """
     ローカル探索（swap改善）:
@@ -110,6 +146,169 @@ def improve_by_swaps(order: List[Task], max_iters: int = 4000) -> Tuple[List[Tas
     return best, candidates
 
 
+def exhaustive_search(tasks: List[Task]) -> Tuple[List[Task], int, int]:
+    """
+    全順列を深さ優先で列挙する総当たり（permutations を順に評価するのと同じ順・同じ結果）。
+    順序は1本の配列に上書きし、完了時刻と途中までの遅延合計を再帰で下へ渡すので、
+    順列ごとのリスト生成や先頭からの再計算をしない。最後の3つは再帰せずにその場で評価する。
+    返り値: (最適順序, 遅延合計, 評価した順列数)
+    """
+    n = len(tasks)
+    if n <= 2:
+        best = min(permutations(tasks), key=calculate_total_delay)
+        return list(best), calculate_total_delay(best), math.factorial(n)
+
+    durations = [t.duration for t in tasks]
+    deadlines = [t.deadline for t in tasks]
+    order = [0] * n
+    placed = [False] * n
+    best_order: List[int] = []
+    best_delay = math.inf
+    last = n - 3
+
+    def dfs(k: int, t: int, delay: int) -> None:
+        nonlocal best_order, best_delay
+        if k == last:
+            # 残り3つ: 6通りをその場で評価する（辞書式順）
+            rest = [j for j in range(n) if not placed[j]]
+            for x, y, z in ((0, 1, 2), (0, 2, 1), (1, 0, 2), (1, 2, 0), (2, 0, 1), (2, 1, 0)):
+                x, y, z = rest[x], rest[y], rest[z]
+                c = t + durations[x]
+                d = c - deadlines[x]
+                d = delay + d if d > 0 else delay
+                c += durations[y]
+                e = c - deadlines[y]
+                if e > 0:
+                    d += e
+                c += durations[z]
+                e = c - deadlines[z]
+                if e > 0:
+                    d += e
+                if d < best_delay:
+                    best_delay = d
+                    order[k], order[k + 1], order[k + 2] = x, y, z
+                    best_order = order[:]
+            return
+        for j in range(n):
+            if placed[j]:
+                continue
+            c = t + durations[j]
+            placed[j] = True
+            order[k] = j
+            dfs(k + 1, c, delay + max(0, c - deadlines[j]))
+            placed[j] = False
+
+    dfs(0, 0, 0)
+    return [tasks[j] for j in best_order], int(best_delay), math.factorial(n)
+
+
+# -----------------------------
+# Parallel Brute Force (multi-process)
+# -----------------------------
+PARALLEL_SYNC_INTERVAL = 1024  # 何ノードごとに共有の暫定値を読み直すか
+
+_shared_best = None  # ワーカープロセス内で共有する暫定最良値（multiprocessing.Value）
+
+
+def _init_parallel_worker(shared_best) -> None:
+    """ワーカープロセスの初期化（共有の暫定最良値を受け取る）"""
+    global _shared_best
+    _shared_best = shared_best
+
+
+def _search_prefix(prefix: Tuple[int, ...], durations: List[int],
+                   deadlines: List[int]) -> Tuple[int, Optional[List[int]], int]:
+    """
+    先頭を prefix に固定した順列だけを深さ優先で列挙する（ワーカープロセスで実行）。
+    遅延合計は途中までの値より減らないので、共有の暫定最良値以上の枝は打ち切る。
+    返り値: (見つけた最良値, その順序の index 列 or None, 訪問したノード数)
+    """
+    n = len(durations)
+    raw_best = _shared_best.get_obj()
+    bound = raw_best.value
+    best_order: Optional[List[int]] = None
+    nodes = 0
+
+    placed = [False] * n
+    order: List[int] = []
+
+    def dfs(t: int, delay: int) -> None:
+        nonlocal bound, best_order, nodes
+        nodes += 1
+        if nodes % PARALLEL_SYNC_INTERVAL == 0 and raw_best.value < bound:
+            bound = raw_best.value
+        if len(order) == n:
+            bound = delay
+            best_order = order[:]
+            with _shared_best.get_lock():
+                if delay < _shared_best.value:
+                    _shared_best.value = delay
+            return
+        for j in range(n):
+            if placed[j]:
+                continue
+            c = t + durations[j]
+            d = delay + max(0, c - deadlines[j])
+            if d >= bound:
+                continue
+            placed[j] = True
+            order.append(j)
+            dfs(c, d)
+            order.pop()
+            placed[j] = False
+
+    t = 0
+    delay = 0
+    for j in prefix:
+        t += durations[j]
+        delay += max(0, t - deadlines[j])
+        placed[j] = True
+        order.append(j)
+    if delay < bound:
+        dfs(t, delay)
+
+    return bound, best_order, nodes
+
+
+def parallel_brute_force(tasks: List[Task], initial_order: Optional[List[Task]] = None,
+                         workers: Optional[int] = None,
+                         prefix_depth: int = 2) -> Tuple[List[Task], int, int]:
+    """
+    順列空間を先頭 prefix_depth 個のタスクで分割し、プロセスプールで並列に総当たりする。
+    各ワーカーは共有メモリの暫定最良値を見て枝刈りし、最後に結果をまとめる。
+    返り値: (最適順序, 遅延合計, 全ワーカーの訪問ノード数の合計)
+    """
+    n = len(tasks)
+    if n == 0:
+        return [], 0, 1
+
+    durations = [t.duration for t in tasks]
+    deadlines = [t.deadline for t in tasks]
+    if initial_order is None:
+        initial_order = sorted(tasks, key=lambda t: t.deadline)
+    best_order: List[Task] = list(initial_order)
+    best_delay = calculate_total_delay(best_order)
+
+    # 締切順に並べた prefix から投入すると良い暫定解が早く見つかりやすい
+    edd = sorted(range(n), key=lambda j: (deadlines[j], durations[j]))
+    depth = max(1, min(prefix_depth, n - 1))
+    prefixes = list(permutations(edd, depth))
+
+    shared_best = multiprocessing.Value("q", best_delay)
+    total_nodes = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_parallel_worker,
+                             initargs=(shared_best,)) as pool:
+        futures = [pool.submit(_search_prefix, p, durations, deadlines) for p in prefixes]
+        for fut in futures:
+            delay, order_idx, nodes = fut.result()
+            total_nodes += nodes
+            if order_idx is not None and delay < best_delay:
+                best_delay = delay
+                best_order = [tasks[j] for j in order_idx]
+
+    return best_order, best_delay, total_nodes
+
+
 # -----------------------------
 # App
 # -----------------------------
@@ -134,6 +333,13 @@ class TaskSchedulerApp:
         # selection for gantt
         self.gantt_mode = tk.StringVar(value="4")  # "4" or "2"
 
+        # brute force on all cores
+        self.parallel_var = tk.BooleanVar(value=False)
+
+        # 4つの解法を同時に走らせ、終わったものから表示する
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="solver")
+        self.pending = 0
+
         self.setup_ui()
         self.add_sample_tasks()
 
@@ -219,6 +425,13 @@ class TaskSchedulerApp:
             command=self.draw_gantt_chart_safe
         ).pack(side=tk.LEFT)
 
+        tk.Checkbutton(
+            btn_frame, text="⚙️ 並列総当たり（マルチコア）", variable=self.parallel_var,
+            bg="#16213e", fg="white", selectcolor="#16213e",
+            activebackground="#16213e", activeforeground="white",
+            font=(self.font_family, 10)
+        ).pack(side=tk.LEFT, padx=10)
+
         self.optimize_btn = tk.Button(
             btn_frame, text="⚡ 最適化実行", command=self.optimize,
             bg="#00d9ff", fg="black", font=(self.font_family, 11, "bold"),
@@ -391,21 +604,27 @@ class TaskSchedulerApp:
     def brute_force_optimize(self) -> ScheduleResult:
         """総当たりで最適解を探す（nが大きいと爆発）"""
         start = time.perf_counter()
+        best_order, best_delay, candidates = exhaustive_search(self.tasks)
+        elapsed = time.perf_counter() - start
+        return ScheduleResult(best_order, best_delay, elapsed, candidates=candidates)
 
-        best_order: Optional[List[Task]] = None
-        best_delay = float("inf")
-        candidates = 0
-
-        for perm in permutations(self.tasks):
-            candidates += 1
-            order = list(perm)
-            delay = calculate_total_delay(order)
-            if delay < best_delay:
-                best_delay = delay
-                best_order = order
-
+    def certify_by_lower_bound(self, best: ScheduleResult) -> Optional[ScheduleResult]:
+        """best が遅延合計の下界に届いていれば、最適と証明済みの結果として返す（届かなければ None）"""
+        start = time.perf_counter()
+        bound = lower_bound_total_delay(self.tasks)
+        if best.total_delay > bound:
+            return None
+        result = ScheduleResult(best.order, best.total_delay, time.perf_counter() - start, candidates=0)
+        result.lower_bound = bound
+        return result
+
+    def parallel_brute_force_optimize(self, seed: Optional[ScheduleResult] = None) -> ScheduleResult:
+        """プロセスプールで順列空間を分割して並列に総当たり（candidates=訪問ノード数）"""
+        start = time.perf_counter()
+        initial = seed.order if seed is not None else None
+        best_order, best_delay, nodes = parallel_brute_force(self.tasks, initial_order=initial)
         elapsed = time.perf_counter() - start
-        return ScheduleResult(best_order or [], int(best_delay), elapsed, candidates=candidates)
+        return ScheduleResult(best_order, best_delay, elapsed, candidates=nodes)
 
     # -------------------------
     # Optimize (threaded)
@@ -424,41 +643,65 @@ class TaskSchedulerApp:
             ):
                 return
 
+        parallel = self.parallel_var.get()
+
+        self.res_edf = self.res_spt = self.res_edf_improved = self.res_bruteforce = None
         self.optimize_btn.config(state=tk.DISABLED)
+        self.canvas.delete("all")
         self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, "⏳ 計算中...（EDF / SPT / EDF+改善 / 総当たり）\n")
-        self.root.update()
-
-        def worker():
-            # Run light ones first (gives earlier feel, though we update at end)
-            res_edf = self.heuristic_edf()
-            res_spt = self.heuristic_spt()
-            res_edf_imp = self.heuristic_edf_improve()
-
-            # Bruteforce last
-            res_bf = self.brute_force_optimize()
-
-            def done():
-                self.res_edf = res_edf
-                self.res_spt = res_spt
-                self.res_edf_improved = res_edf_imp
-                self.res_bruteforce = res_bf
-
-                self.display_results()
-                self.draw_gantt_chart_safe()
-                self.optimize_btn.config(state=tk.NORMAL)
+        self.result_text.insert(tk.END, "⏳ 計算中...（EDF / SPT / EDF+改善 / 総当たり、終わったものから表示）\n")
+
+        # 軽い解法は数ミリ秒で終わるので、総当たりを待たずにすぐ表示される
+        fut_edf = self.executor.submit(self.heuristic_edf)
+        fut_spt = self.executor.submit(self.heuristic_spt)
+        fut_improve = self.executor.submit(self.heuristic_edf_improve)
+
+        def brute_force() -> ScheduleResult:
+            # ヒューリスティックの最良解が下界に届いていれば、それが最適なので総当たりしない
+            best = min((f.result() for f in (fut_edf, fut_spt, fut_improve)), key=lambda r: r.total_delay)
+            certified = self.certify_by_lower_bound(best)
+            if certified is not None:
+                return certified
+            if parallel:
+                return self.parallel_brute_force_optimize(seed=fut_improve.result())
+            return self.brute_force_optimize()
+
+        jobs = [
+            ("res_edf", fut_edf),
+            ("res_spt", fut_spt),
+            ("res_edf_improved", fut_improve),
+            ("res_bruteforce", self.executor.submit(brute_force)),
+        ]
+        self.pending = len(jobs)
+        for attr, fut in jobs:
+            # 完了時のコールバックはワーカースレッドで呼ばれるので、画面の更新は after でメインスレッドへ渡す
+            fut.add_done_callback(lambda f, attr=attr: self.root.after(0, self.on_solver_done, attr, f))
 
-            self.root.after(0, done)
+    def on_solver_done(self, attr: str, fut: Future) -> None:
+        """1つの解法が終わるたびに呼ばれる（メインスレッド）"""
+        try:
+            setattr(self, attr, fut.result())
+        except Exception as e:
+            messagebox.showerror("エラー", f"計算に失敗しました: {e}")
 
-        threading.Thread(target=worker, daemon=True).start()
+        self.pending -= 1
+        self.display_results()
+        self.draw_gantt_chart_safe()
+        if self.pending == 0:
+            self.optimize_btn.config(state=tk.NORMAL)
 
     # -------------------------
     # Display
     # -------------------------
+    def optimal_label(self) -> str:
+        if self.res_bruteforce is not None and self.res_bruteforce.lower_bound is not None:
+            return "最適（下界と一致）"
+        return "最適（総当たり）"
+
     def display_results(self) -> None:
         self.result_text.delete(1.0, tk.END)
 
-        if not (self.res_edf and self.res_spt and self.res_edf_improved and self.res_bruteforce):
+        if not (self.res_edf or self.res_spt or self.res_edf_improved or self.res_bruteforce):
             self.result_text.insert(tk.END, "結果がありません。\n")
             return
 
@@ -467,14 +710,19 @@ class TaskSchedulerApp:
             ("EDF（締切順）", self.res_edf),
             ("SPT（短い順）", self.res_spt),
             ("EDF+改善（swap）", self.res_edf_improved),
-            ("最適（総当たり）", self.res_bruteforce),
+            (self.optimal_label(), self.res_bruteforce),
         ]
 
+        # 下界との差は、総当たりが終わる前でも「最適から最大どれだけ離れているか」を示す
+        bound = lower_bound_total_delay(self.tasks)
+
         def line_res(name: str, r: ScheduleResult) -> str:
             order = " → ".join(t.name for t in r.order)
+            gap = r.total_delay - bound
+            proof = f"下界: {bound}分（最適を証明）" if gap <= 0 else f"下界: {bound}分（差 最大{gap}分）"
             return (
                 f"[{name}]\n"
-                f"  計算: {r.computation_time*1000:.3f} ms | 候補: {r.candidates:,}\n"
+                f"  計算: {r.computation_time*1000:.3f} ms | 候補: {r.candidates:,} | {proof}\n"
                 f"  Σ遅延: {r.total_delay}分 | 遅延件数: {r.tardy_count} | 最大遅延: {r.max_delay} | 総所要: {r.makespan}\n"
                 f"  順序: {order}\n"
             )
@@ -484,16 +732,24 @@ class TaskSchedulerApp:
         self.result_text.insert(tk.END, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n")
 
         for name, r in rows:
-            self.result_text.insert(tk.END, line_res(name, r))
+            if r is None:
+                self.result_text.insert(tk.END, f"[{name}]\n  ⏳ 計算中...\n")
+            else:
+                self.result_text.insert(tk.END, line_res(name, r))
             self.result_text.insert(tk.END, "\n")
 
+        if self.res_bruteforce is None:
+            return
+
         # Comparison with optimal
         opt = self.res_bruteforce.total_delay
         self.result_text.insert(tk.END, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
-        self.result_text.insert(tk.END, "📊 最適（総当たり）との比較（差分=多いほど悪い）\n")
+        self.result_text.insert(tk.END, f"📊 {self.optimal_label()}との比較（差分=多いほど悪い）\n")
         self.result_text.insert(tk.END, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
 
         for name, r in rows[:-1]:
+            if r is None:
+                continue
             diff = r.total_delay - opt
             if diff == 0:
                 self.result_text.insert(tk.END, f"✅ {name}: 最適と同じ（差分0）\n")
@@ -501,19 +757,19 @@ class TaskSchedulerApp:
                 self.result_text.insert(tk.END, f"⚠️ {name}: 差分 +{diff}分\n")
 
         # Speed overview (vs brute)
+        if self.res_bruteforce.lower_bound is not None:
+            self.result_text.insert(tk.END, "\n⚡ ヒューリスティックの解が下界に届いたので総当たりは省略しました\n")
+            return
         bf_ms = max(self.res_bruteforce.computation_time * 1000, 0.001)
-        edf_ms = max(self.res_edf.computation_time * 1000, 0.001)
-        spt_ms = max(self.res_spt.computation_time * 1000, 0.001)
-        imp_ms = max(self.res_edf_improved.computation_time * 1000, 0.001)
 
         self.result_text.insert(tk.END, "\n⚡ 速度（総当たりを1.0xとした相対）\n")
-        self.result_text.insert(tk.END, f"  EDF: {bf_ms/edf_ms:.1f}x\n")
-        self.result_text.insert(tk.END, f"  SPT: {bf_ms/spt_ms:.1f}x\n")
-        self.result_text.insert(tk.END, f"  EDF+改善: {bf_ms/imp_ms:.1f}x\n")
+        for name, r in (("EDF", self.res_edf), ("SPT", self.res_spt), ("EDF+改善", self.res_edf_improved)):
+            if r is not None:
+                self.result_text.insert(tk.END, f"  {name}: {bf_ms / max(r.computation_time * 1000, 0.001):.1f}x\n")
 
     def draw_gantt_chart_safe(self) -> None:
-        # results not ready
-        if not self.res_bruteforce:
+        # results not ready（終わった解法から順に描く）
+        if not (self.res_edf or self.res_spt or self.res_edf_improved or self.res_bruteforce):
             return
         self.draw_gantt_chart()
 
@@ -521,7 +777,8 @@ class TaskSchedulerApp:
         """ガントチャートを描画（4本 or 2本）"""
         self.canvas.delete("all")
 
-        if not (self.res_edf and self.res_spt and self.res_edf_improved and self.res_bruteforce):
+        results = [r for r in (self.res_edf, self.res_spt, self.res_edf_improved, self.res_bruteforce) if r]
+        if not results:
             return
 
         canvas_width = self.canvas.winfo_width()
@@ -535,7 +792,7 @@ class TaskSchedulerApp:
         max_time = max(
             sum(t.duration for t in self.tasks),
             max((t.deadline for t in self.tasks), default=0),
-            self.res_bruteforce.makespan
+            max(r.makespan for r in results)
         )
         max_time = max(max_time, 1)
 
@@ -560,19 +817,18 @@ class TaskSchedulerApp:
             ("EDF（締切順）", self.res_edf),
             ("SPT（短い順）", self.res_spt),
             ("EDF+改善（swap）", self.res_edf_improved),
-            ("最適（総当たり）", self.res_bruteforce),
+            (self.optimal_label(), self.res_bruteforce),
         ]
 
         if self.gantt_mode.get() == "2":
             # compare "best heuristic" vs optimal
             # pick the best among EDF/SPT/EDF+improve by delay
-            best_h = min(
-                [("EDF", self.res_edf), ("SPT", self.res_spt), ("EDF+改善", self.res_edf_improved)],
-                key=lambda x: x[1].total_delay
-            )
+            heuristics = [(name, r) for name, r in
+                          [("EDF", self.res_edf), ("SPT", self.res_spt), ("EDF+改善", self.res_edf_improved)] if r]
+            best_h = min(heuristics, key=lambda x: x[1].total_delay) if heuristics else ("", None)
             rows = [
                 (f"{best_h[0]}（ヒューリ）", best_h[1]),
-                ("最適（総当たり）", self.res_bruteforce),
+                (self.optimal_label(), self.res_bruteforce),
             ]
         else:
             rows = rows_all
@@ -581,6 +837,14 @@ class TaskSchedulerApp:
         for row_idx, (label, result) in enumerate(rows):
             y = margin_top + 10 + row_idx * (bar_height + gap + 14)
 
+            # まだ終わっていない解法は行だけ確保しておく（後から来ても行の位置が変わらない）
+            if result is None:
+                self.canvas.create_text(
+                    margin_left - 10, y + bar_height // 2,
+                    text=f"{label}\n⏳ 計算中", fill="#888888", anchor=tk.E, font=(self.font_family, 10)
+                )
+                continue
+
             # label
             self.canvas.create_text(
                 margin_left - 10, y + bar_height // 2,
@@ -0,0 +1,364 @@
+"""
+Day 79 / Day 80 スケジューラのベンチマーク（GUIなし）
+- シード付きの乱数でインスタンスを生成（タスク数 n・締切のきつさ・所要時間のばらつきを変える）
+- day79 / day80 のすべての解法 × 目的関数について
+  計算時間・スループット（候補/秒）・メモリピーク（tracemalloc）・最良値との差（品質ギャップ）を記録
+- 基準（baseline）と比べて閾値を超えて悪化したら終了コード 1 を返す
+- 厳密解法がほかの解法（n ≤ 8 なら総当たり）より悪い値を返したら、基準がなくても終了コード 1 を返す
+
+使い方:
+  python benchmark.py                              # 既定の組み合わせで計測して表を表示
+  python benchmark.py --quick --save-baseline benchmark_baseline.json
+  python benchmark.py --quick --baseline benchmark_baseline.json --threshold 1.5
+  python benchmark.py -n 10,50 --tightness 0.4 --spread 10,100 --output result.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import types
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from scheduler_core import (
+    BNB_MAX_TASKS, DP_MAX_TASKS, LAWLER_MAX_TASKS, POLYNOMIAL_OBJECTIVES,
+    ObjectiveType, Task, TaskTable,
+    run_branch_and_bound, run_brute_force, run_decomposition, run_edf, run_edf_improve, run_exact_dp,
+    run_genetic, run_metaheuristic, run_parallel_exact, run_pareto, run_polynomial, run_spt,
+)
+
+DAY79_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "day79-optimized-task-scheduler")
+
+ALL_OBJECTIVES = tuple(ObjectiveType)
+MIN_REGRESSION_MS = 1.0  # これより速い計測は誤差が大きいので時間の悪化判定から外す
+
+
+# -----------------------------
+# Instance Generator
+# -----------------------------
+@dataclass(frozen=True)
+class InstanceSpec:
+    """
+    インスタンスの条件（Potts & Van Wassenhove 型の生成法）
+    - tightness: 締切のきつさ（0〜1、大きいほど締切が早い = tardiness factor）
+    - due_range: 締切のばらつき（0〜1、relative range of due dates）
+    - spread: 所要時間の上限（所要時間は 1〜spread の一様乱数）
+    """
+    n: int
+    tightness: float
+    due_range: float
+    spread: int
+    seed: int
+
+    @property
+    def key(self) -> str:
+        return f"n{self.n}-tf{self.tightness}-rdd{self.due_range}-p{self.spread}-s{self.seed}"
+
+
+def generate_instance(spec: InstanceSpec) -> List[Task]:
+    """spec に従ってタスクを生成（同じ spec なら同じタスク列）"""
+    rng = random.Random(f"{spec.seed}:{spec.n}:{spec.tightness}:{spec.due_range}:{spec.spread}")
+    durations = [rng.randint(1, spec.spread) for _ in range(spec.n)]
+    total = sum(durations)
+    lo = total * (1 - spec.tightness - spec.due_range / 2)
+    hi = total * (1 - spec.tightness + spec.due_range / 2)
+    tasks = []
+    for i, p in enumerate(durations):
+        deadline = max(1, round(rng.uniform(lo, hi)))
+        tasks.append(Task(f"T{i + 1}", p, deadline))
+    return tasks
+
+
+# -----------------------------
+# Algorithms
+# -----------------------------
+@dataclass(frozen=True)
+class Algorithm:
+    """計測対象の解法（run は (目的関数値, 候補数) を返す）"""
+    suite: str
+    name: str
+    run: Callable[[List[Task], ObjectiveType], Tuple[int, int]]
+    max_n: int
+    objectives: Tuple[ObjectiveType, ...] = ALL_OBJECTIVES
+    budgeted: bool = False  # 計算時間で打ち切る解法（時間ではなくスループットで比べる）
+    exact: bool = False     # 最適値を返すはずの解法（品質ギャップが 0 でなければ誤り）
+
+
+def _day80(solver: Callable, **kwargs) -> Callable[[List[Task], ObjectiveType], Tuple[int, int]]:
+    def run(tasks: List[Task], obj_type: ObjectiveType) -> Tuple[int, int]:
+        result = solver(TaskTable.from_tasks(tasks), obj_type, **kwargs)
+        return result.obj_value, result.candidates
+    return run
+
+
+def _pareto(tasks: List[Task], obj_type: ObjectiveType) -> Tuple[int, int]:
+    """パレートフロントから取り出した obj_type の最適値"""
+    front = run_pareto(TaskTable.from_tasks(tasks))
+    return front.optima[obj_type].obj_value, front.candidates
+
+
+def _day79(method_name: str, module) -> Callable[[List[Task], ObjectiveType], Tuple[int, int]]:
+    """day79 の解法は App のメソッドなので、tasks だけを持つ代役を self にして呼ぶ"""
+    method = getattr(module.TaskSchedulerApp, method_name)
+
+    def run(tasks: List[Task], obj_type: ObjectiveType) -> Tuple[int, int]:
+        app = types.SimpleNamespace(tasks=[module.Task(t.name, t.duration, t.deadline) for t in tasks])
+        result = method(app)
+        return result.total_delay, result.candidates
+    return run
+
+
+def load_day79():
+    """day79 のモジュールを読み込む（tkinter がない環境では None）"""
+    if DAY79_DIR not in sys.path:
+        sys.path.insert(0, DAY79_DIR)
+    try:
+        import task_scheduler as day79  # day80 の task_scheduler.py はここでは import しない
+    except ImportError as e:
+        print(f"day79 をスキップします: {e}", file=sys.stderr)
+        return None
+    return day79
+
+
+def build_algorithms(time_budget: float, include_day79: bool = True) -> List[Algorithm]:
+    algorithms = [
+        Algorithm("day80", "edf", _day80(run_edf), 100_000),
+        Algorithm("day80", "spt", _day80(run_spt), 100_000),
+        Algorithm("day80", "edf_swap", _day80(run_edf_improve), 1000),
+        Algorithm("day80", "polynomial", _day80(run_polynomial), 100_000, POLYNOMIAL_OBJECTIVES, exact=True),
+        Algorithm("day80", "exact_dp", _day80(run_exact_dp), min(DP_MAX_TASKS, 16), exact=True),
+        Algorithm("day80", "branch_and_bound", _day80(run_branch_and_bound), min(BNB_MAX_TASKS, 20), exact=True),
+        Algorithm("day80", "decomposition", _day80(run_decomposition), LAWLER_MAX_TASKS,
+                  (ObjectiveType.TOTAL_TARDINESS,), exact=True),
+        Algorithm("day80", "parallel_exact", _day80(run_parallel_exact), 10, exact=True),
+        Algorithm("day80", "brute_force", _day80(run_brute_force), 8, exact=True),
+        Algorithm("day80", "pareto", _pareto, 8, exact=True),
+        Algorithm("day80", "anneal", _day80(run_metaheuristic, method="anneal", time_budget=time_budget, seed=1),
+                  100_000, budgeted=True),
+        Algorithm("day80", "tabu", _day80(run_metaheuristic, method="tabu", time_budget=time_budget, seed=1),
+                  100_000, budgeted=True),
+        Algorithm("day80", "genetic", _day80(run_genetic, time_budget=time_budget, seed=1), 100_000, budgeted=True),
+    ]
+    day79 = load_day79() if include_day79 else None
+    if day79 is not None:
+        tardiness = (ObjectiveType.TOTAL_TARDINESS,)
+        algorithms += [
+            Algorithm("day79", "edf", _day79("heuristic_edf", day79), 100_000, tardiness),
+            Algorithm("day79", "spt", _day79("heuristic_spt", day79), 100_000, tardiness),
+            Algorithm("day79", "edf_swap", _day79("heuristic_edf_improve", day79), 50, tardiness),
+            Algorithm("day79", "brute_force", _day79("brute_force_optimize", day79), 8, tardiness, exact=True),
+            Algorithm("day79", "parallel_brute_force", _day79("parallel_brute_force_optimize", day79), 10,
+                      tardiness, exact=True),
+        ]
+    return algorithms
+
+
+# -----------------------------
+# Measurement
+# -----------------------------
+@dataclass
+class Measurement:
+    suite: str
+    algorithm: str
+    objective: str
+    instance: str
+    n: int
+    time_ms: float          # repeat 回の中央値
+    throughput: float       # 候補/秒
+    peak_kb: Optional[float]
+    value: int
+    budgeted: bool = False
+    gap: float = 0.0        # (値 - 最良値) / max(最良値, 1)
+    exact: bool = False
+
+    @property
+    def key(self) -> str:
+        return f"{self.suite}/{self.algorithm}/{self.objective}/{self.instance}"
+
+
+def measure(algo: Algorithm, tasks: List[Task], obj_type: ObjectiveType, repeat: int,
+            track_memory: bool) -> Tuple[float, float, Optional[float], int]:
+    """返り値: (時間の中央値[ms], 候補/秒, メモリピーク[KB] or None, 目的関数値)"""
+    times = []
+    value = candidates = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value, candidates = algo.run(tasks, obj_type)
+        times.append(time.perf_counter() - start)
+    elapsed = statistics.median(times)
+
+    peak_kb = None
+    if track_memory:
+        # tracemalloc は遅くなるので、時間とは別にもう1回だけ実行して測る
+        tracemalloc.start()
+        try:
+            algo.run(tasks, obj_type)
+            peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    throughput = candidates / elapsed if elapsed > 0 else 0.0
+    return elapsed * 1000, throughput, peak_kb, value
+
+
+def run_suite(specs: Sequence[InstanceSpec], algorithms: Sequence[Algorithm],
+              objectives: Sequence[ObjectiveType], repeat: int = 3, track_memory: bool = True,
+              progress: Optional[Callable[[Measurement], None]] = None) -> List[Measurement]:
+    results: List[Measurement] = []
+    for spec in specs:
+        tasks = generate_instance(spec)
+        for obj_type in objectives:
+            group: List[Measurement] = []
+            for algo in algorithms:
+                if spec.n > algo.max_n or obj_type not in algo.objectives:
+                    continue
+                ms, throughput, peak_kb, value = measure(algo, tasks, obj_type, repeat, track_memory)
+                group.append(Measurement(algo.suite, algo.name, obj_type.value, spec.key, spec.n,
+                                         round(ms, 3), round(throughput, 1),
+                                         None if peak_kb is None else round(peak_kb, 1), value,
+                                         algo.budgeted, exact=algo.exact))
+            # 品質ギャップは同じインスタンス・目的関数で得られた最良値（厳密解があればそれ）との差
+            if group:
+                best = min(m.value for m in group)
+                for m in group:
+                    m.gap = round((m.value - best) / max(best, 1), 6)
+                    results.append(m)
+                    if progress is not None:
+                        progress(m)
+    return results
+
+
+# -----------------------------
+# Regression Check
+# -----------------------------
+def compare(results: Sequence[Measurement], baseline: Dict[str, Dict], threshold: float,
+            gap_tolerance: float) -> List[str]:
+    """
+    基準と比べて悪化したものを文字列で返す。
+    時間（計算時間で打ち切る解法はスループット）が threshold 倍を超えて悪化したもの、
+    品質ギャップが gap_tolerance を超えて増えたものが対象。
+    """
+    problems = []
+    for m in results:
+        base = baseline.get(m.key)
+        if base is None:
+            continue
+        if m.budgeted:
+            if m.throughput * threshold < base["throughput"]:
+                problems.append(f"{m.key}: スループット {base['throughput']:,.0f} → {m.throughput:,.0f} 候補/秒")
+        elif m.time_ms > MIN_REGRESSION_MS and m.time_ms > base["time_ms"] * threshold:
+            problems.append(f"{m.key}: 時間 {base['time_ms']:.3f}ms → {m.time_ms:.3f}ms "
+                            f"(×{m.time_ms / max(base['time_ms'], 1e-9):.2f})")
+        if m.gap > base["gap"] + gap_tolerance:
+            problems.append(f"{m.key}: 品質ギャップ {base['gap']:.4f} → {m.gap:.4f}")
+    return problems
+
+
+def check_exact(results: Sequence[Measurement]) -> List[str]:
+    """
+    厳密解法なのに、同じインスタンス・目的関数でほかの解法より悪い値を返したものを文字列で返す。
+    n ≤ 8 なら総当たり（全順列）も同じ組にいるので、全順列の最適値と比べたことになる。基準は要らない。
+    """
+    return [f"{m.key}: 厳密解法の値 {m.value} が最良値より悪い（品質ギャップ {m.gap:.4f}）"
+            for m in results if m.exact and m.gap > 0]
+
+
+def load_baseline(path: str) -> Dict[str, Dict]:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {f"{r['suite']}/{r['algorithm']}/{r['objective']}/{r['instance']}": r for r in data["results"]}
+
+
+def save_results(path: str, results: Sequence[Measurement], meta: Dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": [asdict(m) for m in results]}, f, ensure_ascii=False, indent=1)
+
+
+# -----------------------------
+# Main
+# -----------------------------
+def _floats(value: str) -> List[float]:
+    return [float(v) for v in value.split(",") if v.strip()]
+
+
+def _ints(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def format_row(m: Measurement) -> str:
+    peak = "-" if m.peak_kb is None else f"{m.peak_kb:,.0f}"
+    return (f"{m.suite:<6}{m.algorithm:<22}{m.objective:<18}{m.instance:<32}"
+            f"{m.time_ms:>11.3f}{m.throughput:>14,.0f}{peak:>10}{m.value:>10}{m.gap:>9.4f}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="day79 / day80 スケジューラのベンチマーク")
+    parser.add_argument("-n", "--sizes", type=_ints, default=[8, 12, 16, 40, 200], help="タスク数（カンマ区切り）")
+    parser.add_argument("--tightness", type=_floats, default=[0.2, 0.6], help="締切のきつさ（0〜1）")
+    parser.add_argument("--due-range", type=_floats, default=[0.6], help="締切のばらつき（0〜1）")
+    parser.add_argument("--spread", type=_ints, default=[10, 100], help="所要時間の上限")
+    parser.add_argument("--seeds", type=_ints, default=[1], help="乱数シード")
+    parser.add_argument("-o", "--objectives", default="all", help="目的関数（カンマ区切り or all）")
+    parser.add_argument("-a", "--algorithms", default="all", help="解法名（カンマ区切り or all）")
+    parser.add_argument("--repeat", type=int, default=3, help="同じ計測の繰り返し回数（中央値を使う）")
+    parser.add_argument("--time-budget", type=float, default=0.05, help="焼きなまし / タブー探索の計算時間（秒）")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc によるメモリ計測をしない")
+    parser.add_argument("--no-day79", action="store_true", help="day79 の解法を計測しない")
+    parser.add_argument("--quick", action="store_true", help="小さい組み合わせだけ計測（n=8,40 / 各1条件）")
+    parser.add_argument("--output", help="結果を JSON で保存")
+    parser.add_argument("--save-baseline", help="結果を基準として保存")
+    parser.add_argument("--baseline", help="比べる基準の JSON")
+    parser.add_argument("--threshold", type=float, default=1.5, help="時間がこの倍率を超えたら悪化とみなす")
+    parser.add_argument("--gap-tolerance", type=float, default=0.01, help="品質ギャップの許容増分")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.sizes, args.tightness, args.due_range, args.spread = [8, 40], [0.4], [0.6], [20]
+    objectives = list(ALL_OBJECTIVES) if args.objectives == "all" else \
+        [ObjectiveType(v.strip()) for v in args.objectives.split(",")]
+    algorithms = build_algorithms(args.time_budget, include_day79=not args.no_day79)
+    if args.algorithms != "all":
+        wanted = {v.strip() for v in args.algorithms.split(",")}
+        algorithms = [a for a in algorithms if a.name in wanted or f"{a.suite}/{a.name}" in wanted]
+
+    specs = [InstanceSpec(n, tf, rdd, p, seed)
+             for n in args.sizes for tf in args.tightness for rdd in args.due_range
+             for p in args.spread for seed in args.seeds]
+
+    print(f"{'suite':<6}{'algorithm':<22}{'objective':<18}{'instance':<32}"
+          f"{'time[ms]':>11}{'cands/s':>14}{'peak[KB]':>10}{'value':>10}{'gap':>9}")
+    results = run_suite(specs, algorithms, objectives, repeat=args.repeat, track_memory=not args.no_memory,
+                        progress=lambda m: print(format_row(m), flush=True))
+
+    meta = {"python": sys.version.split()[0], "cpus": os.cpu_count(), "argv": list(argv or sys.argv[1:])}
+    if args.output:
+        save_results(args.output, results, meta)
+    if args.save_baseline:
+        save_results(args.save_baseline, results, meta)
+        print(f"基準を保存しました: {args.save_baseline}")
+
+    problems = check_exact(results)
+    if problems:
+        print(f"\n❌ 厳密解法が最適値を返しませんでした（{len(problems)}件）:")
+        for p in problems:
+            print("  " + p)
+    if args.baseline:
+        regressions = compare(results, load_baseline(args.baseline), args.threshold, args.gap_tolerance)
+        if regressions:
+            print(f"\n❌ 基準より悪化しました（{len(regressions)}件）:")
+            for p in regressions:
+                print("  " + p)
+            return 1
+        print("\n✅ 基準からの悪化はありません")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+"""
+Day 80: ガントチャートの描画（tkinter.Canvas）
+- 見えている時間範囲のタスクだけ図形を置く（ホイールで拡大縮小、ドラッグで移動、ダブルクリックで全体）
+- 図形は毎回作り直さず、前回の ID の座標と色を変えて使い回す（余った図形は隠す）
+- 1ピクセルに満たないタスクは、続くものをまとめて1つの帯にする
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import tkinter as tk
+from typing import List, Optional, Sequence, Tuple
+
+TASK_COLORS = ("#e94560", "#00d9ff", "#f39c12", "#2ecc71", "#9b59b6", "#1abc9c", "#ff9ff3", "#48dbfb")
+LATE_COLOR = "#ff6b6b"
+BLOCK_COLOR = "#8395a7"       # まとめたタスクの帯（全部間に合う）
+BLOCK_LATE_COLOR = "#c0392b"  # まとめたタスクの帯（遅延を含む）
+
+MIN_TASK_PX = 1.0   # これより細いタスクはまとめて描く
+BLOCK_PX = 4.0      # まとめた帯がこの幅に達したら区切る（遅延のある場所が分かるように）
+LABEL_MIN_PX = 35   # タスク名と遅延を書く最小の幅
+ZOOM_STEP = 1.25    # ホイール1段の拡大率
+MIN_SPAN = 5        # 拡大の限界（画面に映す時間幅、分）
+
+# (タスク, 開始, 終了, 遅延) の列（ScheduleResult.schedule）
+Schedule = Sequence[Tuple[object, int, int, int]]
+
+
+class _ItemPool:
+    """同じ種類の図形を使い回す（足りなければ作り、使わなかった分は隠す）。図形には tag を付ける"""
+
+    def __init__(self, canvas: tk.Canvas, kind: str, tag: str, **options):
+        self.canvas = canvas
+        self.create = getattr(canvas, f"create_{kind}")
+        self.options = dict(options, tags=tag)
+        self.items: List[int] = []
+        self.used = 0
+        self.shown = 0  # 前回の描画で表示していた数（これより後ろは隠れている）
+        self.created = False  # 今回の描画で新しく作ったか（重なり順を直す必要があるか）
+
+    def begin(self) -> None:
+        self.used = 0
+        self.created = False
+
+    def place(self, *coords: float, **config) -> int:
+        if self.used < len(self.items):
+            item = self.items[self.used]
+            self.canvas.coords(item, *coords)
+            if self.used >= self.shown:
+                config["state"] = tk.NORMAL
+            self.canvas.itemconfigure(item, **config)
+        else:
+            item = self.create(*coords, **self.options, **config)
+            self.items.append(item)
+            self.created = True
+        self.used += 1
+        return item
+
+    def end(self) -> None:
+        for item in self.items[self.used:self.shown]:
+            self.canvas.itemconfigure(item, state=tk.HIDDEN)
+        self.shown = self.used
+
+
+def _nice_step(raw: float) -> int:
+    """目盛りの間隔（1, 2, 5 × 10^k 分のうち raw 以上で最小のもの）"""
+    if raw <= 1:
+        return 1
+    magnitude = 10 ** int(math.floor(math.log10(raw)))
+    for m in (1, 2, 5, 10):
+        if raw <= m * magnitude:
+            return m * magnitude
+    return 10 * magnitude
+
+
+class GanttCanvas:
+    """
+    複数の行（解法ごとのスケジュール）を同じ時間軸で描くガントチャート。
+    show() でデータを渡し、表示範囲の変更やウィンドウの大きさの変更では render() だけをやり直す。
+    """
+
+    margin_left = 180
+    margin_right = 20
+    margin_top = 30
+    bar_height = 30
+    row_gap = 26  # 行の間（遅延の文字を書く分を含む）
+
+    def __init__(self, canvas: tk.Canvas, font_family: str):
+        self.canvas = canvas
+        self.font_family = font_family
+
+        self.title = ""
+        self.rows: List[Tuple[str, Schedule, List[int], List[int]]] = []  # (見出し, 予定, 開始時刻, 終了時刻)
+        self.deadlines: List[int] = []  # 重複なし・昇順
+        self.horizon = 1
+        self.view_start = 0.0
+        self.view_end = 1.0
+
+        # 辞書の順が重なり順（後ろほど上）
+        self.pools = {
+            "title": _ItemPool(canvas, "text", "title", fill="white", font=(font_family, 11, "bold")),
+            "row_label": _ItemPool(canvas, "text", "row_label", fill="white", anchor=tk.E,
+                                   font=(font_family, 10)),
+            "bar": _ItemPool(canvas, "rectangle", "bar"),
+            "bar_label": _ItemPool(canvas, "text", "bar_label", fill="white", font=(font_family, 9, "bold")),
+            "delay_label": _ItemPool(canvas, "text", "delay_label", fill=LATE_COLOR, font=(font_family, 8)),
+            "deadline": _ItemPool(canvas, "line", "deadline", fill=LATE_COLOR, dash=(3, 3), width=1),
+            "axis": _ItemPool(canvas, "line", "axis", fill="white", width=2),
+            "tick": _ItemPool(canvas, "line", "tick", fill="white", width=1),
+            "tick_label": _ItemPool(canvas, "text", "tick_label", fill="white", font=(font_family, 9)),
+        }
+
+        self._render_pending: Optional[str] = None
+        self._drag: Optional[Tuple[int, float]] = None  # (押したときの x, そのときの view_start)
+
+        canvas.bind("<Configure>", lambda _e: self.request_render())
+        canvas.bind("<MouseWheel>", lambda e: self.zoom(e.x, e.delta > 0))
+        canvas.bind("<Button-4>", lambda e: self.zoom(e.x, True))
+        canvas.bind("<Button-5>", lambda e: self.zoom(e.x, False))
+        canvas.bind("<ButtonPress-1>", self._on_press)
+        canvas.bind("<B1-Motion>", self._on_drag)
+        canvas.bind("<Double-Button-1>", lambda _e: self.reset_view())
+
+    # -------------------------
+    # Data / view
+    # -------------------------
+    def show(self, title: str, rows: Sequence[Tuple[str, Schedule]], deadlines: Sequence[int],
+             horizon: int) -> None:
+        """行（見出し, 予定）を描く。時間軸の長さが変わったときだけ表示範囲を全体に戻す"""
+        self.title = title
+        self.rows = []
+        for label, schedule in rows:
+            schedule = list(schedule)
+            self.rows.append((label, schedule, [s[1] for s in schedule], [s[2] for s in schedule]))
+        self.deadlines = sorted(set(deadlines))
+        horizon = max(horizon, 1)
+        if horizon != self.horizon:
+            self.horizon = horizon
+            self.view_start, self.view_end = 0.0, float(horizon)
+        self.render()
+
+    def clear(self) -> None:
+        self.title = ""
+        self.rows = []
+        self.deadlines = []
+        self.render()
+
+    def reset_view(self) -> None:
+        self.view_start, self.view_end = 0.0, float(self.horizon)
+        self.request_render()
+
+    def zoom(self, x: int, zoom_in: bool) -> None:
+        """x（ピクセル）の位置の時刻を動かさずに拡大・縮小する"""
+        span = self.view_end - self.view_start
+        chart_width = max(self._width() - self.margin_left - self.margin_right, 1)
+        ratio = min(max((x - self.margin_left) / chart_width, 0.0), 1.0)
+        center = self.view_start + ratio * span
+        new_span = span / ZOOM_STEP if zoom_in else span * ZOOM_STEP
+        new_span = min(max(new_span, min(MIN_SPAN, self.horizon)), self.horizon)
+        self._set_view(center - ratio * new_span, new_span)
+
+    def _on_press(self, event) -> None:
+        self._drag = (event.x, self.view_start)
+
+    def _on_drag(self, event) -> None:
+        if self._drag is None:
+            return
+        x0, start0 = self._drag
+        span = self.view_end - self.view_start
+        scale = max(self._width() - self.margin_left - self.margin_right, 1) / span
+        self._set_view(start0 - (event.x - x0) / scale, span)
+
+    def _set_view(self, start: float, span: float) -> None:
+        start = min(max(start, 0.0), self.horizon - span)
+        if (start, start + span) != (self.view_start, self.view_end):
+            self.view_start, self.view_end = start, start + span
+            self.request_render()
+
+    def request_render(self) -> None:
+        """イベントが続けて来ても、描画はアイドル時に1回だけ"""
+        if self._render_pending is None:
+            self._render_pending = self.canvas.after_idle(self.render)
+
+    # -------------------------
+    # Drawing
+    # -------------------------
+    def _width(self) -> int:
+        width = self.canvas.winfo_width()
+        return width if width >= 200 else 1100
+
+    def render(self) -> None:
+        if self._render_pending is not None:
+            self.canvas.after_cancel(self._render_pending)
+            self._render_pending = None
+        for pool in self.pools.values():
+            pool.begin()
+        if self.rows:
+            self._draw()
+        for pool in self.pools.values():
+            pool.end()
+        if any(pool.created for pool in self.pools.values()):
+            # 新しく作った図形は一番上に来るので、種類ごとの重なり順に戻す
+            for tag in self.pools:
+                self.canvas.tag_raise(tag)
+
+    def _draw(self) -> None:
+        pools = self.pools
+        canvas_width = self._width()
+        canvas_height = self.canvas.winfo_height()
+        if canvas_height < 200:
+            canvas_height = 260
+
+        left = self.margin_left
+        right = canvas_width - self.margin_right
+        start, end = self.view_start, self.view_end
+        scale = (right - left) / (end - start)
+        bar_height = self.bar_height
+
+        def to_x(t: float) -> float:
+            return left + (t - start) * scale
+
+        title = self.title
+        if (start, end) != (0.0, float(self.horizon)):
+            title += f"  [{start:.0f}〜{end:.0f}分 / ダブルクリックで全体]"
+        pools["title"].place(canvas_width // 2, 15, text=title)
+
+        row_top = self.margin_top + 10
+        for row_idx, (label, schedule, starts, ends) in enumerate(self.rows):
+            y = row_top + row_idx * (bar_height + self.row_gap)
+            pools["row_label"].place(left - 10, y + bar_height // 2, text=label)
+            self._draw_row(schedule, starts, ends, y, to_x, left, right)
+
+        # 締切線は全行を貫く1本にし、同じピクセルに重なる締切は1本にまとめる
+        if self.deadlines:
+            lo = bisect.bisect_left(self.deadlines, start)
+            hi = bisect.bisect_right(self.deadlines, end)
+            y0 = row_top - 5
+            y1 = row_top + (len(self.rows) - 1) * (bar_height + self.row_gap) + bar_height + 5
+            last_px = None
+            for deadline in self.deadlines[lo:hi]:
+                px = int(to_x(deadline))
+                if px != last_px:
+                    pools["deadline"].place(px, y0, px, y1)
+                    last_px = px
+
+        axis_y = row_top + len(self.rows) * (bar_height + self.row_gap) + 10
+        axis_y = min(axis_y, canvas_height - 35)
+        pools["axis"].place(left, axis_y, right, axis_y)
+        step = _nice_step((end - start) / 10)
+        t = math.ceil(start / step) * step
+        while t <= end:
+            x = to_x(t)
+            pools["tick"].place(x, axis_y - 5, x, axis_y + 5)
+            pools["tick_label"].place(x, axis_y + 15, text=f"{t}分")
+            t += step
+
+    def _draw_row(self, schedule: Schedule, starts: List[int], ends: List[int], y: float,
+                  to_x, left: float, right: float) -> None:
+        """1行分の棒（見えている範囲のタスクだけ）"""
+        pools = self.pools
+        bar_height = self.bar_height
+        lo = bisect.bisect_right(ends, self.view_start)
+        hi = bisect.bisect_left(starts, self.view_end)
+
+        block: Optional[List] = None  # [x0, x1, 遅延を含むか]
+
+        def flush() -> None:
+            nonlocal block
+            if block is not None:
+                x0, x1, late = block
+                pools["bar"].place(x0, y, max(x1, x0 + 1), y + bar_height,
+                                   fill=BLOCK_LATE_COLOR if late else BLOCK_COLOR, outline="")
+                block = None
+
+        for i in range(lo, hi):
+            task, start, end, delay = schedule[i]
+            x0 = max(to_x(start), left)
+            x1 = min(to_x(end), right)
+            width = x1 - x0
+            if width < MIN_TASK_PX:
+                if block is None:
+                    block = [x0, x1, delay > 0]
+                else:
+                    block[1] = x1
+                    block[2] = block[2] or delay > 0
+                if block[1] - block[0] >= BLOCK_PX:
+                    flush()
+                continue
+            flush()
+            pools["bar"].place(x0, y, x1, y + bar_height, fill=TASK_COLORS[i % len(TASK_COLORS)],
+                               outline="white" if width >= 3 else "")
+            if width > LABEL_MIN_PX:
+                center = (x0 + x1) / 2
+                pools["bar_label"].place(center, y + bar_height / 2, text=task.name[:8])
+                if delay > 0:
+                    pools["delay_label"].place(center, y + bar_height + 10, text=f"⚠️{delay}分遅延")
+        flush()
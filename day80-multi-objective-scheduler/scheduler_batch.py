@@ -0,0 +1,283 @@
+"""
+Day 80: たくさんの小さなインスタンスをまとめて解く（バッチ版）
+- ディレクトリ内の JSON / CSV ファイル、または JSON Lines（1行1インスタンス）を読む
+- インスタンスを chunk ごとにプロセスプールへ渡し、解けたものから JSON Lines で出力する
+  （--unordered なら終わった順、既定は入力の順）
+- 最後に件数と1秒あたりのインスタンス数を標準エラーに出す
+
+使い方:
+  python scheduler_batch.py instances/ -a edf_swap,exact -o total_tardiness
+  python scheduler_batch.py teams.jsonl --workers 8 --chunk-size 32 --unordered
+  cat teams.jsonl | python scheduler_batch.py - --no-order
+
+JSON Lines の1行: [{"name": "A", "duration": 3, "deadline": 5}, ...] または {"name": "team1", "tasks": [...]}
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from scheduler_cli import ALGORITHM_NAMES, error_record, parse_choices, result_record, solve_each
+from scheduler_core import (
+    METAHEURISTIC_BUDGET, ObjectiveType, ScheduleResult, TaskTable, read_task_table, table_from_records,
+)
+
+BATCH_CHUNK_SIZE = 16  # 1回にワーカーへ渡すインスタンス数（小さいインスタンスほど大きくすると速い）
+BATCH_ALGORITHMS = tuple(a for a in ALGORITHM_NAMES if a != "portfolio")  # portfolio は自前でプロセスを使う
+INSTANCE_SUFFIXES = (".json", ".csv")
+
+# (名前, 形式, テキスト): 形式は "json" / "csv" / "jsonl"（jsonl はテキストが1行）
+InstanceSource = Tuple[str, str, str]
+
+
+@dataclass
+class BatchResult:
+    """1インスタンスの結果（results と errors のキーは (解法, 目的関数)）"""
+    index: int  # 入力での順番（0 から）
+    name: str
+    table: Optional[TaskTable] = None  # 読み込めなかったら None（error に理由）
+    results: Dict[Tuple[str, ObjectiveType], ScheduleResult] = field(default_factory=dict)
+    errors: Dict[Tuple[str, ObjectiveType], str] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchStats:
+    """バッチ全体の件数と時間"""
+    instances: int = 0
+    failed: int = 0  # 読み込めなかったインスタンス
+    elapsed: float = 0.0
+
+    @property
+    def instances_per_second(self) -> float:
+        return self.instances / self.elapsed if self.elapsed > 0 else 0.0
+
+
+# -----------------------------
+# Input
+# -----------------------------
+def iter_directory(path: str) -> Iterator[InstanceSource]:
+    """ディレクトリ内の JSON / CSV ファイル（名前順）を1つずつ読む"""
+    for entry in sorted(os.listdir(path)):
+        root, ext = os.path.splitext(entry)
+        if ext.lower() not in INSTANCE_SUFFIXES:
+            continue
+        with open(os.path.join(path, entry), encoding="utf-8-sig", newline="") as f:
+            yield root, ext[1:].lower(), f.read()
+
+
+def iter_jsonl(stream: TextIO) -> Iterator[InstanceSource]:
+    """JSON Lines を1行ずつ返す（空行は飛ばす。名前は行に "name" がなければ行番号）"""
+    for line_no, line in enumerate(stream, 1):
+        if line.strip():
+            yield f"line{line_no}", "jsonl", line
+
+
+def iter_instances(path: str) -> Iterator[InstanceSource]:
+    """path がディレクトリならその中のファイル、"-" なら標準入力、それ以外は JSON Lines のファイル"""
+    if path == "-":
+        yield from iter_jsonl(sys.stdin)
+    elif os.path.isdir(path):
+        yield from iter_directory(path)
+    else:
+        with open(path, encoding="utf-8-sig") as f:
+            yield from iter_jsonl(f)
+
+
+def load_instance(name: str, fmt: str, text: str) -> Tuple[str, TaskTable]:
+    """テキストを (名前, TaskTable) にする（不正なら ValueError）"""
+    if fmt != "jsonl":
+        return name, read_task_table(io.StringIO(text), fmt)
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"JSON として読めません: {e}") from e
+    if isinstance(data, dict):
+        return str(data.get("name") or name), table_from_records(data.get("tasks"))
+    return name, table_from_records(data)
+
+
+# -----------------------------
+# Solve
+# -----------------------------
+def solve_instance(index: int, source: InstanceSource, algorithms: Sequence[str],
+                   objectives: Sequence[ObjectiveType], time_budget: float = METAHEURISTIC_BUDGET,
+                   seed: Optional[int] = None) -> BatchResult:
+    """1インスタンスを読み込んで、解法 × 目的関数ごとに解く"""
+    name, fmt, text = source
+    try:
+        name, table = load_instance(name, fmt, text)
+    except ValueError as e:
+        return BatchResult(index, name, error=str(e))
+    item = BatchResult(index, name, table)
+    for algorithm, obj_type, result in solve_each(table, algorithms, objectives, time_budget, seed):
+        if isinstance(result, str):
+            item.errors[algorithm, obj_type] = result
+        else:
+            item.results[algorithm, obj_type] = result
+    return item
+
+
+def _solve_chunk(start: int, sources: List[InstanceSource], algorithms: Sequence[str],
+                 objective_values: Sequence[str], time_budget: float,
+                 seed: Optional[int]) -> List[BatchResult]:
+    """ワーカープロセスで chunk 内のインスタンスを順に解く（目的関数は値の文字列で受け取る）"""
+    objectives = [ObjectiveType(v) for v in objective_values]
+    items = []
+    for k, source in enumerate(sources):
+        try:
+            items.append(solve_instance(start + k, source, algorithms, objectives, time_budget, seed))
+        except Exception as e:  # 1件の想定外の失敗で chunk 全体（とバッチ）を止めない
+            items.append(BatchResult(start + k, source[0], error=f"{type(e).__name__}: {e}"))
+    return items
+
+
+def _chunks(sources: Iterable[InstanceSource], size: int) -> Iterator[Tuple[int, List[InstanceSource]]]:
+    """(先頭の番号, インスタンスのリスト) を size 個ずつ"""
+    it = iter(sources)
+    start = 0
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def solve_batch(sources: Iterable[InstanceSource], algorithms: Sequence[str],
+                objectives: Sequence[ObjectiveType], time_budget: float = METAHEURISTIC_BUDGET,
+                seed: Optional[int] = None, workers: Optional[int] = None,
+                chunk_size: int = BATCH_CHUNK_SIZE, ordered: bool = True,
+                stats: Optional[BatchStats] = None) -> Iterator[BatchResult]:
+    """
+    インスタンスを chunk_size 個ずつプロセスプールで解き、BatchResult を1件ずつ返す。
+    ordered=True なら入力の順に（先に終わった chunk は手元で待たせる）、False なら終わった順に返す。
+    投入する chunk はワーカー数の2倍までにするので、入力が長いストリームでもメモリは増えない。
+    workers=1 ならプロセスを使わずにこのプロセスで解く。stats を渡すと件数と経過時間を書き込む。
+    """
+    stats = stats if stats is not None else BatchStats()
+    start_time = time.perf_counter()
+    objective_values = [ot.value for ot in objectives]
+
+    def count(items: List[BatchResult]) -> List[BatchResult]:
+        stats.instances += len(items)
+        stats.failed += sum(1 for item in items if item.error is not None)
+        stats.elapsed = time.perf_counter() - start_time
+        return items
+
+    chunks = _chunks(sources, max(1, chunk_size))
+    if workers == 1:
+        for start, chunk in chunks:
+            yield from count(_solve_chunk(start, chunk, algorithms, objective_values, time_budget, seed))
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {}  # future -> chunk の先頭の番号
+        finished: Dict[int, List[BatchResult]] = {}  # ordered のとき、順番待ちの chunk
+        next_start = 0
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < 2 * workers:
+                try:
+                    start, chunk = next(chunks)
+                except StopIteration:
+                    exhausted = True
+                    break
+                fut = pool.submit(_solve_chunk, start, chunk, algorithms, objective_values, time_budget, seed)
+                pending[fut] = start
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                start = pending.pop(fut)
+                items = fut.result()
+                if not ordered:
+                    yield from count(items)
+                else:
+                    finished[start] = items
+            while next_start in finished:
+                items = finished.pop(next_start)
+                next_start += len(items)
+                yield from count(items)
+
+
+def batch_record(item: BatchResult, with_order: bool = True) -> Dict:
+    """1インスタンスの結果を JSON にできる dict にする（解法ごとの中身は scheduler_cli と同じ）"""
+    record: Dict = {"index": item.index, "name": item.name}
+    if item.error is not None or item.table is None:
+        record["error"] = item.error
+        return record
+    record["n"] = len(item.table)
+    records = []
+    for (algorithm, obj_type), result in item.results.items():
+        records.append(result_record(item.table, algorithm, obj_type, result, with_order))
+    for (algorithm, obj_type), error in item.errors.items():
+        records.append(error_record(item.table, algorithm, obj_type, error))
+    record["results"] = records
+    return record
+
+
+# -----------------------------
+# Main
+# -----------------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="作業スケジューラ最適化（バッチ）: 多数のインスタンスを並列に解き、JSON Lines で出力します")
+    parser.add_argument("input", help="JSON / CSV ファイルのディレクトリ、JSON Lines のファイル（- なら標準入力）")
+    parser.add_argument("-a", "--algorithms", default="edf_swap,exact",
+                        help=f"解法（カンマ区切り or all）: {', '.join(BATCH_ALGORITHMS)}")
+    parser.add_argument("-o", "--objectives", default="total_tardiness",
+                        help=f"目的関数（カンマ区切り or all）: {', '.join(ot.value for ot in ObjectiveType)}")
+    parser.add_argument("--workers", type=int, default=None, help="プロセス数（既定: CPU 数、1 ならプロセスを使わない）")
+    parser.add_argument("--chunk-size", type=int, default=BATCH_CHUNK_SIZE, help="1回にワーカーへ渡すインスタンス数")
+    parser.add_argument("--unordered", action="store_true", help="入力の順を待たずに、解けた順に出力する")
+    parser.add_argument("--time-budget", type=float, default=METAHEURISTIC_BUDGET,
+                        help="焼きなまし / タブー探索 / 遺伝的アルゴリズムの計算時間（秒、1インスタンスあたり）")
+    parser.add_argument("--seed", type=int, default=None, help="焼きなまし / タブー探索 / 遺伝的アルゴリズムの乱数シード")
+    parser.add_argument("--no-order", action="store_true", help="順序（タスク名の列）を出力しない")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        algorithms = parse_choices(args.algorithms, BATCH_ALGORITHMS, "解法")
+        objectives = [ObjectiveType(v) for v in
+                      parse_choices(args.objectives, [ot.value for ot in ObjectiveType], "目的関数")]
+        if not (args.input == "-" or os.path.exists(args.input)):
+            raise ValueError(f"入力が見つかりません: {args.input}")
+    except ValueError as e:
+        parser.error(str(e))
+
+    stats = BatchStats()
+    try:
+        for item in solve_batch(iter_instances(args.input), algorithms, objectives, args.time_budget, args.seed,
+                                workers=args.workers, chunk_size=args.chunk_size, ordered=not args.unordered,
+                                stats=stats):
+            sys.stdout.write(json.dumps(batch_record(item, not args.no_order), ensure_ascii=False) + "\n")
+    except OSError as e:
+        parser.error(str(e))
+    sys.stdout.flush()
+    sys.stderr.write(json.dumps({
+        "instances": stats.instances,
+        "failed": stats.failed,
+        "seconds": round(stats.elapsed, 3),
+        "instances_per_second": round(stats.instances_per_second, 1),
+    }) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""
+Day 80: 作業スケジューラ最適化（コマンドライン版）
+- tkinter を import しないので、ディスプレイのないサーバーでも動く
+- タスクを JSON / CSV から読み込み、選んだ解法 × 目的関数の結果を JSON Lines で出力する
+
+使い方:
+  python scheduler_cli.py tasks.json
+  python scheduler_cli.py tasks.csv -a edf,exact -o total_tardiness,tardy_count
+  python scheduler_cli.py tasks.json -a portfolio --time-budget 0.2
+  python scheduler_cli.py big.csv -a genetic --population 60 --generations 500 --time-budget 10
+  cat tasks.json | python scheduler_cli.py - --format json
+  python scheduler_cli.py tasks.json -a edf_swap,anneal --profile   # 段階ごとの時間・収束の記録も出す
+
+入力:
+  JSON: [{"name": "A", "duration": 3, "deadline": 5}, ...] または {"tasks": [...]}
+  CSV : 見出し行 name,duration,deadline
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from scheduler_core import (
+    GA_GENERATIONS, GA_POPULATION, LAWLER_MAX_TASKS, METAHEURISTIC_BUDGET, POLYNOMIAL_OBJECTIVES, PORTFOLIO_SEEDS,
+    SWAP_TIME_BUDGET,
+    ObjectiveType, ScheduleResult, SolutionCache, SolverProfile, TaskTable,
+    objective_lower_bound, read_task_table, run_brute_force, run_edf, run_edf_improve, run_exact, run_genetic,
+    run_metaheuristic, run_portfolio, run_spt,
+)
+
+BRUTE_FORCE_MAX_TASKS = 10  # 総当たりを許すタスク数の上限（10! ≒ 360万通り）
+
+ALGORITHM_NAMES = ("edf", "spt", "edf_swap", "exact", "anneal", "tabu", "genetic", "brute_force", "portfolio")
+TIMED_ALGORITHMS = ("anneal", "tabu", "genetic", "portfolio")  # 結果が計算時間とシードで変わる解法
+
+
+# -----------------------------
+# Input
+# -----------------------------
+def parse_tasks(text: str, fmt: str = "auto") -> TaskTable:
+    """JSON / CSV のテキストを TaskTable にする（fmt="auto" なら先頭の文字で判定）"""
+    return read_task_table(io.StringIO(text), fmt)
+
+
+def parse_choices(value: str, allowed: Sequence[str], label: str) -> List[str]:
+    """カンマ区切りの指定を検証（"all" ならすべて）"""
+    if value == "all":
+        return list(allowed)
+    names = [v.strip() for v in value.split(",") if v.strip()]
+    unknown = [v for v in names if v not in allowed]
+    if unknown:
+        raise ValueError(f"不明な{label}: {', '.join(unknown)}（選べるもの: {', '.join(allowed)}）")
+    return names
+
+
+# -----------------------------
+# Solve
+# -----------------------------
+def solve(table: TaskTable, algorithm: str, obj_type: ObjectiveType,
+          time_budget: float = METAHEURISTIC_BUDGET, seed: Optional[int] = None,
+          parallel: bool = False, profile: Optional[SolverProfile] = None,
+          population: int = GA_POPULATION, generations: int = GA_GENERATIONS) -> ScheduleResult:
+    """
+    解法名で1つの解法を実行する（規模が大きすぎる場合は ValueError）。
+    profile を渡すと結果の profile に計測が付く（portfolio は別プロセスで解くので付かない）。
+    genetic は population 個体 × generations 世代か time_budget 秒の早いほうで打ち切る。
+    """
+    n = len(table)
+    if algorithm == "edf":
+        return run_edf(table, obj_type, profile=profile)
+    if algorithm == "spt":
+        return run_spt(table, obj_type, profile=profile)
+    if algorithm == "edf_swap":
+        return run_edf_improve(table, obj_type, profile=profile)
+    if algorithm == "exact":
+        if obj_type not in POLYNOMIAL_OBJECTIVES and n > LAWLER_MAX_TASKS:
+            raise ValueError(f"厳密解は{LAWLER_MAX_TASKS}タスクまでです（{n}タスク）")
+        seed_result = None
+        if obj_type not in POLYNOMIAL_OBJECTIVES:
+            seed_result = run_edf_improve(table, obj_type, time_budget=SWAP_TIME_BUDGET)
+        return run_exact(table, obj_type, seed=seed_result, parallel=parallel, profile=profile)
+    if algorithm in ("anneal", "tabu"):
+        return run_metaheuristic(table, obj_type, algorithm, time_budget=time_budget, seed=seed, profile=profile)
+    if algorithm == "genetic":
+        return run_genetic(table, obj_type, population_size=population, generations=generations,
+                           time_budget=time_budget, seed=seed, profile=profile)
+    if algorithm == "portfolio":
+        # time_budget を締切として複数の戦略を競わせる（--seed があればそこから連番のシードを使う）
+        seeds = PORTFOLIO_SEEDS if seed is None else tuple(seed + k for k in range(len(PORTFOLIO_SEEDS)))
+        return run_portfolio(table, obj_type, deadline=time_budget, seeds=seeds).result
+    if algorithm == "brute_force":
+        if n > BRUTE_FORCE_MAX_TASKS:
+            raise ValueError(f"総当たりは{BRUTE_FORCE_MAX_TASKS}タスクまでです（{n}タスク）")
+        return run_brute_force(table, obj_type, profile=profile)
+    raise ValueError(f"不明な解法: {algorithm}")
+
+
+def result_record(table: TaskTable, algorithm: str, obj_type: ObjectiveType, result: ScheduleResult,
+                  with_order: bool = True) -> Dict:
+    """1件の結果を JSON にできる dict にする"""
+    record = {
+        "algorithm": algorithm,
+        "objective": obj_type.value,
+        "n": len(table),
+        "value": result.obj_value,
+        "objectives": {ot.value: result.get_objective_value(ot) for ot in ObjectiveType},
+        "time_ms": round(result.computation_time * 1000, 3),
+        "candidates": result.candidates,
+        "cached": result.cached,
+    }
+    if result.strategy is not None:
+        record["strategy"] = result.strategy
+    if result.lower_bound is not None:
+        record["lower_bound"] = result.lower_bound
+        record["gap"] = result.gap
+    if result.profile is not None:
+        record["profile"] = result.profile.to_dict()
+    if with_order:
+        record["order"] = [t.name for t in result.order]
+    return record
+
+
+def solve_each(table: TaskTable, algorithms: Sequence[str], objectives: Sequence[ObjectiveType],
+               time_budget: float = METAHEURISTIC_BUDGET, seed: Optional[int] = None, parallel: bool = False,
+               cache: Optional[SolutionCache] = None, profile: bool = False, profile_memory: bool = False,
+               population: int = GA_POPULATION, generations: int = GA_GENERATIONS,
+               ) -> Iterator[Tuple[str, ObjectiveType, Union[ScheduleResult, str]]]:
+    """
+    目的関数 × 解法ごとに (解法, 目的関数, 結果) を1件ずつ返す（失敗したものは結果の代わりにエラーの文字列）。
+    結果には下界を付ける。profile=True なら解いた結果に SolverProfile が付く（キャッシュから返した結果には付かない）。
+    """
+    for obj_type in objectives:
+        # 下界は目的関数ごとに1回だけ求め、どの解法の結果にも最適値との差の上限として付ける
+        # （解法が付けた下界の方が強ければそちらを残し、最適と証明済みの結果には触らない）
+        bound = objective_lower_bound(table.durations, table.deadlines, obj_type)
+        for algorithm in algorithms:
+            recorder = SolverProfile(track_memory=profile_memory) if profile else None
+            try:
+                if cache is None:
+                    result = solve(table, algorithm, obj_type, time_budget, seed, parallel, recorder,
+                                   population, generations)
+                else:
+                    # 時間で打ち切る解法は計算時間とシード（GA は集団の大きさと世代数も）が結果を左右するのでキーに含める
+                    key = f"{algorithm}:{time_budget}:{seed}" if algorithm in TIMED_ALGORITHMS else algorithm
+                    if algorithm == "genetic":
+                        key += f":{population}:{generations}"
+                    result = cache.get_or_solve(
+                        table, obj_type, key,
+                        lambda: solve(table, algorithm, obj_type, time_budget, seed, parallel, recorder,
+                                      population, generations))
+            except ValueError as e:
+                yield algorithm, obj_type, str(e)
+                continue
+            result.raise_lower_bound(bound)
+            yield algorithm, obj_type, result
+
+
+def error_record(table: TaskTable, algorithm: str, obj_type: ObjectiveType, error: str) -> Dict:
+    """解けなかった1件を表す dict（"error" に理由）"""
+    return {"algorithm": algorithm, "objective": obj_type.value, "n": len(table), "error": error}
+
+
+def run(table: TaskTable, algorithms: Sequence[str], objectives: Sequence[ObjectiveType],
+        time_budget: float = METAHEURISTIC_BUDGET, seed: Optional[int] = None, parallel: bool = False,
+        with_order: bool = True, cache: Optional[SolutionCache] = None,
+        profile: bool = False, profile_memory: bool = False,
+        population: int = GA_POPULATION, generations: int = GA_GENERATIONS) -> Iterator[Dict]:
+    """
+    目的関数 × 解法ごとに結果を1件ずつ返す（失敗したものは "error" を入れて返す）。
+    profile=True なら解いた結果に "profile"（SolverProfile.to_dict）を付ける（キャッシュから返した結果には付かない）。
+    """
+    for algorithm, obj_type, result in solve_each(table, algorithms, objectives, time_budget, seed, parallel,
+                                                  cache, profile, profile_memory, population, generations):
+        if isinstance(result, str):
+            yield error_record(table, algorithm, obj_type, result)
+        else:
+            yield result_record(table, algorithm, obj_type, result, with_order)
+
+
+# -----------------------------
+# Main
+# -----------------------------
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="作業スケジューラ最適化（GUIなし）: 結果を JSON Lines で出力します")
+    parser.add_argument("input", help="タスクのファイル（JSON / CSV、- なら標準入力）")
+    parser.add_argument("--format", choices=("auto", "json", "csv"), default="auto",
+                        help="入力形式（既定: 内容から判定）")
+    parser.add_argument("-a", "--algorithms", default="edf,spt,edf_swap,exact",
+                        help=f"解法（カンマ区切り or all）: {', '.join(ALGORITHM_NAMES)}")
+    parser.add_argument("-o", "--objectives", default="all",
+                        help=f"目的関数（カンマ区切り or all）: {', '.join(ot.value for ot in ObjectiveType)}")
+    parser.add_argument("--time-budget", type=float, default=METAHEURISTIC_BUDGET,
+                        help="焼きなまし / タブー探索 / 遺伝的アルゴリズムの計算時間、portfolio の締切（秒）")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="焼きなまし / タブー探索 / 遺伝的アルゴリズム / portfolio の乱数シード")
+    parser.add_argument("--population", type=int, default=GA_POPULATION, help="遺伝的アルゴリズムの集団の大きさ")
+    parser.add_argument("--generations", type=int, default=GA_GENERATIONS, help="遺伝的アルゴリズムの世代数の上限")
+    parser.add_argument("--parallel", action="store_true", help="厳密解をマルチコアで探索する")
+    parser.add_argument("--no-order", action="store_true", help="順序（タスク名の列）を出力しない")
+    parser.add_argument("--profile", action="store_true",
+                        help="段階ごとの時間・評価数/秒・改善の履歴を \"profile\" として出力する")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="--profile にメモリのピーク（tracemalloc、遅くなる）も加える")
+    parser.add_argument("--cache", metavar="PATH", help="結果をこの JSON ファイルにキャッシュする（2回目以降は再計算しない）")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        if args.input == "-":
+            table = read_task_table(sys.stdin, args.format)
+        else:
+            # CSV はファイルを1行ずつ読みながら表に追加する
+            with open(args.input, encoding="utf-8-sig", newline="") as f:
+                table = read_task_table(f, args.format)
+        algorithms = parse_choices(args.algorithms, ALGORITHM_NAMES, "解法")
+        objectives = [ObjectiveType(v) for v in
+                      parse_choices(args.objectives, [ot.value for ot in ObjectiveType], "目的関数")]
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    cache = SolutionCache(path=args.cache) if args.cache else None
+    try:
+        for record in run(table, algorithms, objectives, args.time_budget, args.seed, args.parallel,
+                          with_order=not args.no_order, cache=cache,
+                          profile=args.profile or args.profile_memory, profile_memory=args.profile_memory,
+                          population=args.population, generations=args.generations):
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+    finally:
+        # 結果はまとめて1回だけ書き出す（途中で止めても、それまでに解いた分は残る）
+        if cache is not None:
+            cache.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2849 @@
+"""
+Day 80: 作業スケジューラ最適化のコア（tkinter を使わない）
+- データモデル（Task / TaskTable / ScheduleResult）と目的関数
+- 解法: EDF / SPT / EDF+Swap / 部分集合DP / 分枝限定法 / 並列探索 / 焼きなまし・タブー探索 / 遺伝的アルゴリズム
+- GUI（task_scheduler.py）とコマンドライン（scheduler_cli.py）の両方から使う
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from contextlib import contextmanager, nullcontext
+from itertools import chain, islice, permutations
+import csv
+import hashlib
+import json
+import os
+import time
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+from enum import Enum
+from array import array
+import heapq
+import math
+import random
+import sys
+import threading
+import tracemalloc
+
+
+# -----------------------------
+# Objective Types
+# -----------------------------
+class ObjectiveType(Enum):
+    TOTAL_TARDINESS = "total_tardiness"      # 総遅延時間（Σ max(0, 完了-締切)）
+    TARDY_COUNT = "tardy_count"              # 遅延タスク数
+    MAX_TARDINESS = "max_tardiness"          # 最大遅延
+    TOTAL_COMPLETION = "total_completion"    # 総完了時刻（Σ 完了時刻）
+
+
+OBJECTIVE_LABELS = {
+    ObjectiveType.TOTAL_TARDINESS: "遅延時間",
+    ObjectiveType.TARDY_COUNT: "遅延タスク数",
+    ObjectiveType.MAX_TARDINESS: "最大遅延",
+    ObjectiveType.TOTAL_COMPLETION: "完了時刻",
+}
+
+OBJECTIVE_DESCRIPTIONS = {
+    ObjectiveType.TOTAL_TARDINESS: "締切を過ぎた時間の合計を最小化",
+    ObjectiveType.TARDY_COUNT: "遅れたタスクの件数を最小化",
+    ObjectiveType.MAX_TARDINESS: "最も遅れたタスクの遅延を最小化",
+    ObjectiveType.TOTAL_COMPLETION: "全タスク完了時刻の合計を最小化（SPTが最適）",
+}
+
+
+# -----------------------------
+# Data Models
+# -----------------------------
+@dataclass(frozen=True)
+class Task:
+    """タスクを表すデータクラス"""
+    name: str
+    duration: int      # 所要時間（分）
+    deadline: int      # 締切（開始からの分数）
+
+    def __str__(self) -> str:
+        return f"{self.name} ({self.duration}分, 締切:{self.deadline}分)"
+
+
+class TaskTable:
+    """
+    タスクを列ごとの配列で持つタスク表（struct-of-arrays）。
+    所要時間・締切は int32 配列、名前は intern して1か所だけに保持し、
+    順序はこの表への index 配列（array('i')）で表す。
+    """
+    __slots__ = ("names", "durations", "deadlines")
+
+    def __init__(self) -> None:
+        self.names: List[str] = []
+        self.durations = array("i")
+        self.deadlines = array("i")
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> TaskTable:
+        table = cls()
+        for task in tasks:
+            table.append(task.name, task.duration, task.deadline)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    def append(self, name: str, duration: int, deadline: int) -> None:
+        self.names.append(sys.intern(name))
+        self.durations.append(duration)
+        self.deadlines.append(deadline)
+
+    def extend(self, rows: Sequence[Tuple[str, int, int]]) -> None:
+        """(名前, 所要時間, 締切) の列をまとめて追加する（列ごとに1回の extend）"""
+        self.names.extend(sys.intern(row[0]) for row in rows)
+        self.durations.extend(row[1] for row in rows)
+        self.deadlines.extend(row[2] for row in rows)
+
+    def delete(self, idx: int) -> None:
+        del self.names[idx]
+        del self.durations[idx]
+        del self.deadlines[idx]
+
+    def update(self, idx: int, name: str, duration: int, deadline: int) -> None:
+        self.names[idx] = sys.intern(name)
+        self.durations[idx] = duration
+        self.deadlines[idx] = deadline
+
+    def clear(self) -> None:
+        self.names.clear()
+        del self.durations[:]
+        del self.deadlines[:]
+
+    def copy(self) -> TaskTable:
+        """中身を複製した表（配列のコピーと名前の参照のコピーだけ）"""
+        table = TaskTable()
+        table.names = list(self.names)
+        table.durations = array("i", self.durations)
+        table.deadlines = array("i", self.deadlines)
+        return table
+
+    def task(self, idx: int) -> Task:
+        """index のタスクを Task として取り出す"""
+        return Task(self.names[idx], self.durations[idx], self.deadlines[idx])
+
+    def tasks(self, order: Optional[Iterable[int]] = None) -> List[Task]:
+        """Task のリストを作る（order を渡すとその順序で）"""
+        if order is None:
+            order = range(len(self))
+        return [self.task(i) for i in order]
+
+
+# -----------------------------
+# Import (CSV / JSON)
+# -----------------------------
+IMPORT_CHUNK_SIZE = 5000  # 読み込みで1回に渡す行数
+
+
+def _parse_task_row(i: int, row) -> Tuple[str, int, int]:
+    """i 件目の行（dict）を (名前, 所要時間, 締切) にする（不正なら ValueError）"""
+    try:
+        name = str(row.get("name") or f"T{i}").strip()
+        duration = int(row["duration"])
+        deadline = int(row["deadline"])
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"{i}件目のタスクが読み込めません: {row!r}") from e
+    if duration <= 0 or deadline <= 0:
+        raise ValueError(f"{i}件目: 所要時間と締切は正の整数で入力してください")
+    return name, duration, deadline
+
+
+def _json_task_rows(data) -> list:
+    """JSON の値（[{...}, ...] または {"tasks": [...]}）からタスクの行のリストを取り出す（不正なら ValueError）"""
+    rows = data.get("tasks") if isinstance(data, dict) else data
+    if not isinstance(rows, list):
+        raise ValueError("タスクはオブジェクトのリスト（[{...}, ...] または {\"tasks\": [...]}）で入力してください")
+    return rows
+
+
+def iter_task_chunks(stream: TextIO, fmt: str = "auto",
+                     chunk_size: int = IMPORT_CHUNK_SIZE) -> Iterator[List[Tuple[str, int, int]]]:
+    """
+    JSON / CSV のタスクを chunk_size 件ずつ (名前, 所要時間, 締切) のリストにして返す。
+    CSV（見出し行 name,duration,deadline）は1行ずつ読むので、ファイル全体をメモリに載せない。
+    JSON（[{...}, ...] または {"tasks": [...]}）は標準ライブラリに逐次パーサがないので一度に読む。
+    fmt="auto" なら最初の空でない行の先頭の文字で判定する。不正な行があれば ValueError。
+    """
+    head: List[str] = []
+    if fmt == "auto":
+        fmt = "csv"
+        for line in stream:
+            head.append(line)
+            if line.strip():
+                fmt = "json" if line.lstrip()[:1] in ("[", "{") else "csv"
+                break
+
+    if fmt == "json":
+        data = json.loads("".join(head) + stream.read())
+        rows: Iterable = _json_task_rows(data)
+    else:
+        rows = csv.DictReader(chain(head, stream))
+
+    chunk: List[Tuple[str, int, int]] = []
+    for i, row in enumerate(rows, 1):
+        chunk.append(_parse_task_row(i, row))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def table_from_records(rows: Iterable) -> TaskTable:
+    """dict のリスト（JSON の tasks）を TaskTable にする（リストでない、または不正な行があれば ValueError）"""
+    if not isinstance(rows, (list, tuple)):
+        raise ValueError("タスクはオブジェクトのリスト（[{...}, ...]）で入力してください")
+    table = TaskTable()
+    table.extend([_parse_task_row(i, row) for i, row in enumerate(rows, 1)])
+    return table
+
+
+def read_task_table(stream: TextIO, fmt: str = "auto") -> TaskTable:
+    """JSON / CSV を読み込んで TaskTable にする（chunk ごとにまとめて追加）"""
+    table = TaskTable()
+    for chunk in iter_task_chunks(stream, fmt):
+        table.extend(chunk)
+    return table
+
+
+# -----------------------------
+# Core Calculation Functions
+# -----------------------------
+def calculate_total_tardiness(order: List[Task]) -> int:
+    """総遅延時間（Σ max(0, 完了 - 締切)）を計算"""
+    current_time = 0
+    total = 0
+    for task in order:
+        current_time += task.duration
+        total += max(0, current_time - task.deadline)
+    return total
+
+
+def calculate_tardy_count(order: List[Task]) -> int:
+    """遅延タスク数を計算"""
+    current_time = 0
+    count = 0
+    for task in order:
+        current_time += task.duration
+        if current_time > task.deadline:
+            count += 1
+    return count
+
+
+def calculate_max_tardiness(order: List[Task]) -> int:
+    """最大遅延を計算"""
+    current_time = 0
+    max_delay = 0
+    for task in order:
+        current_time += task.duration
+        delay = max(0, current_time - task.deadline)
+        max_delay = max(max_delay, delay)
+    return max_delay
+
+
+def calculate_total_completion(order: List[Task]) -> int:
+    """総完了時刻（Σ 完了時刻）を計算"""
+    current_time = 0
+    total = 0
+    for task in order:
+        current_time += task.duration
+        total += current_time
+    return total
+
+
+def calculate_objective(order: List[Task], obj_type: ObjectiveType) -> int:
+    """指定された目的関数の値を計算"""
+    if obj_type == ObjectiveType.TOTAL_TARDINESS:
+        return calculate_total_tardiness(order)
+    elif obj_type == ObjectiveType.TARDY_COUNT:
+        return calculate_tardy_count(order)
+    elif obj_type == ObjectiveType.MAX_TARDINESS:
+        return calculate_max_tardiness(order)
+    elif obj_type == ObjectiveType.TOTAL_COMPLETION:
+        return calculate_total_completion(order)
+    return calculate_total_tardiness(order)
+
+
+def calculate_objectives_indexed(table: TaskTable, order: Iterable[int]) -> Dict[ObjectiveType, int]:
+    """タスク表と index 順序から、4つの目的関数の値を1回の走査で計算"""
+    durations = table.durations
+    deadlines = table.deadlines
+    current_time = 0
+    total_tardiness = tardy_count = max_tardiness = total_completion = 0
+    for j in order:
+        current_time += durations[j]
+        late = current_time - deadlines[j]
+        if late > 0:
+            total_tardiness += late
+            tardy_count += 1
+            if late > max_tardiness:
+                max_tardiness = late
+        total_completion += current_time
+    return {
+        ObjectiveType.TOTAL_TARDINESS: total_tardiness,
+        ObjectiveType.TARDY_COUNT: tardy_count,
+        ObjectiveType.MAX_TARDINESS: max_tardiness,
+        ObjectiveType.TOTAL_COMPLETION: total_completion,
+    }
+
+
+# -----------------------------
+# Batch Evaluation（複数の順序をまとめて評価）
+# -----------------------------
+BATCH_SIZE = 4096  # 1回のバッチで評価する順序の数
+
+_numpy = False  # numpy は任意。起動を軽くするため、初めてバッチ評価するときに import する
+
+
+def _load_numpy():
+    """numpy を返す（入っていなければ None、純Pythonで評価する）"""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def evaluate_orders_batch(durations: Sequence[int], deadlines: Sequence[int],
+                          orders) -> Dict[ObjectiveType, Sequence[int]]:
+    """
+    多数の順序（タスク index の2次元配列, 形状 m×n）を一度に評価し、
+    4つの目的関数の値を行ごとに返す。
+    numpy があれば完了時刻を cumsum でまとめて計算し、なければ純Pythonで1行ずつ計算する。
+    """
+    np = _load_numpy()
+    if np is not None:
+        idx = np.asarray(orders, dtype=np.intp)
+        m = idx.shape[0]
+        if idx.ndim != 2 or idx.shape[1] == 0:
+            zeros = np.zeros(m, dtype=np.int64)
+            return {obj_type: zeros for obj_type in ObjectiveType}
+        completion = np.cumsum(np.asarray(durations, dtype=np.int64)[idx], axis=1)
+        lateness = completion - np.asarray(deadlines, dtype=np.int64)[idx]
+        tardiness = np.maximum(lateness, 0)
+        return {
+            ObjectiveType.TOTAL_TARDINESS: tardiness.sum(axis=1),
+            ObjectiveType.TARDY_COUNT: (lateness > 0).sum(axis=1),
+            ObjectiveType.MAX_TARDINESS: tardiness.max(axis=1),
+            ObjectiveType.TOTAL_COMPLETION: completion.sum(axis=1),
+        }
+
+    results: Dict[ObjectiveType, List[int]] = {obj_type: [] for obj_type in ObjectiveType}
+    for order in orders:
+        current_time = 0
+        total_tardiness = tardy_count = max_tardiness = total_completion = 0
+        for j in order:
+            current_time += durations[j]
+            late = current_time - deadlines[j]
+            if late > 0:
+                total_tardiness += late
+                tardy_count += 1
+                if late > max_tardiness:
+                    max_tardiness = late
+            total_completion += current_time
+        results[ObjectiveType.TOTAL_TARDINESS].append(total_tardiness)
+        results[ObjectiveType.TARDY_COUNT].append(tardy_count)
+        results[ObjectiveType.MAX_TARDINESS].append(max_tardiness)
+        results[ObjectiveType.TOTAL_COMPLETION].append(total_completion)
+    return results
+
+
+def batch_argmin(values: Sequence[int]) -> int:
+    """バッチ評価結果の最小値の位置（同点なら先頭）"""
+    np = _load_numpy()
+    if np is not None:
+        return int(np.argmin(values))
+    return min(range(len(values)), key=values.__getitem__)
+
+
+class ScheduleResult:
+    """
+    スケジューリング結果
+    順序はタスク表への index 配列で持ち、order（Task のリスト）と
+    schedule（開始・終了・遅延の詳細）は参照されたときに作る。
+    table は結果を作った時点の表の複製なので、元の表（source）が後で編集されても中身は変わらない。
+    """
+    def __init__(self, order: Sequence, obj_value: int, computation_time: float,
+                 candidates: int = 1, obj_type: ObjectiveType = ObjectiveType.TOTAL_TARDINESS,
+                 table: Optional[TaskTable] = None):
+        # table を渡した場合、order はその表の index 列として扱う
+        if table is None:
+            self._order: Optional[List[Task]] = list(order)
+            self.table = TaskTable.from_tasks(self._order)
+            self.source = self.table
+            self.index_order = array("i", range(len(self._order)))
+        else:
+            self._order = None
+            self.source = table        # index_order はこの表の index
+            self.table = table.copy()  # order / schedule はこちらから作る
+            self.index_order = array("i", order)
+        self.obj_value = obj_value  # 最適化対象の目的関数値
+        self.obj_type = obj_type
+        self.computation_time = computation_time
+        self.candidates = candidates
+        self.cached = False  # SolutionCache から返した結果なら True（計算時間・候補数は初回のもの）
+        self.strategy: Optional[str] = None  # 結果を出した戦略（ポートフォリオの勝者、下界で探索を省いたら "lower_bound"）
+        self.lower_bound: Optional[int] = None  # 最適値の下界（分かっていれば）
+        self.profile: Optional[SolverProfile] = None  # 計測を頼まれたときの内訳（SolverProfile）
+        self._schedule: Optional[List[Tuple[Task, int, int, int]]] = None
+        self._calc_all_objectives()
+
+    @property
+    def order(self) -> List[Task]:
+        if self._order is None:
+            self._order = self.table.tasks(self.index_order)
+        return self._order
+
+    @property
+    def schedule(self) -> List[Tuple[Task, int, int, int]]:
+        """スケジュール詳細 (task, start, end, delay) のリスト"""
+        if self._schedule is None:
+            schedule = []
+            current_time = 0
+            for task in self.order:
+                start = current_time
+                end = current_time + task.duration
+                delay = max(0, end - task.deadline)
+                schedule.append((task, start, end, delay))
+                current_time = end
+            self._schedule = schedule
+        return self._schedule
+
+    def _calc_all_objectives(self) -> None:
+        """全目的関数の値を1回の走査で計算"""
+        values = calculate_objectives_indexed(self.table, self.index_order)
+        self.total_tardiness = values[ObjectiveType.TOTAL_TARDINESS]
+        self.tardy_count = values[ObjectiveType.TARDY_COUNT]
+        self.max_tardiness = values[ObjectiveType.MAX_TARDINESS]
+        self.total_completion = values[ObjectiveType.TOTAL_COMPLETION]
+        self._makespan = sum(self.table.durations[i] for i in self.index_order)
+
+    def get_objective_value(self, obj_type: ObjectiveType) -> int:
+        """指定した目的関数の値を取得"""
+        if obj_type == ObjectiveType.TOTAL_TARDINESS:
+            return self.total_tardiness
+        elif obj_type == ObjectiveType.TARDY_COUNT:
+            return self.tardy_count
+        elif obj_type == ObjectiveType.MAX_TARDINESS:
+            return self.max_tardiness
+        elif obj_type == ObjectiveType.TOTAL_COMPLETION:
+            return self.total_completion
+        return self.total_tardiness
+
+    @property
+    def makespan(self) -> int:
+        return self._makespan
+
+    @property
+    def optimal(self) -> bool:
+        """最適と証明済みか（下界が目的関数値に届いている）"""
+        return self.lower_bound is not None and self.lower_bound >= self.obj_value
+
+    @property
+    def gap(self) -> Optional[int]:
+        """下界との差（0 なら最適と証明済み、下界が分からなければ None）"""
+        if self.lower_bound is None:
+            return None
+        return 0 if self.optimal else self.obj_value - self.lower_bound
+
+    def raise_lower_bound(self, bound: int) -> None:
+        """下界を bound 以上に引き上げる（最適と証明済みの結果はそのまま）"""
+        if self.optimal:
+            return
+        self.lower_bound = bound if self.lower_bound is None else max(self.lower_bound, bound)
+
+    # 後方互換性
+    @property
+    def total_delay(self) -> int:
+        return self.total_tardiness
+
+    @property
+    def max_delay(self) -> int:
+        return self.max_tardiness
+
+
+# -----------------------------
+# Core Optimization Logic
+# -----------------------------
+@dataclass
+class SearchProgress:
+    """探索の途中経過"""
+    best_order: List[Task]      # 暫定最良の順序
+    best_value: Optional[int]   # 暫定最良の目的関数値（まだなければ None）
+    candidates: int             # ここまでに調べた候補（ノード・状態）数
+    fraction: float             # 探索空間のうち調べ終えた割合（0.0〜1.0）
+    elapsed: float              # 経過時間（秒）
+
+    @property
+    def rate(self) -> float:
+        """1秒あたりの候補数"""
+        return self.candidates / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class _SearchCancelled(Exception):
+    """探索を中止して再帰を抜けるための内部例外"""
+
+
+class SearchControl:
+    """
+    厳密探索の途中経過の通知とキャンセル（探索スレッドと GUI スレッドで共有する）。
+    solver は一定間隔で report() を呼び、cancelled が立ったら暫定解を返して終わる。
+    """
+    CHECK_INTERVAL = 1024  # 何ノードごとにキャンセル・通知を確認するか
+
+    def __init__(self, on_progress: Optional[Callable[[SearchProgress], None]] = None,
+                 interval: float = 0.2):
+        self.on_progress = on_progress
+        self.interval = interval  # 通知の最短間隔（秒）
+        self.start_time = time.perf_counter()
+        self._last_report = 0.0
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def report(self, best_order: List[Task], best_value: Optional[int], candidates: int,
+               fraction: float, force: bool = False) -> None:
+        """途中経過を通知（interval より短い間隔の呼び出しは間引く）"""
+        now = time.perf_counter()
+        if self.on_progress is None or (not force and now - self._last_report < self.interval):
+            return
+        self._last_report = now
+        self.on_progress(SearchProgress(best_order, best_value, candidates,
+                                        min(fraction, 1.0), now - self.start_time))
+
+
+PROFILE_TRACE_SIZE = 512  # 収束の記録に残す改善の数（古いものから捨てる）
+
+
+class SolverProfile:
+    """
+    解法の計測（段階ごとの時間・評価数・改善の履歴、必要ならメモリのピーク）。
+    run_* に profile として渡したときだけ記録し、渡さなければ解法は何も計測しない。
+    改善の履歴 trace は (経過秒, それまでの評価数, 目的関数値) のリングバッファ
+    （溢れても最初の点 first は残すので、初期値からの収束が分かる）。
+    """
+
+    def __init__(self, trace_size: int = PROFILE_TRACE_SIZE, track_memory: bool = False):
+        self.track_memory = track_memory
+        self.phases: Dict[str, float] = {}  # 段階名 -> 秒（同じ名前は足し込む、記録した順）
+        self.trace: deque = deque(maxlen=trace_size)
+        self.first: Optional[Tuple[float, int, int]] = None
+        self.improvements = 0  # trace から溢れた分も含む改善の回数
+        self.evaluations = 0
+        self.elapsed = 0.0
+        self.peak_memory: Optional[int] = None  # バイト（track_memory のときだけ）
+        self._start: Optional[float] = None
+        self._owns_tracemalloc = False
+
+    def start(self) -> None:
+        """計測を始める（2回目以降の呼び出しは何もしないので、解法の入れ子でも1回だけ数える）"""
+        if self._start is not None:
+            return
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self._start = time.perf_counter()
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - t)
+
+    def improved(self, value: int, evaluations: int) -> None:
+        """暫定解が value に良くなったことを記録する（evaluations はそれまでの評価数）"""
+        point = (time.perf_counter() - (self._start or 0.0), evaluations, value)
+        if self.first is None:
+            self.first = point
+        self.improvements += 1
+        self.trace.append(point)
+
+    def finish(self, result: ScheduleResult) -> ScheduleResult:
+        """結果の評価数と最終値を記録して result.profile に付ける"""
+        self.elapsed = time.perf_counter() - (self._start or 0.0)
+        self.evaluations = result.candidates
+        if not self.trace or self.trace[-1][2] != result.obj_value:
+            self.trace.append((self.elapsed, result.candidates, result.obj_value))
+            if self.first is None:
+                self.first = self.trace[-1]
+        if self.track_memory and tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+                self._owns_tracemalloc = False
+        result.profile = self
+        return result
+
+    @property
+    def evaluations_per_second(self) -> float:
+        return self.evaluations / self.elapsed if self.elapsed > 0 else 0.0
+
+    def points(self) -> List[Tuple[float, int, int]]:
+        """描画用の収束の点列（trace から溢れていれば first を先頭に足す）"""
+        points = list(self.trace)
+        if self.first is not None and (not points or points[0] != self.first):
+            points.insert(0, self.first)
+        return points
+
+    def to_dict(self) -> Dict:
+        """JSON にできる dict（時間は秒）"""
+        record = {
+            "elapsed": round(self.elapsed, 6),
+            "phases": {name: round(sec, 6) for name, sec in self.phases.items()},
+            "evaluations": self.evaluations,
+            "evaluations_per_second": round(self.evaluations_per_second, 1),
+            "improvements": self.improvements,
+            "trace": [[round(t, 6), e, v] for t, e, v in self.points()],
+        }
+        if self.peak_memory is not None:
+            record["peak_memory"] = self.peak_memory
+        return record
+
+
+def _phase(profile: Optional[SolverProfile], name: str):
+    """profile があればその段階の時間を測る（なければ何もしない）"""
+    return profile.phase(name) if profile is not None else nullcontext()
+
+
+SWAP_FULL_TASKS = 300   # これ以下は全ペアの swap を調べ、超えたら位置の近いペアだけにする
+SWAP_WINDOW = 32        # 大きいインスタンスで swap する2つの位置を離す最大距離
+SWAP_TIME_BUDGET = 1.0  # 画面や厳密解法の暫定解で swap改善を打ち切る時間（秒）
+
+
+def improve_by_swaps(order: List[Task], obj_type: ObjectiveType = ObjectiveType.TOTAL_TARDINESS,
+                     max_iters: int = 4000, best_improvement: bool = False) -> Tuple[List[Task], int]:
+    """
+    ローカル探索（swap改善）:
+    2つのタスクを入れ替えて目的関数値が改善するなら採用、を繰り返す。
+    （Task のリスト版。実体は improve_order_by_swaps）
+    """
+    improved, candidates = improve_order_by_swaps(
+        [t.duration for t in order], [t.deadline for t in order], list(range(len(order))),
+        obj_type, max_iters=max_iters, best_improvement=best_improvement,
+    )
+    return [order[k] for k in improved], candidates
+
+
+def improve_order_by_swaps(durations: Sequence[int], deadlines: Sequence[int], order: List[int],
+                           obj_type: ObjectiveType = ObjectiveType.TOTAL_TARDINESS,
+                           max_iters: int = 4000, best_improvement: bool = False,
+                           time_budget: Optional[float] = None, window: Optional[int] = None,
+                           profile: Optional[SolverProfile] = None) -> Tuple[List[int], int]:
+    """
+    index 順序に対する swap改善。
+    順序はコピーせず、累積完了時刻を使って位置 i..j の区間だけを差分評価する。
+    - first-improvement（既定）: 改善する swap を見つけたらその場で採用し、走査を続ける
+    - best_improvement=True: 全ペアを調べて最も改善する swap を採用する
+    1周しても改善がなければ終了（max_iters は採用する swap 数の上限）。
+    window は j - i の上限（None なら SWAP_FULL_TASKS 以下は全ペア、超えたら SWAP_WINDOW）。
+    window を絞ったときは評価も採用も区間の長さだけの手間なので、1周は O(n · window²)。
+    time_budget（秒）を渡すと、i を1つ進めるごとに時間を確かめ、過ぎたらその時点の順序を返す。
+    profile を渡すと、採用した swap ごとの目的関数値を記録する。
+    """
+    best = list(order)
+    n = len(best)
+    candidates = 0
+    if n < 2:
+        return best, candidates
+    if window is None:
+        window = n if n <= SWAP_FULL_TASKS else SWAP_WINDOW
+    window = max(1, window)
+    # 全ペアを調べるときだけ累積和を持つ（採用1回 O(n) だが評価が O(1) になる）
+    use_prefix = window >= n - 1
+
+    use_max = obj_type == ObjectiveType.MAX_TARDINESS
+    is_count = obj_type == ObjectiveType.TARDY_COUNT
+    is_completion = obj_type == ObjectiveType.TOTAL_COMPLETION
+
+    def cost(c: int, d: int) -> int:
+        if is_completion:
+            return c
+        late = c - d
+        if late <= 0:
+            return 0
+        return 1 if is_count else late
+
+    durs = [durations[k] for k in best]
+    dls = [deadlines[k] for k in best]
+    ends = [0] * (n + 1)          # ends[k] = 先頭 k 個の完了時刻
+    costs = [0] * n               # 位置 k のコスト
+    cost_prefix = [0] * (n + 1)   # 位置 < k のコスト合計（use_prefix のときだけ使う）
+    tardy_prefix = [0] * (n + 1)  # 位置 < k の遅延タスク数
+    head_max = [0] * (n + 1)      # 位置 < k のコスト最大（最大遅延のときだけ使う）
+    tail_max = [0] * (n + 1)      # 位置 >= k のコスト最大
+    total = 0                     # コストの合計
+
+    def refresh(i: int, j: int) -> int:
+        """位置 i..j が変わったときに完了時刻とコストを直し、現在の目的関数値を返す"""
+        nonlocal total
+        for k in range(i, j + 1):
+            end = ends[k] + durs[k]
+            ends[k + 1] = end  # j より後ろの完了時刻は変わらない
+            c = cost(end, dls[k])
+            total += c - costs[k]
+            costs[k] = c
+        if use_prefix:
+            for k in range(i, n):
+                cost_prefix[k + 1] = cost_prefix[k] + costs[k]
+                tardy_prefix[k + 1] = tardy_prefix[k] + (1 if costs[k] > 0 else 0)
+        if not use_max:
+            return total
+        # 累積最大は区間の外で値が変わらなくなったところで止める
+        for k in range(i, n):
+            m = head_max[k] if head_max[k] > costs[k] else costs[k]
+            if k > j and head_max[k + 1] == m:
+                break
+            head_max[k + 1] = m
+        for k in range(j, -1, -1):
+            m = tail_max[k + 1] if tail_max[k + 1] > costs[k] else costs[k]
+            if k < i and tail_max[k] == m:
+                break
+            tail_max[k] = m
+        return head_max[n]
+
+    def evaluate(i: int, j: int, current: int, limit: int) -> int:
+        """位置 i, j を入れ替えた後の目的関数値（limit 以上と分かった時点で打ち切る）"""
+        delta = durs[j] - durs[i]
+        new_i = cost(ends[i] + durs[j], dls[j])
+        new_j = cost(ends[j + 1], dls[i])
+        if is_completion:
+            # 位置 i..j-1 の完了時刻がすべて delta だけずれる
+            return current + (j - i) * delta
+        if use_max:
+            v = max(head_max[i], tail_max[j + 1], new_i, new_j)
+            if v < limit:
+                for k in range(i + 1, j):
+                    c = cost(ends[k + 1] + delta, dls[k])
+                    if c > v:
+                        v = c
+                        if v >= limit:
+                            break
+            return v
+        if use_prefix:
+            old_mid = cost_prefix[j] - cost_prefix[i + 1]
+            tardy_mid = tardy_prefix[j] - tardy_prefix[i + 1]
+        else:
+            mid = costs[i + 1:j]
+            old_mid = sum(mid)
+            tardy_mid = len(mid) - mid.count(0)
+        outside = current - old_mid - costs[i] - costs[j]
+        v = outside + new_i + new_j + old_mid
+        # 中間の下界: 後ろ倒し（delta > 0）なら減らない、前倒しなら減り得る量の上限を引く
+        lower = v
+        if delta < 0:
+            lower -= tardy_mid if is_count else min(old_mid, -delta * tardy_mid)
+        if delta == 0 or lower >= limit:
+            return v
+        # 中間を足し込む（単調に増えるので limit に達したら打ち切り）
+        v = outside + new_i + new_j
+        for k in range(i + 1, j):
+            late = ends[k + 1] + delta - dls[k]
+            if late > 0:
+                v += 1 if is_count else late
+                if v >= limit:
+                    break
+        return v
+
+    def apply(i: int, j: int) -> int:
+        best[i], best[j] = best[j], best[i]
+        durs[i], durs[j] = durs[j], durs[i]
+        dls[i], dls[j] = dls[j], dls[i]
+        return refresh(i, j)
+
+    stop_at = time.perf_counter() + time_budget if time_budget is not None else None
+    current = refresh(0, n - 1)
+    if profile is not None:
+        profile.improved(current, 0)
+    moves = 0
+    while moves < max_iters:
+        improved = False
+        if best_improvement:
+            limit = current
+            move: Optional[Tuple[int, int]] = None
+            for i in range(n):
+                if stop_at is not None and time.perf_counter() > stop_at:
+                    break
+                for j in range(i + 1, min(n, i + window + 1)):
+                    candidates += 1
+                    v = evaluate(i, j, current, limit)
+                    if v < limit:
+                        limit = v
+                        move = (i, j)
+            if move is not None:
+                current = apply(*move)
+                moves += 1
+                improved = True
+                if profile is not None:
+                    profile.improved(current, candidates)
+        else:
+            for i in range(n):
+                if stop_at is not None and time.perf_counter() > stop_at:
+                    break
+                for j in range(i + 1, min(n, i + window + 1)):
+                    candidates += 1
+                    if evaluate(i, j, current, current) < current:
+                        current = apply(i, j)
+                        moves += 1
+                        improved = True
+                        if profile is not None:
+                            profile.improved(current, candidates)
+                        if moves >= max_iters:
+                            break
+                if moves >= max_iters:
+                    break
+        if not improved or (stop_at is not None and time.perf_counter() > stop_at):
+            break
+
+    return best, candidates
+
+
+# 多項式時間の厳密解法がある目的関数（総遅延時間だけは NP困難）
+POLYNOMIAL_OBJECTIVES = (
+    ObjectiveType.TOTAL_COMPLETION,   # SPT
+    ObjectiveType.MAX_TARDINESS,      # EDD（Jackson's rule）
+    ObjectiveType.TARDY_COUNT,        # Moore–Hodgson
+)
+
+
+def moore_hodgson_order(durations: Sequence[int], deadlines: Sequence[int]) -> List[int]:
+    """
+    Moore–Hodgson 法（O(n log n)）: 遅延タスク数を最小にする index 順序を返す。
+    締切順に追加していき、締切を超えたら採用済みの中で最も長いタスクを遅延側へ回す。
+    """
+    edd = sorted(range(len(durations)), key=deadlines.__getitem__)
+    on_time_heap: List[Tuple[int, int]] = []  # (-所要時間, index)
+    late: List[int] = []
+    current_time = 0
+    for j in edd:
+        heapq.heappush(on_time_heap, (-durations[j], j))
+        current_time += durations[j]
+        if current_time > deadlines[j]:
+            neg_p, k = heapq.heappop(on_time_heap)
+            current_time += neg_p
+            late.append(k)
+    late_set = set(late)
+    on_time = [j for j in edd if j not in late_set]
+    return on_time + late
+
+
+def solve_polynomial(durations: Sequence[int], deadlines: Sequence[int],
+                     obj_type: ObjectiveType) -> Optional[List[int]]:
+    """
+    多項式時間で厳密解が求まる目的関数なら最適な index 順序を返す（O(n log n)）。
+    総遅延時間のように該当しない場合は None。
+    """
+    n = len(durations)
+    if obj_type == ObjectiveType.TOTAL_COMPLETION:
+        return sorted(range(n), key=durations.__getitem__)
+    if obj_type == ObjectiveType.MAX_TARDINESS:
+        return sorted(range(n), key=deadlines.__getitem__)
+    if obj_type == ObjectiveType.TARDY_COUNT:
+        return moore_hodgson_order(durations, deadlines)
+    return None
+
+
+def objective_lower_bound(durations: Sequence[int], deadlines: Sequence[int], obj_type: ObjectiveType) -> int:
+    """
+    最適値の下界を O(n log n) で求める（ヒューリスティックの解がこれに届けば最適と証明できる）。
+    多項式時間で解ける目的関数では最適値そのもの。総遅延時間では次の最大値:
+    - k 番目に早い完了時刻（SPT）と k 番目に早い締切を組にした遅延の合計
+    - EDD 順の最大遅延（どの順序でも最大遅延はこれ以上、総遅延は最大遅延以上）
+    - Moore–Hodgson 法の遅延件数（遅延するタスクは少なくとも1遅れる）
+    """
+    n = len(durations)
+    if n == 0:
+        return 0
+    order = solve_polynomial(durations, deadlines, obj_type)
+    if order is not None:
+        c = 0
+        tardy_count = max_tardiness = total_completion = 0
+        for j in order:
+            c += durations[j]
+            late = c - deadlines[j]
+            if late > 0:
+                tardy_count += 1
+                max_tardiness = max(max_tardiness, late)
+            total_completion += c
+        if obj_type == ObjectiveType.TOTAL_COMPLETION:
+            return total_completion
+        return max_tardiness if obj_type == ObjectiveType.MAX_TARDINESS else tardy_count
+
+    pairing = 0
+    c = 0
+    for p, d in zip(sorted(durations), sorted(deadlines)):
+        c += p
+        if c > d:
+            pairing += c - d
+    bounds = [pairing]
+    for kind in (ObjectiveType.MAX_TARDINESS, ObjectiveType.TARDY_COUNT):
+        bounds.append(objective_lower_bound(durations, deadlines, kind))
+    return max(bounds)
+
+
+def dominance_precedence(durations: Sequence[int], deadlines: Sequence[int],
+                         obj_type: ObjectiveType) -> List[int]:
+    """
+    総遅延時間の優越規則（Emmons の定理）で「i は j より前に置いてよい」関係を前処理で求める。
+    返り値は各タスクの「必ず前に置くタスク」のビットマスク（推移的に閉じている）。
+    B_j / A_j を j の前 / 後に決まったタスクの集合として、次のどれかが成り立てば i → j:
+    - p_i < p_j かつ d_i ≤ max(d_j, P(B_j) + p_j)（Emmons の定理1）
+    - p_i = p_j かつ (d_i, i) < (d_j, j)（同じ長さなら締切の早い方を先にして損はない）
+    - d_j ≥ P(N) - P(A_i) かつ A_j ⊆ A_i（j を i の直後へ移しても j は間に合う）
+    総遅延時間以外（多項式時間で解ける目的関数）では関係を作らない（全要素 0）。
+    """
+    n = len(durations)
+    before = [0] * n
+    after = [0] * n
+    if obj_type != ObjectiveType.TOTAL_TARDINESS or n < 2:
+        return before
+
+    total = sum(durations)
+
+    def mask_sum(mask: int) -> int:
+        s = 0
+        while mask:
+            low = mask & -mask
+            s += durations[low.bit_length() - 1]
+            mask ^= low
+        return s
+
+    def precedes(i: int, j: int) -> bool:
+        p_i, p_j = durations[i], durations[j]
+        if p_i < p_j and deadlines[i] <= max(deadlines[j], mask_sum(before[j]) + p_j):
+            return True
+        if p_i == p_j and (deadlines[i], i) < (deadlines[j], j):
+            return True
+        return after[j] & ~after[i] == 0 and deadlines[j] >= total - mask_sum(after[i])
+
+    changed = True
+    while changed:
+        changed = False
+        for i in range(n):
+            for j in range(n):
+                if i == j or (before[j] >> i) & 1 or (before[i] >> j) & 1:
+                    continue
+                if not precedes(i, j):
+                    continue
+                # i（とその前のタスク）→ j（とその後のタスク）を推移的に追加
+                heads = before[i] | (1 << i)
+                tails = after[j] | (1 << j)
+                m = heads
+                while m:
+                    low = m & -m
+                    after[low.bit_length() - 1] |= tails
+                    m ^= low
+                m = tails
+                while m:
+                    low = m & -m
+                    before[low.bit_length() - 1] |= heads
+                    m ^= low
+                changed = True
+    return before
+
+
+DP_MAX_TASKS = 20  # 部分集合DPで扱う上限（2^20 ≒ 100万状態、表は約 17MB）
+DP_AUTO_TASKS = 16  # これ以下はDP、超えたら Lawler の分解法を使う
+BNB_MAX_TASKS = 30  # 分枝限定法で扱う上限（run_exact では使わない。直接呼ぶときとベンチマーク用）
+BNB_MEMO_LIMIT = 2_000_000  # 分枝限定法で記録する訪問済み集合の上限
+
+
+EXHAUSTIVE_TAIL = 7  # numpy があれば末尾のこの個数（7! = 5040 通り）はまとめて評価する
+
+
+def _prefix_blocks(durations: Sequence[int], deadlines: Sequence[int], depth: int,
+                   precedence: Optional[Sequence[int]] = None
+                   ) -> Iterable[Tuple[List[int], int, ObjectiveVector, List[int]]]:
+    """
+    先頭 depth 個の並べ方を辞書式順に深さ優先で列挙し、
+    (先頭の index 列, その完了時刻, 4目的の途中までの値, 残りの index（昇順）) を順に返す。
+    完了時刻と途中の値は再帰で下へ渡すので、先頭が共通な並べ方の計算は1回で済む。
+    precedence（dominance_precedence の結果）があれば、前に置くべきタスクが揃ったものだけ置く。
+    """
+    n = len(durations)
+    order = [0] * depth
+    placed = [False] * n
+    before = precedence or [0] * n
+
+    def dfs(k: int, t: int, mask: int, tardiness: int, count: int, max_late: int, completion: int):
+        if k == depth:
+            yield order[:], t, (tardiness, count, max_late, completion), [j for j in range(n) if not placed[j]]
+            return
+        for j in range(n):
+            if placed[j] or before[j] & ~mask:
+                continue
+            c = t + durations[j]
+            late = c - deadlines[j]
+            placed[j] = True
+            order[k] = j
+            if late > 0:
+                yield from dfs(k + 1, c, mask | (1 << j), tardiness + late, count + 1, max(max_late, late),
+                               completion + c)
+            else:
+                yield from dfs(k + 1, c, mask | (1 << j), tardiness, count, max_late, completion + c)
+            placed[j] = False
+
+    yield from dfs(0, 0, 0, 0, 0, 0, 0)
+
+
+def _tail_table(np, tail: int):
+    """残り tail 個の並べ方（辞書式順）の順列表と、その列（何番目に置くか）ごとの連続配列"""
+    perms = np.array(list(permutations(range(tail))), dtype=np.intp)
+    return perms, np.ascontiguousarray(perms.T)
+
+
+def _tail_feasible(position, rest: Sequence[int], precedence: Sequence[int]):
+    """
+    順列表の各行が、残りのタスク同士の先行関係を満たすかどうか（関係がなければ None）。
+    position[r, u] は行 r で u 番目の残りタスクを置く位置（順列表の逆置換）。
+    """
+    feasible = None
+    for v, j in enumerate(rest):
+        for u, i in enumerate(rest):
+            if (precedence[j] >> i) & 1:
+                ok = position[:, u] < position[:, v]
+                feasible = ok if feasible is None else feasible & ok
+    return feasible
+
+
+def _tail_values(np, columns, p_rest, d_rest, t: int, prefix: ObjectiveVector,
+                 objectives: Sequence[ObjectiveType]) -> Dict:
+    """
+    先頭の完了時刻 t と4目的の途中までの値 prefix から、残りの全並べ方の目的関数値を
+    objectives の分だけまとめて計算する（列ごとに足し込むので cumsum より速い）。
+    """
+    m = columns.shape[1]
+    completion = np.full(m, t, dtype=np.int64)
+    kinds = list(ObjectiveType)
+    values = {ot: np.full(m, prefix[kinds.index(ot)], dtype=np.int64) for ot in objectives}
+    need_late = any(ot != ObjectiveType.TOTAL_COMPLETION for ot in objectives)
+    for column in columns:
+        completion += p_rest[column]
+        if need_late:
+            late = completion - d_rest[column]
+            tardiness = np.maximum(late, 0)
+        for ot, v in values.items():
+            if ot == ObjectiveType.TOTAL_TARDINESS:
+                v += tardiness
+            elif ot == ObjectiveType.TARDY_COUNT:
+                v += late > 0
+            elif ot == ObjectiveType.MAX_TARDINESS:
+                np.maximum(v, tardiness, out=v)
+            else:
+                v += completion
+    return values
+
+
+def exhaustive_search(durations: Sequence[int], deadlines: Sequence[int],
+                      obj_type: ObjectiveType, precedence: Optional[Sequence[int]] = None
+                      ) -> Tuple[List[int], int, int]:
+    """
+    全順列を深さ優先で列挙する総当たり（辞書式順に見て最初の最良解を返すので、結果は
+    permutations を順に評価した場合と同じ）。順序は1本の配列の k 番目に書き込み、
+    完了時刻と途中までの目的関数値を再帰で下へ渡すので、葉ごとのリスト生成や先頭からの再計算はしない。
+    numpy があれば残り EXHAUSTIVE_TAIL 個の並べ方を順列表でまとめて評価し、
+    なければ残り2つになったところで2通りをその場で評価する。
+    precedence（dominance_precedence の結果）があれば、それを満たす順列だけを列挙する。
+    返り値: (最良の index 順序, 目的関数値, 評価した順列数)
+    """
+    n = len(durations)
+    use_max = obj_type == ObjectiveType.MAX_TARDINESS
+    is_count = obj_type == ObjectiveType.TARDY_COUNT
+    is_completion = obj_type == ObjectiveType.TOTAL_COMPLETION
+    p = list(durations)
+    d = list(deadlines)
+
+    def add(value: int, c: int, j: int) -> int:
+        if is_completion:
+            cost = c
+        else:
+            cost = c - d[j]
+            if cost < 0:
+                cost = 0
+            elif is_count and cost > 0:
+                cost = 1
+        if use_max:
+            return value if value > cost else cost
+        return value + cost
+
+    if n <= 1:
+        return list(range(n)), (add(0, p[0], 0) if n else 0), 1
+
+    before = precedence if precedence is not None and any(precedence) else None
+    best_order: List[int] = []
+    best_value = math.inf
+    leaves = 0
+
+    np = _load_numpy() if n > 2 else None
+    if np is not None:
+        tail = min(n, EXHAUSTIVE_TAIL)
+        perms, columns = _tail_table(np, tail)
+        position = np.argsort(perms, axis=1) if before is not None else None
+        p_arr = np.array(p, dtype=np.int64)
+        d_arr = np.array(d, dtype=np.int64)
+        for prefix, t, partial, rest in _prefix_blocks(p, d, n - tail, before):
+            rest_arr = np.array(rest, dtype=np.intp)
+            values = _tail_values(np, columns, p_arr[rest_arr], d_arr[rest_arr], t, partial,
+                                  (obj_type,))[obj_type]
+            feasible = _tail_feasible(position, rest, before) if before is not None else None
+            if feasible is None:
+                leaves += len(values)
+            else:
+                leaves += int(feasible.sum())
+                values = np.where(feasible, values, np.iinfo(np.int64).max)
+            i = int(values.argmin())
+            if values[i] < best_value:
+                best_value = int(values[i])
+                best_order = prefix + rest_arr[perms[i]].tolist()
+        return best_order, best_value, leaves
+
+    order = [0] * n
+    placed = [False] * n
+    last = n - 2
+    if before is None:
+        before = [0] * n
+
+    def dfs(k: int, t: int, mask: int, value: int) -> None:
+        nonlocal best_order, best_value, leaves
+        if k == last:
+            a = placed.index(False)
+            b = placed.index(False, a + 1)
+            for x, y in ((a, b), (b, a)):
+                if (before[x] >> y) & 1:
+                    continue
+                leaves += 1
+                c = t + p[x]
+                v = add(add(value, c, x), c + p[y], y)
+                if v < best_value:
+                    best_value = v
+                    order[k] = x
+                    order[k + 1] = y
+                    best_order = order[:]
+            return
+        for j in range(n):
+            if placed[j] or before[j] & ~mask:
+                continue
+            c = t + p[j]
+            placed[j] = True
+            order[k] = j
+            dfs(k + 1, c, mask | (1 << j), add(value, c, j))
+            placed[j] = False
+
+    dfs(0, 0, 0, 0)
+    return best_order, int(best_value), leaves
+
+
+def solve_by_subset_dp(tasks: List[Task], obj_type: ObjectiveType,
+                       initial_order: Optional[List[Task]] = None,
+                       control: Optional[SearchControl] = None,
+                       precedence: Optional[Sequence[int]] = None) -> Tuple[List[Task], int, int]:
+    """
+    部分集合DP（O(2^n · n)）で厳密解を求める。
+    集合 S を先に処理したときの完了時刻は Σ_{j∈S} p_j で順序に依存しないため、
+    dp[S + j] = min dp[S] ⊕ cost_j(P(S) + p_j)（⊕ は最大遅延なら max、それ以外は +）を
+    小さい集合から前向きに更新する。precedence（dominance_precedence の結果）があれば、
+    前に置くべきタスクがすべて S に入っている j だけを足すので、先行関係を満たす集合しか作らない。
+    DP は途中に暫定解を持たないので、control で中止されたら initial_order（なければ入力順）を返す。
+    表は array / bytearray で持つ（1状態あたり 17 バイト）。DP_MAX_TASKS を超えたら ValueError。
+    返り値: (最適順序, 目的関数値, 探索した状態数)
+    """
+    n = len(tasks)
+    if n == 0:
+        return [], 0, 1
+    if n > DP_MAX_TASKS:
+        raise ValueError(f"部分集合DPは{DP_MAX_TASKS}タスクまでです（{n}タスク）")
+
+    durations = [t.duration for t in tasks]
+    deadlines = [t.deadline for t in tasks]
+    full = (1 << n) - 1
+    use_max = obj_type == ObjectiveType.MAX_TARDINESS
+    before = precedence or [0] * n
+
+    dp = array("q", [-1]) * (full + 1)  # -1 はまだ作っていない（先行関係を満たさない）集合
+    dp[0] = 0
+    # 集合の処理時間合計 P(S): j 番目のビットを足すと、それまでの表の後ろに「+ p_j」した表が続く
+    total_time = array("q", [0])
+    for p in durations:
+        total_time.extend([t + p for t in total_time])
+    last = bytearray(full + 1)  # dp[S] で最後に置いたタスクの index
+    bit_index = {1 << j: j for j in range(n)}
+    is_count = obj_type == ObjectiveType.TARDY_COUNT
+    is_completion = obj_type == ObjectiveType.TOTAL_COMPLETION
+    states = 0
+
+    for mask in range(full):
+        if control is not None and mask % SearchControl.CHECK_INTERVAL == 0 and mask:
+            if control.cancelled:
+                fallback = list(initial_order) if initial_order is not None else list(tasks)
+                return fallback, calculate_objective(fallback, obj_type), states
+            control.report(list(initial_order or []), None, states, mask / full)
+        prev = dp[mask]
+        if prev < 0:
+            continue
+        states += 1
+        t0 = total_time[mask]
+        outside = full ^ mask
+        m = outside
+        while m:
+            low = m & -m
+            m ^= low
+            j = bit_index[low]
+            if before[j] & outside:
+                continue
+            t = t0 + durations[j]
+            if is_completion:
+                c = t
+            else:
+                c = t - deadlines[j]
+                if c < 0:
+                    c = 0
+                elif is_count and c > 0:
+                    c = 1
+            if use_max:
+                v = prev if prev > c else c
+            else:
+                v = prev + c
+            nxt = mask | low
+            cur = dp[nxt]
+            if cur < 0 or v < cur:
+                dp[nxt] = v
+                last[nxt] = j
+
+    # 復元（後ろから）
+    order: List[Task] = []
+    mask = full
+    while mask:
+        j = last[mask]
+        order.append(tasks[j])
+        mask ^= 1 << j
+    order.reverse()
+
+    return order, dp[full], states + 1
+
+
+def solve_by_branch_and_bound(tasks: List[Task], obj_type: ObjectiveType,
+                              initial_order: Optional[List[Task]] = None,
+                              control: Optional[SearchControl] = None,
+                              precedence: Optional[Sequence[int]] = None) -> Tuple[List[Task], int, int]:
+    """
+    分枝限定法（深さ優先）で厳密解を求める。
+    先頭から1つずつタスクを確定し、「確定済みの値 + 残りタスクの下界」が
+    暫定解（initial_order、なければEDF順）以上になる枝を刈り込む。
+    precedence（dominance_precedence の結果）があれば、前に置くべきタスクが揃ったものだけ分枝する。
+    control で中止されたら、その時点の暫定解を返す。
+    返り値: (最適順序, 目的関数値, 訪問したノード数)
+    """
+    n = len(tasks)
+    if n == 0:
+        return [], 0, 1
+
+    durations = [t.duration for t in tasks]
+    deadlines = [t.deadline for t in tasks]
+    edd = sorted(range(n), key=lambda j: (deadlines[j], durations[j]))
+    spt = sorted(range(n), key=lambda j: (durations[j], deadlines[j]))
+    use_max = obj_type == ObjectiveType.MAX_TARDINESS
+    is_count = obj_type == ObjectiveType.TARDY_COUNT
+    is_completion = obj_type == ObjectiveType.TOTAL_COMPLETION
+    # 子ノードは有望そうな順に展開（完了時刻はSPT、それ以外はEDF）
+    branch_order = spt if is_completion else edd
+
+    if initial_order is None:
+        initial_order = [tasks[j] for j in edd]
+    best_order: List[Task] = list(initial_order)
+    best_value = calculate_objective(best_order, obj_type)
+
+    before = precedence or [0] * n
+    placed = [False] * n
+    prefix: List[int] = []
+    nodes = 0
+    explored = 0.0  # 調べ終えた（刈り込んだ）部分木が順列空間に占める割合
+
+    def lower_bound(t: int, value: int) -> int:
+        """確定済みの値 value と時刻 t から、残りを含めた目的関数値の下界を返す"""
+        if obj_type == ObjectiveType.TOTAL_TARDINESS:
+            # k番目に早い完了時刻（SPT）と k番目に早い締切（EDF）を組にする
+            rem_deadlines = [deadlines[j] for j in edd if not placed[j]]
+            lb = value
+            c = t
+            k = 0
+            for j in spt:
+                if placed[j]:
+                    continue
+                c += durations[j]
+                if c > rem_deadlines[k]:
+                    lb += c - rem_deadlines[k]
+                k += 1
+            return lb
+        if use_max:
+            # 残りをEDF順に並べたときの最大遅延（残りに対しては厳密）
+            lb = value
+            c = t
+            for j in edd:
+                if placed[j]:
+                    continue
+                c += durations[j]
+                if c - deadlines[j] > lb:
+                    lb = c - deadlines[j]
+            return lb
+        if is_count:
+            # 今すぐ始めても間に合わないタスクは必ず遅延する
+            return value + sum(1 for j in range(n) if not placed[j] and t + durations[j] > deadlines[j])
+        # 総完了時刻: 残りをSPT順に並べた値（残りに対しては厳密）
+        lb = value
+        c = t
+        for j in spt:
+            if placed[j]:
+                continue
+            c += durations[j]
+            lb += c
+        return lb
+
+    def step_cost(j: int, c: int) -> int:
+        """タスク j が時刻 c に完了したときのコスト"""
+        if is_completion:
+            return c
+        cost = c - deadlines[j]
+        if cost <= 0:
+            return 0
+        return 1 if is_count else cost
+
+    def combine(a: int, b: int) -> int:
+        return (a if a > b else b) if use_max else a + b
+
+    # 同じ集合を処理済みなら時刻も同じ → 最後のタスクも同じで、より良い値で
+    # 訪問済みの状態は刈り込める（最後のタスクは隣接交換の判定に使うためキーに含める）
+    seen: dict = {}
+
+    def dfs(t: int, value: int, mask: int, share: float) -> None:
+        """share: このノード以下の順列が全体に占める割合"""
+        nonlocal best_order, best_value, nodes, explored
+        nodes += 1
+        if control is not None and nodes % SearchControl.CHECK_INTERVAL == 0:
+            if control.cancelled:
+                raise _SearchCancelled
+            control.report(best_order, best_value, nodes, explored)
+        if len(prefix) == n:
+            explored += share
+            if value < best_value:
+                best_value = value
+                best_order = [tasks[j] for j in prefix]
+            return
+        last = prefix[-1] if prefix else -1
+        key = (mask, last)
+        prev_seen = seen.get(key)
+        if prev_seen is not None and prev_seen <= value:
+            explored += share
+            return
+        if len(seen) < BNB_MEMO_LIMIT or prev_seen is not None:
+            seen[key] = value
+        if lower_bound(t, value) >= best_value:
+            explored += share
+            return
+
+        child_share = share / (n - len(prefix))
+        last_start = t - durations[last] if last >= 0 else 0
+        for j in branch_order:
+            if placed[j]:
+                continue
+            if before[j] & ~mask:
+                explored += child_share
+                continue
+            c = t + durations[j]
+            cost = step_cost(j, c)
+            new_value = combine(value, cost)
+            if new_value >= best_value:
+                explored += child_share
+                continue
+            if last >= 0 and not (before[j] >> last) & 1:
+                # 隣接交換: 直前のタスクと入れ替えた方が良い（同点なら index の小さい方を先に）なら不要
+                # （先行関係で順番が決まっている組は入れ替えられないので対象外）
+                here = combine(step_cost(last, t), cost)
+                swapped = combine(step_cost(j, last_start + durations[j]), step_cost(last, c))
+                if swapped < here or (swapped == here and j < last):
+                    explored += child_share
+                    continue
+            placed[j] = True
+            prefix.append(j)
+            dfs(c, new_value, mask | (1 << j), child_share)
+            prefix.pop()
+            placed[j] = False
+
+    try:
+        dfs(0, 0, 0, 1.0)
+    except _SearchCancelled:
+        pass
+    return best_order, best_value, nodes
+
+
+LAWLER_MAX_TASKS = 60  # 分解法で扱う上限（部分問題の数は総所要時間とともに増える）
+
+
+def solve_by_decomposition(tasks: List[Task], initial_order: Optional[List[Task]] = None,
+                           control: Optional[SearchControl] = None) -> Tuple[List[Task], int, int]:
+    """
+    Lawler の分解法で総遅延時間の厳密解を求める（擬多項式時間 O(n^4 · Σp)）。
+    タスクを締切順に並べると、最も長いタスク k について「締切順で k から s 番目まで（k を除く）を
+    k の前に、それより後ろを k の後に置く」最適解がある（s ≥ k）。k の置き場所 s ごとに
+    前後2つの部分問題へ分け、(締切順の区間, 最も長いタスク, 開始時刻) をキーにメモ化する。
+    s の後ろのタスクの締切が k の完了時刻以前なら、その s は試さない（Emmons の定理1）。
+    締切順に並べて全部間に合う部分問題は、それ以上分けずに遅延 0 とする。
+    control で中止されたら initial_order（なければ締切順）を返す。
+    返り値: (最適順序, 総遅延時間, 解いた部分問題の数)
+    """
+    n = len(tasks)
+    if n == 0:
+        return [], 0, 1
+
+    edd = sorted(range(n), key=lambda j: (tasks[j].deadline, tasks[j].duration, j))
+    p = [tasks[j].duration for j in edd]
+    d = [tasks[j].deadline for j in edd]
+    # 長さの順位（同じ長さなら締切順で後ろの方を長いとみなし、最も長いタスクを1つに決める）
+    rank = [0] * n
+    for r, i in enumerate(sorted(range(n), key=lambda i: (p[i], i))):
+        rank[i] = r
+
+    memo: Dict[Tuple[int, int, int, int], Tuple[int, int]] = {}  # キー -> (総遅延時間, k の後ろの境界 s)
+    explored = 0.0  # 最上位で調べ終えた k の置き場所の割合（進捗表示用）
+
+    def members_of(lo: int, hi: int, cap: int) -> List[int]:
+        """締切順の位置 lo..hi-1 のうち、長さの順位が cap 未満のタスク"""
+        return [i for i in range(lo, hi) if rank[i] < cap]
+
+    def solve(lo: int, hi: int, cap: int, t: int) -> int:
+        nonlocal explored
+        members = members_of(lo, hi, cap)
+        if not members:
+            return 0
+        k = max(members, key=rank.__getitem__)
+        key = (members[0], members[-1], k, t)
+        hit = memo.get(key)
+        if hit is not None:
+            return hit[0]
+
+        if control is not None and len(memo) % SearchControl.CHECK_INTERVAL == 0:
+            if control.cancelled:
+                raise _SearchCancelled
+            control.report(fallback, None, len(memo), explored)
+
+        c = t
+        for i in members:
+            c += p[i]
+            if c > d[i]:
+                break
+        else:
+            memo[key] = (0, -1)
+            return 0
+
+        top = lo == 0 and hi == n and cap == n
+        completion = t + p[k] + sum(p[i] for i in members if i < k)
+        after_k = [i for i in members if i >= k]
+        best = math.inf
+        best_split = k
+        for pos, s in enumerate(after_k):
+            if s != k:
+                completion += p[s]
+            if pos + 1 < len(after_k) and d[after_k[pos + 1]] <= completion:
+                # 次のタスクは k より短く、k の完了までに締切が来るので k の前に置いてよい（Emmons の定理1）
+                continue
+            value = (solve(members[0], s + 1, rank[k], t) + max(0, completion - d[k])
+                     + solve(s + 1, members[-1] + 1, rank[k], completion))
+            if value < best:
+                best = value
+                best_split = s
+            if top:
+                explored = (pos + 1) / len(after_k)
+        memo[key] = (best, best_split)
+        return best
+
+    def build(lo: int, hi: int, cap: int, t: int) -> List[int]:
+        """メモに残した境界 s をたどって順序を復元する"""
+        members = members_of(lo, hi, cap)
+        if not members:
+            return []
+        k = max(members, key=rank.__getitem__)
+        _, s = memo[(members[0], members[-1], k, t)]
+        if s < 0:
+            return members
+        before = build(members[0], s + 1, rank[k], t)
+        completion = t + sum(p[i] for i in before) + p[k]
+        return before + [k] + build(s + 1, members[-1] + 1, rank[k], completion)
+
+    fallback = list(initial_order) if initial_order is not None else [tasks[j] for j in edd]
+    try:
+        value = solve(0, n, n, 0)
+    except _SearchCancelled:
+        return fallback, calculate_objective(fallback, ObjectiveType.TOTAL_TARDINESS), len(memo)
+    order = [tasks[edd[i]] for i in build(0, n, n, 0)]
+    return order, value, len(memo)
+
+
+# -----------------------------
+# Metaheuristics (time-budgeted)
+# -----------------------------
+METAHEURISTIC_BUDGET = 0.5   # 既定の計算時間（秒）
+MOVE_WINDOW = 64             # 近傍移動で i と j を離す最大距離（評価区間の長さを抑える）
+METAHEURISTIC_METHODS = ("anneal", "tabu", "genetic")
+
+
+class _IncrementalOrder:
+    """
+    index 順序と累積完了時刻・位置ごとのコストを保持し、
+    swap / insertion 移動を変化する区間 lo..hi だけで評価・適用する。
+    最大遅延では区間の外側のコスト最大を前後からの累積最大で持ち、評価を区間の長さだけにする。
+    """
+    SWAP = 0
+    INSERT = 1
+
+    def __init__(self, durations: Sequence[int], deadlines: Sequence[int], order: Iterable[int],
+                 obj_type: ObjectiveType):
+        self.durations = durations
+        self.deadlines = deadlines
+        self.order = list(order)
+        self.use_max = obj_type == ObjectiveType.MAX_TARDINESS
+        self.is_count = obj_type == ObjectiveType.TARDY_COUNT
+        self.is_completion = obj_type == ObjectiveType.TOTAL_COMPLETION
+        n = len(self.order)
+        self.ends = [0] * (n + 1)  # ends[k] = 先頭 k 個の完了時刻
+        self.costs = self.segment_costs(0, self.order)
+        for k, j in enumerate(self.order):
+            self.ends[k + 1] = self.ends[k] + durations[j]
+        self.value = max(self.costs, default=0) if self.use_max else sum(self.costs)
+        if self.use_max:
+            self.head_max = [0] * (n + 1)  # head_max[k] = 位置 < k のコスト最大
+            self.tail_max = [0] * (n + 1)  # tail_max[k] = 位置 >= k のコスト最大
+            self.refresh_max(0, n)
+
+    def refresh_max(self, lo: int, hi: int) -> None:
+        """位置 lo..hi-1 のコストが変わったときに累積最大を直す（区間の外は値が変わらなくなったら止める）"""
+        costs = self.costs
+        head = self.head_max
+        tail = self.tail_max
+        for k in range(lo, len(costs)):
+            m = head[k] if head[k] > costs[k] else costs[k]
+            if k >= hi and head[k + 1] == m:
+                break
+            head[k + 1] = m
+        for k in range(hi - 1, -1, -1):
+            m = tail[k + 1] if tail[k + 1] > costs[k] else costs[k]
+            if k < lo and tail[k] == m:
+                break
+            tail[k] = m
+
+    def segment_costs(self, lo: int, segment: List[int]) -> List[int]:
+        """位置 lo から segment を並べたときの各位置のコスト"""
+        durations = self.durations
+        deadlines = self.deadlines
+        t = self.ends[lo]
+        costs = []
+        for j in segment:
+            t += durations[j]
+            if self.is_completion:
+                costs.append(t)
+            else:
+                late = t - deadlines[j]
+                costs.append(0 if late <= 0 else (1 if self.is_count else late))
+        return costs
+
+    def moved_segment(self, kind: int, i: int, j: int) -> Tuple[int, List[int]]:
+        """移動後に変化する区間の開始位置と、その区間の新しい並び"""
+        order = self.order
+        lo, hi = (i, j) if i < j else (j, i)
+        if kind == self.SWAP:
+            segment = order[lo:hi + 1]
+            segment[0], segment[-1] = segment[-1], segment[0]
+        elif i < j:  # i のタスクを j の位置へ後ろ倒し
+            segment = order[i + 1:j + 1]
+            segment.append(order[i])
+        else:        # i のタスクを j の位置へ前倒し
+            segment = [order[i]]
+            segment.extend(order[j:i])
+        return lo, segment
+
+    def evaluate(self, kind: int, i: int, j: int) -> Tuple[int, int, List[int], List[int]]:
+        """移動後の目的関数値を返す（適用用に区間の情報も返す）"""
+        lo, segment = self.moved_segment(kind, i, j)
+        new_costs = self.segment_costs(lo, segment)
+        hi = lo + len(segment)
+        if self.use_max:
+            value = max(self.head_max[lo], max(new_costs), self.tail_max[hi])
+        else:
+            value = self.value - sum(self.costs[lo:hi]) + sum(new_costs)
+        return value, lo, segment, new_costs
+
+    def apply(self, value: int, lo: int, segment: List[int], new_costs: List[int]) -> None:
+        hi = lo + len(segment)
+        self.order[lo:hi] = segment
+        self.costs[lo:hi] = new_costs
+        ends = self.ends
+        durations = self.durations
+        for k in range(lo, hi - 1):  # 区間の最後の完了時刻は変わらない
+            ends[k + 1] = ends[k] + durations[segment[k - lo]]
+        self.value = value
+        if self.use_max:
+            self.refresh_max(lo, hi)
+
+    def random_move(self, rng: random.Random, window: int) -> Tuple[int, int, int]:
+        n = len(self.order)
+        window = max(1, window)  # 0 だと i 以外の候補がなくなる
+        i = rng.randrange(n)
+        # [lo, hi] から i 以外を選ぶ（i 以上なら1つずらす）
+        lo, hi = max(0, i - window), min(n - 1, i + window)
+        j = rng.randint(lo, hi - 1)
+        if j >= i:
+            j += 1
+        kind = self.SWAP if rng.random() < 0.5 else self.INSERT
+        return kind, i, j
+
+
+def anneal_order(durations: Sequence[int], deadlines: Sequence[int], order: Iterable[int],
+                 obj_type: ObjectiveType, time_budget: float = METAHEURISTIC_BUDGET,
+                 seed: Optional[int] = None, window: int = MOVE_WINDOW,
+                 profile: Optional[SolverProfile] = None) -> Tuple[List[int], int, int]:
+    """
+    焼きなまし法（swap / insertion 移動）。time_budget 秒で打ち切り、それまでの最良解を返す。
+    温度は初期近傍の平均悪化量から決め、経過時間に応じて指数的に下げる。
+    profile を渡すと、最良解を更新するたびに記録する。
+    返り値: (最良の index 順序, 目的関数値, 評価した移動数)
+    """
+    with _phase(profile, "init"):
+        state = _IncrementalOrder(durations, deadlines, order, obj_type)
+    best_order = state.order[:]
+    best_value = state.value
+    if profile is not None:
+        profile.improved(best_value, 0)
+    if len(best_order) < 2:
+        return best_order, best_value, 0
+
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    deadline = start + time_budget
+
+    # 初期温度: ランダムな近傍の平均悪化量
+    with _phase(profile, "calibrate"):
+        worse = [state.evaluate(*state.random_move(rng, window))[0] - state.value for _ in range(100)]
+    worse = [d for d in worse if d > 0]
+    t_start = max(sum(worse) / len(worse), 1.0) if worse else 1.0
+    t_end = t_start * 1e-3
+    temperature = t_start
+    search_start = time.perf_counter()
+
+    moves = 0
+    while True:
+        if moves % 256 == 0:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            temperature = t_start * (t_end / t_start) ** ((now - start) / time_budget)
+        moves += 1
+        value, lo, segment, new_costs = state.evaluate(*state.random_move(rng, window))
+        delta = value - state.value
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            state.apply(value, lo, segment, new_costs)
+            if value < best_value:
+                best_value = value
+                best_order = state.order[:]
+                if profile is not None:
+                    profile.improved(value, moves)
+
+    if profile is not None:
+        profile.add_phase("search", time.perf_counter() - search_start)
+    return best_order, best_value, moves
+
+
+def tabu_search_order(durations: Sequence[int], deadlines: Sequence[int], order: Iterable[int],
+                      obj_type: ObjectiveType, time_budget: float = METAHEURISTIC_BUDGET,
+                      seed: Optional[int] = None, window: int = MOVE_WINDOW,
+                      sample_size: int = 32, tenure: int = 16,
+                      profile: Optional[SolverProfile] = None) -> Tuple[List[int], int, int]:
+    """
+    タブー探索（swap / insertion 移動）。毎回 sample_size 個の近傍から最良の移動を
+    悪化していても採用し、動かしたタスク（swap なら入れ替えた2つ）を tenure 回の間タブーにする
+    （タブーのタスクを動かす移動は、最良解を更新するときだけ許可）。time_budget 秒で打ち切り、最良解を返す。
+    profile を渡すと、最良解を更新するたびに記録する。
+    返り値: (最良の index 順序, 目的関数値, 評価した移動数)
+    """
+    with _phase(profile, "init"):
+        state = _IncrementalOrder(durations, deadlines, order, obj_type)
+    best_order = state.order[:]
+    best_value = state.value
+    if profile is not None:
+        profile.improved(best_value, 0)
+    if len(best_order) < 2:
+        return best_order, best_value, 0
+
+    rng = random.Random(seed)
+    search_start = time.perf_counter()
+    deadline = search_start + time_budget
+    tabu_until: Dict[int, int] = {}  # タスク index -> タブーが解ける反復回数
+
+    moves = 0
+    iteration = 0
+    while time.perf_counter() < deadline:
+        iteration += 1
+        chosen = None
+        for _ in range(sample_size):
+            kind, i, j = state.random_move(rng, window)
+            moves += 1
+            value, lo, segment, new_costs = state.evaluate(kind, i, j)
+            tasks = (state.order[i], state.order[j]) if kind == state.SWAP else (state.order[i],)
+            if value >= best_value and any(tabu_until.get(t, 0) > iteration for t in tasks):
+                continue
+            if chosen is None or value < chosen[0]:
+                chosen = (value, lo, segment, new_costs, tasks)
+        if chosen is None:
+            continue
+        value, lo, segment, new_costs, tasks = chosen
+        state.apply(value, lo, segment, new_costs)
+        for t in tasks:
+            tabu_until[t] = iteration + tenure
+        if value < best_value:
+            best_value = value
+            best_order = state.order[:]
+            if profile is not None:
+                profile.improved(value, moves)
+
+    if profile is not None:
+        profile.add_phase("search", time.perf_counter() - search_start)
+    return best_order, best_value, moves
+
+
+# -----------------------------
+# Warm Start（前回の解から再最適化）
+# -----------------------------
+WARM_START_RADIUS = 12     # 変更した位置の前後何個までを局所探索するか
+WARM_START_MAX_PASSES = 50
+
+
+def insertion_values(durations: Sequence[int], deadlines: Sequence[int], order: Sequence[int], j: int,
+                     obj_type: ObjectiveType) -> List[int]:
+    """
+    order の各位置 k（0..n）にタスク j を挿入したときの目的関数値をまとめて O(n) で計算する。
+    k 以降のタスクは一律 p_j だけ後ろにずれるので、「ずらした後のコスト」の後ろからの累積を使う。
+    """
+    n = len(order)
+    p = durations[j]
+    use_max = obj_type == ObjectiveType.MAX_TARDINESS
+    is_count = obj_type == ObjectiveType.TARDY_COUNT
+    is_completion = obj_type == ObjectiveType.TOTAL_COMPLETION
+
+    def cost(c: int, d: int) -> int:
+        if is_completion:
+            return c
+        late = c - d
+        return 0 if late <= 0 else (1 if is_count else late)
+
+    ends = [0] * (n + 1)
+    head = [0] * (n + 1)  # 先頭 k 個のコスト（ずらさない）
+    for k, i in enumerate(order):
+        ends[k + 1] = ends[k] + durations[i]
+        c = cost(ends[k + 1], deadlines[i])
+        head[k + 1] = (head[k] if head[k] > c else c) if use_max else head[k] + c
+    tail = [0] * (n + 1)  # k 番目以降を p だけずらしたときのコスト
+    for k in range(n - 1, -1, -1):
+        c = cost(ends[k + 1] + p, deadlines[order[k]])
+        tail[k] = (tail[k + 1] if tail[k + 1] > c else c) if use_max else tail[k + 1] + c
+
+    d = deadlines[j]
+    if use_max:
+        return [max(head[k], cost(ends[k] + p, d), tail[k]) for k in range(n + 1)]
+    return [head[k] + cost(ends[k] + p, d) + tail[k] for k in range(n + 1)]
+
+
+def repair_order(durations: Sequence[int], deadlines: Sequence[int], order: Iterable[int],
+                 positions: Iterable[int], obj_type: ObjectiveType, radius: int = WARM_START_RADIUS,
+                 max_passes: int = WARM_START_MAX_PASSES) -> Tuple[List[int], int, int]:
+    """
+    positions の前後 radius 以内だけで swap / insertion 移動の改善を繰り返す（first-improvement）。
+    移動は変化する区間だけで評価するので、1回の評価は O(radius)。
+    返り値: (改善後の index 順序, 目的関数値, 評価した移動数)
+    """
+    state = _IncrementalOrder(durations, deadlines, order, obj_type)
+    n = len(state.order)
+    # 変更位置の周りの区間（重なるものはまとめる）
+    windows: List[List[int]] = []
+    for pos in sorted(set(positions)):
+        lo, hi = max(0, pos - radius), min(n - 1, pos + radius)
+        if windows and lo <= windows[-1][1] + 1:
+            windows[-1][1] = max(windows[-1][1], hi)
+        else:
+            windows.append([lo, hi])
+
+    evaluated = 0
+    for _ in range(max_passes):
+        improved = False
+        for lo, hi in windows:
+            for i in range(lo, hi + 1):
+                for j in range(lo, hi + 1):
+                    if i == j:
+                        continue
+                    kinds = (state.SWAP, state.INSERT) if i < j else (state.INSERT,)
+                    for kind in kinds:
+                        evaluated += 1
+                        value, seg_lo, segment, new_costs = state.evaluate(kind, i, j)
+                        if value < state.value:
+                            state.apply(value, seg_lo, segment, new_costs)
+                            improved = True
+        if not improved:
+            break
+    return state.order, state.value, evaluated
+
+
+class WarmStartState:
+    """
+    前回の結果の順序（table の index 列）を、タスクの追加・削除・変更に合わせて保守する。
+    削除したタスクは順序から抜き、追加・変更したタスクは再最適化のときに最良の位置へ挿入する。
+    """
+
+    def __init__(self, obj_type: ObjectiveType, orders: Dict[str, Sequence[int]]):
+        self.obj_type = obj_type
+        self.orders: Dict[str, List[int]] = {name: list(order) for name, order in orders.items()}
+        self.touched: Dict[str, List[int]] = {name: [] for name in orders}  # 削除で詰めた位置
+        self.inserted: List[int] = []  # まだ順序に入っていないタスクの index
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted) or any(self.touched.values())
+
+    def _remove(self, idx: int) -> None:
+        if idx in self.inserted:
+            self.inserted.remove(idx)
+            return
+        for name, order in self.orders.items():
+            pos = order.index(idx)
+            del order[pos]
+            self.touched[name] = [p - 1 if p > pos else p for p in self.touched[name]] + [pos]
+
+    def task_added(self, idx: int) -> None:
+        self.inserted.append(idx)
+
+    def task_edited(self, idx: int) -> None:
+        self._remove(idx)
+        self.inserted.append(idx)
+
+    def task_deleted(self, idx: int) -> None:
+        self._remove(idx)
+        # 後ろのタスクの index が1つずつ詰まる
+        for order in self.orders.values():
+            order[:] = [i - 1 if i > idx else i for i in order]
+        self.inserted = [i - 1 if i > idx else i for i in self.inserted]
+
+    def solve(self, table: TaskTable, name: str) -> ScheduleResult:
+        """name の順序から再最適化した結果"""
+        return run_warm_start(table, self.obj_type, self.orders[name], self.inserted, self.touched[name])
+
+
+# -----------------------------
+# Genetic Algorithm（集団を世代ごとにまとめて評価する）
+# -----------------------------
+GA_POPULATION = 40        # 集団の大きさ
+GA_GENERATIONS = 200      # 世代数の上限
+GA_ELITE = 2              # そのまま次の世代に残す上位の数
+GA_MUTATION_RATE = 0.3    # 子に突然変異（近傍移動1回）を起こす確率
+GA_POLISH_POSITIONS = 4   # エリートの局所改善で見る位置の数（0 なら局所改善しない）
+GA_POLISH_RADIUS = 4      # 局所改善で位置の前後何個までを動かすか
+
+
+def order_crossover(parent1: Sequence[int], parent2: Sequence[int], a: int, b: int) -> List[int]:
+    """
+    順序交叉（OX）: parent1 の位置 a..b-1 をそのまま子に残し、
+    残りの位置を b から順に（末尾の次は先頭へ）parent2 の並びで埋める。
+    """
+    n = len(parent1)
+    segment = list(parent1[a:b])
+    used = bytearray(n)
+    for j in segment:
+        used[j] = 1
+    rest = [j for j in chain(parent2[b:], parent2[:b]) if not used[j]]
+    return rest[n - b:] + segment + rest[:n - b]
+
+
+def _mutate(order: List[int], rng: random.Random, window: int) -> None:
+    """window 以内の2つの位置で swap か insertion を1回行う"""
+    n = len(order)
+    i = rng.randrange(n)
+    j = rng.randint(max(0, i - window), min(n - 1, i + window))
+    if i == j:
+        return
+    if rng.random() < 0.5:
+        order[i], order[j] = order[j], order[i]
+    else:
+        order.insert(j, order.pop(i))
+
+
+def genetic_order(durations: Sequence[int], deadlines: Sequence[int], order: Iterable[int],
+                  obj_type: ObjectiveType, population_size: int = GA_POPULATION,
+                  generations: int = GA_GENERATIONS, time_budget: Optional[float] = None,
+                  seed: Optional[int] = None, elite: int = GA_ELITE, mutation_rate: float = GA_MUTATION_RATE,
+                  polish_positions: int = GA_POLISH_POSITIONS, window: int = MOVE_WINDOW,
+                  profile: Optional[SolverProfile] = None) -> Tuple[List[int], int, int]:
+    """
+    遺伝的アルゴリズム（メメティック）。
+    初期集団は order・EDD・SPT と、それらを近傍の swap で崩したもの。
+    毎世代、上位 elite 個を残し（局所改善してから）、二者択一のトーナメントで選んだ親から
+    順序交叉（OX）と突然変異で子を作り、子の集団を evaluate_orders_batch でまとめて評価する。
+    エリートの局所改善は repair_order（ランダムな polish_positions 個の位置の前後だけを探索）で、
+    全ペアを調べる swap改善は1周 O(n²) になり大きなインスタンスでは使えないため。
+    generations 世代か time_budget 秒（指定したとき）のどちらかで打ち切る。
+    返り値: (最良の index 順序, 目的関数値, 評価した順序と移動の数)
+    """
+    base = list(order)
+    n = len(base)
+    if n < 2:
+        value = evaluate_orders_batch(durations, deadlines, [base])[obj_type][0] if n else 0
+        return base, int(value), 1
+
+    rng = random.Random(seed)
+    _load_numpy()  # 初回の numpy の import を time_budget に含めない
+    stop_at = time.perf_counter() + time_budget if time_budget is not None else None
+    population_size = max(population_size, elite + 2)
+    elite = max(1, elite)
+
+    def evaluate(orders: List[List[int]]) -> List[int]:
+        with _phase(profile, "evaluate"):
+            return [int(v) for v in evaluate_orders_batch(durations, deadlines, orders)[obj_type]]
+
+    # 初期集団: 良い順序を種にして、近傍の swap で崩して多様にする
+    with _phase(profile, "init"):
+        seeds: List[List[int]] = []
+        for candidate in (base, sorted(base, key=lambda j: (deadlines[j], durations[j])),
+                          sorted(base, key=lambda j: (durations[j], deadlines[j]))):
+            if candidate not in seeds:
+                seeds.append(candidate)
+        population = [s[:] for s in seeds[:population_size]]
+        perturb = max(2, n // 20)
+        while len(population) < population_size:
+            individual = seeds[len(population) % len(seeds)][:]
+            for _ in range(perturb):
+                i = rng.randrange(n)
+                j = rng.randint(max(0, i - window), min(n - 1, i + window))
+                individual[i], individual[j] = individual[j], individual[i]
+            population.append(individual)
+    values = evaluate(population)
+    evaluations = len(population)
+
+    best = min(range(population_size), key=values.__getitem__)
+    best_order, best_value = population[best][:], values[best]
+    if profile is not None:
+        profile.improved(best_value, evaluations)
+
+    def tournament() -> List[int]:
+        a, b = rng.randrange(population_size), rng.randrange(population_size)
+        return population[a] if values[a] <= values[b] else population[b]
+
+    for _ in range(generations):
+        if stop_at is not None and time.perf_counter() > stop_at:
+            break
+        ranked = sorted(range(population_size), key=values.__getitem__)
+        next_population = [population[k] for k in ranked[:elite]]
+        next_values = [values[k] for k in ranked[:elite]]
+
+        if polish_positions > 0:
+            with _phase(profile, "polish"):
+                for e, individual in enumerate(next_population):
+                    positions = [rng.randrange(n) for _ in range(polish_positions)]
+                    polished, value, evaluated = repair_order(durations, deadlines, individual, positions,
+                                                              obj_type, radius=GA_POLISH_RADIUS, max_passes=1)
+                    evaluations += evaluated
+                    next_population[e], next_values[e] = polished, value
+
+        with _phase(profile, "crossover"):
+            children = []
+            for _ in range(population_size - elite):
+                a, b = sorted(rng.sample(range(n + 1), 2))
+                child = order_crossover(tournament(), tournament(), a, b)
+                if rng.random() < mutation_rate:
+                    _mutate(child, rng, window)
+                children.append(child)
+        population = next_population + children
+        values = next_values + evaluate(children)
+        evaluations += len(children)
+
+        best = min(range(population_size), key=values.__getitem__)
+        if values[best] < best_value:
+            best_order, best_value = population[best][:], values[best]
+            if profile is not None:
+                profile.improved(best_value, evaluations)
+
+    return best_order, best_value, evaluations
+
+
+# -----------------------------
+# Parallel Exhaustive Search (multi-process)
+# -----------------------------
+PARALLEL_SYNC_INTERVAL = 1024  # 何ノードごとに共有の暫定値を読み直すか
+PARALLEL_MAX_TASKS = 12        # 並列の順列探索を使う上限（超えたら DP / 分解法の方が速い）
+
+_shared_best = None    # ワーカープロセス内で共有する暫定最良値（multiprocessing.Value）
+_shared_cancel = None  # 中止フラグ（multiprocessing.Value、0以外で中止）
+
+
+def _init_parallel_worker(shared_best, shared_cancel=None) -> None:
+    """ワーカープロセスの初期化（共有の暫定最良値と中止フラグを受け取る）"""
+    global _shared_best, _shared_cancel
+    _shared_best = shared_best
+    _shared_cancel = shared_cancel
+
+
+def _search_prefix(prefix: Tuple[int, ...], durations: List[int], deadlines: List[int],
+                   obj_value: str, precedence: Optional[List[int]] = None
+                   ) -> Tuple[int, Optional[List[int]], int]:
+    """
+    先頭を prefix に固定した順列だけを深さ優先で列挙する（ワーカープロセスで実行）。
+    部分順序の値は単調に増えるので、共有の暫定最良値以上になった枝は打ち切る。
+    precedence があれば、前に置くべきタスクが揃ったものだけを置く。
+    中止フラグが立ったら、それまでに見つけた最良解を返す。
+    返り値: (見つけた最良値, その順序の index 列 or None, 訪問したノード数)
+    """
+    obj_type = ObjectiveType(obj_value)
+    n = len(durations)
+    use_max = obj_type == ObjectiveType.MAX_TARDINESS
+    is_count = obj_type == ObjectiveType.TARDY_COUNT
+    is_completion = obj_type == ObjectiveType.TOTAL_COMPLETION
+
+    raw_best = _shared_best.get_obj()
+    raw_cancel = _shared_cancel.get_obj() if _shared_cancel is not None else None
+    bound = raw_best.value
+    best_order: Optional[List[int]] = None
+    nodes = 0
+
+    before = precedence or [0] * n
+    placed = [False] * n
+    order: List[int] = []
+
+    def add(value: int, j: int, c: int) -> int:
+        if is_completion:
+            cost = c
+        else:
+            cost = c - deadlines[j]
+            if cost < 0:
+                cost = 0
+            elif is_count and cost > 0:
+                cost = 1
+        return (value if value > cost else cost) if use_max else value + cost
+
+    def dfs(t: int, mask: int, value: int) -> None:
+        nonlocal bound, best_order, nodes
+        nodes += 1
+        if nodes % PARALLEL_SYNC_INTERVAL == 0:
+            if raw_cancel is not None and raw_cancel.value:
+                raise _SearchCancelled
+            if raw_best.value < bound:
+                bound = raw_best.value
+        if len(order) == n:
+            # value < bound は呼び出し側で確認済み
+            bound = value
+            best_order = order[:]
+            with _shared_best.get_lock():
+                if value < _shared_best.value:
+                    _shared_best.value = value
+            return
+        for j in range(n):
+            if placed[j] or before[j] & ~mask:
+                continue
+            c = t + durations[j]
+            new_value = add(value, j, c)
+            if new_value >= bound:
+                continue
+            placed[j] = True
+            order.append(j)
+            dfs(c, mask | (1 << j), new_value)
+            order.pop()
+            placed[j] = False
+
+    t = 0
+    mask = 0
+    value = 0
+    for j in prefix:
+        t += durations[j]
+        mask |= 1 << j
+        value = add(value, j, t)
+        placed[j] = True
+        order.append(j)
+    if value < bound:
+        try:
+            dfs(t, mask, value)
+        except _SearchCancelled:
+            pass
+
+    return bound, best_order, nodes
+
+
+def parallel_exhaustive_search(tasks: List[Task], obj_type: ObjectiveType,
+                               initial_order: Optional[List[Task]] = None,
+                               workers: Optional[int] = None,
+                               prefix_depth: int = 2,
+                               control: Optional[SearchControl] = None,
+                               precedence: Optional[Sequence[int]] = None) -> Tuple[List[Task], int, int]:
+    """
+    順列空間を先頭 prefix_depth 個のタスクで分割し、プロセスプールで並列に厳密探索する。
+    各ワーカーは共有メモリの暫定最良値を見て枝刈りし、最後に結果をまとめる。
+    precedence があれば、それを満たす prefix だけを投入し、ワーカーも満たす順列だけを列挙する。
+    control があれば prefix が終わるたびに途中経過を通知し、中止時は暫定解を返す。
+    返り値: (最適順序, 目的関数値, 全ワーカーの訪問ノード数の合計)
+    """
+    n = len(tasks)
+    if n == 0:
+        return [], 0, 1
+
+    durations = [t.duration for t in tasks]
+    deadlines = [t.deadline for t in tasks]
+    if initial_order is None:
+        initial_order = sorted(tasks, key=lambda t: t.deadline)
+    best_order: List[Task] = list(initial_order)
+    best_value = calculate_objective(best_order, obj_type)
+
+    # 締切順に並べた prefix から投入すると良い暫定解が早く見つかりやすい
+    edd = sorted(range(n), key=lambda j: (deadlines[j], durations[j]))
+    depth = max(1, min(prefix_depth, n - 1))
+    before = list(precedence) if precedence is not None else [0] * n
+
+    def consistent(prefix: Tuple[int, ...]) -> bool:
+        mask = 0
+        for j in prefix:
+            if before[j] & ~mask:
+                return False
+            mask |= 1 << j
+        return True
+
+    prefixes = [p for p in permutations(edd, depth) if consistent(p)]
+
+    shared_best = multiprocessing.Value("q", best_value)
+    shared_cancel = multiprocessing.Value("b", 0)
+    total_nodes = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_parallel_worker,
+                             initargs=(shared_best, shared_cancel)) as pool:
+        pending = {pool.submit(_search_prefix, p, durations, deadlines, obj_type.value, before)
+                   for p in prefixes}
+        finished = 0
+        while pending:
+            timeout = control.interval if control is not None else None
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for fut in done:
+                value, order_idx, nodes = fut.result()
+                total_nodes += nodes
+                finished += 1
+                if order_idx is not None and value < best_value:
+                    best_value = value
+                    best_order = [tasks[j] for j in order_idx]
+            if control is None:
+                continue
+            if control.cancelled and not shared_cancel.value:
+                # 実行中のワーカーは次の同期点で打ち切り、未着手の prefix は取り消す
+                shared_cancel.value = 1
+                for fut in pending:
+                    fut.cancel()
+                pending = {fut for fut in pending if not fut.cancelled()}
+            control.report(best_order, best_value, total_nodes, finished / len(prefixes))
+
+    return best_order, best_value, total_nodes
+
+
+# -----------------------------
+# Pareto Front（4つの目的関数の非劣解を1回の総当たりで求める）
+# -----------------------------
+PARETO_MAX_TASKS = 10  # 全順列を評価するので 10! ≒ 360万通りまで
+
+ObjectiveVector = Tuple[int, int, int, int]  # ObjectiveType の定義順の4つの値
+
+
+def _dominates_or_equal(a: ObjectiveVector, b: ObjectiveVector) -> bool:
+    """a が b を支配する（すべて以下）か b と等しい"""
+    return a[0] <= b[0] and a[1] <= b[1] and a[2] <= b[2] and a[3] <= b[3]
+
+
+def pareto_front_search(durations: Sequence[int], deadlines: Sequence[int]
+                        ) -> Tuple[List[Tuple[ObjectiveVector, Tuple[int, ...]]], int]:
+    """
+    全順列を1回だけ評価し、4目的の非劣解（同じ値の組は最初の1つ）を集める。
+    numpy があれば exhaustive_search と同じく先頭を深さ優先で列挙して残りを順列表でまとめて評価し、
+    今のフロントに支配される行をブロックごとに落としてから、
+    残りを辞書式順に見て（先に来る行は後の行に支配されない）1点ずつフロントに加える。
+    numpy がなければ BATCH_SIZE 個ずつ評価して1行ずつ確かめる。
+    返り値: ([(目的関数値4つ, index 順序), ...], 評価した順列数)
+    """
+    n = len(durations)
+    front: List[Tuple[ObjectiveVector, Tuple[int, ...]]] = []
+    np = _load_numpy() if n > 0 else None
+
+    def add(vec: ObjectiveVector, order: Tuple[int, ...]) -> None:
+        nonlocal front
+        front = [(f, o) for f, o in front if not _dominates_or_equal(vec, f)]
+        front.append((vec, order))
+
+    if np is None:
+        candidates = 0
+        perms = permutations(range(n))
+        while True:
+            chunk = list(islice(perms, BATCH_SIZE))
+            if not chunk:
+                break
+            candidates += len(chunk)
+            values = evaluate_orders_batch(durations, deadlines, chunk)
+            columns = [values[obj_type] for obj_type in ObjectiveType]
+            for r in range(len(chunk)):
+                vec = (columns[0][r], columns[1][r], columns[2][r], columns[3][r])
+                if not any(_dominates_or_equal(f, vec) for f, _ in front):
+                    add(vec, chunk[r])
+        front.sort()
+        return front, candidates
+
+    tail = min(n, EXHAUSTIVE_TAIL)
+    perms, columns = _tail_table(np, tail)
+    p_arr = np.array(durations, dtype=np.int64)
+    d_arr = np.array(deadlines, dtype=np.int64)
+    for prefix, t, partial, rest in _prefix_blocks(durations, deadlines, n - tail):
+        rest_arr = np.array(rest, dtype=np.intp)
+        values = _tail_values(np, columns, p_arr[rest_arr], d_arr[rest_arr], t, partial, list(ObjectiveType))
+        c0, c1, c2, c3 = (values[obj_type] for obj_type in ObjectiveType)
+        alive = np.ones(len(perms), dtype=bool)
+        for f, _ in front:
+            alive &= ~((c0 >= f[0]) & (c1 >= f[1]) & (c2 >= f[2]) & (c3 >= f[3]))
+        rows = np.flatnonzero(alive)
+        # 辞書式順（同値なら元の順）に並べ、先頭を加えてはそれに支配される行を落とす
+        rows = rows[np.lexsort((c3[rows], c2[rows], c1[rows], c0[rows]))]
+        s0, s1, s2, s3 = c0[rows], c1[rows], c2[rows], c3[rows]
+        while len(rows):
+            vec = (int(s0[0]), int(s1[0]), int(s2[0]), int(s3[0]))
+            add(vec, tuple(prefix + rest_arr[perms[rows[0]]].tolist()))
+            keep = ~((s0 >= vec[0]) & (s1 >= vec[1]) & (s2 >= vec[2]) & (s3 >= vec[3]))
+            rows, s0, s1, s2, s3 = rows[keep], s0[keep], s1[keep], s2[keep], s3[keep]
+
+    front.sort()
+    return front, math.factorial(n)
+
+
+@dataclass
+class ParetoFront:
+    """非劣解の集合と、そこから取り出した各目的関数の最適解"""
+    points: List[Tuple[ObjectiveVector, Tuple[int, ...]]]
+    optima: Dict[ObjectiveType, ScheduleResult]
+    candidates: int
+    computation_time: float
+
+
+def run_pareto(table: TaskTable) -> ParetoFront:
+    """
+    1回の総当たりで4目的のパレートフロントを求め、各目的関数の最適解も返す
+    （ある目的の最適値を取る順序は、フロント上のどれかと同じ値を持つ）。
+    """
+    start = time.perf_counter()
+    points, candidates = pareto_front_search(table.durations, table.deadlines)
+    elapsed = time.perf_counter() - start
+    optima: Dict[ObjectiveType, ScheduleResult] = {}
+    for k, obj_type in enumerate(ObjectiveType):
+        vec, order = min(points, key=lambda p: (p[0][k], p[0]))
+        optima[obj_type] = ScheduleResult(order, vec[k], elapsed, candidates=candidates, obj_type=obj_type,
+                                          table=table)
+    return ParetoFront(points, optima, candidates, elapsed)
+
+
+# -----------------------------
+# Solvers（TaskTable → ScheduleResult）
+# -----------------------------
+# profile（SolverProfile）を渡すと段階ごとの時間などを記録し、結果の profile に付ける
+def _finish(result: ScheduleResult, profile: Optional[SolverProfile]) -> ScheduleResult:
+    return profile.finish(result) if profile is not None else result
+
+
+def run_edf(table: TaskTable, obj_type: ObjectiveType,
+            profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """EDF/EDD: 締切が早い順"""
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    with _phase(profile, "sort"):
+        order = sorted(range(len(table)), key=table.deadlines.__getitem__)
+    with _phase(profile, "evaluate"):
+        obj_value = calculate_objectives_indexed(table, order)[obj_type]
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(order, obj_value, elapsed, candidates=1, obj_type=obj_type, table=table),
+                   profile)
+
+
+def run_spt(table: TaskTable, obj_type: ObjectiveType,
+            profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """SPT: 所要時間が短い順"""
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    with _phase(profile, "sort"):
+        order = sorted(range(len(table)), key=table.durations.__getitem__)
+    with _phase(profile, "evaluate"):
+        obj_value = calculate_objectives_indexed(table, order)[obj_type]
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(order, obj_value, elapsed, candidates=1, obj_type=obj_type, table=table),
+                   profile)
+
+
+def run_edf_improve(table: TaskTable, obj_type: ObjectiveType, best_improvement: bool = False,
+                    time_budget: Optional[float] = None,
+                    profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """EDF → swap改善（ローカル探索、time_budget 秒で打ち切り）"""
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    with _phase(profile, "sort"):
+        base = sorted(range(len(table)), key=table.deadlines.__getitem__)
+    with _phase(profile, "search"):
+        improved, cands = improve_order_by_swaps(table.durations, table.deadlines, base, obj_type,
+                                                 max_iters=6000, best_improvement=best_improvement,
+                                                 time_budget=time_budget, profile=profile)
+    with _phase(profile, "evaluate"):
+        obj_value = calculate_objectives_indexed(table, improved)[obj_type]
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(improved, obj_value, elapsed, candidates=(1 + cands), obj_type=obj_type,
+                                  table=table), profile)
+
+
+def run_spt_improve(table: TaskTable, obj_type: ObjectiveType,
+                    time_budget: Optional[float] = None,
+                    profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """SPT → swap改善（ローカル探索、time_budget 秒で打ち切り）"""
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    with _phase(profile, "sort"):
+        base = sorted(range(len(table)), key=table.durations.__getitem__)
+    with _phase(profile, "search"):
+        improved, cands = improve_order_by_swaps(table.durations, table.deadlines, base, obj_type,
+                                                 max_iters=6000, time_budget=time_budget, profile=profile)
+    with _phase(profile, "evaluate"):
+        obj_value = calculate_objectives_indexed(table, improved)[obj_type]
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(improved, obj_value, elapsed, candidates=(1 + cands), obj_type=obj_type,
+                                  table=table), profile)
+
+
+def run_brute_force(table: TaskTable, obj_type: ObjectiveType,
+                    profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """総当たりで最適解を探す（深さ優先で共通の先頭部分の計算を使い回し、優越規則に反する順序は列挙しない）"""
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    with _phase(profile, "dominance"):
+        precedence = dominance_precedence(table.durations, table.deadlines, obj_type)
+    with _phase(profile, "search"):
+        order, value, candidates = exhaustive_search(table.durations, table.deadlines, obj_type, precedence)
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(order, value, elapsed, candidates=candidates, obj_type=obj_type, table=table),
+                   profile)
+
+
+def run_exact_dp(table: TaskTable, obj_type: ObjectiveType, seed: Optional[ScheduleResult] = None,
+                 control: Optional[SearchControl] = None,
+                 profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """部分集合DPで最適解を求める（candidates=探索した状態数）"""
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    initial = seed.order if seed is not None else None
+    with _phase(profile, "dominance"):
+        precedence = dominance_precedence(table.durations, table.deadlines, obj_type)
+    with _phase(profile, "search"):
+        order, value, states = solve_by_subset_dp(table.tasks(), obj_type, initial_order=initial,
+                                                  control=control, precedence=precedence)
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(order, value, elapsed, candidates=states, obj_type=obj_type), profile)
+
+
+def run_branch_and_bound(table: TaskTable, obj_type: ObjectiveType,
+                         seed: Optional[ScheduleResult] = None,
+                         control: Optional[SearchControl] = None,
+                         profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """分枝限定法で最適解を求める（暫定解は EDF+改善 から開始）"""
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    if seed is None:
+        with _phase(profile, "seed"):
+            seed = run_edf_improve(table, obj_type, time_budget=SWAP_TIME_BUDGET)
+    if profile is not None:
+        profile.improved(seed.obj_value, 0)
+    with _phase(profile, "dominance"):
+        precedence = dominance_precedence(table.durations, table.deadlines, obj_type)
+    with _phase(profile, "search"):
+        order, value, nodes = solve_by_branch_and_bound(table.tasks(), obj_type, initial_order=seed.order,
+                                                        control=control, precedence=precedence)
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(order, value, elapsed, candidates=nodes, obj_type=obj_type), profile)
+
+
+def run_decomposition(table: TaskTable, obj_type: ObjectiveType,
+                      seed: Optional[ScheduleResult] = None,
+                      control: Optional[SearchControl] = None,
+                      profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """Lawler の分解法で総遅延時間の最適解を求める（candidates=解いた部分問題の数）"""
+    if obj_type != ObjectiveType.TOTAL_TARDINESS:
+        raise ValueError("分解法は総遅延時間専用です")
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    initial = seed.order if seed is not None else None
+    with _phase(profile, "search"):
+        order, value, states = solve_by_decomposition(table.tasks(), initial_order=initial, control=control)
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(order, value, elapsed, candidates=states, obj_type=obj_type), profile)
+
+
+def run_parallel_exact(table: TaskTable, obj_type: ObjectiveType,
+                       seed: Optional[ScheduleResult] = None,
+                       control: Optional[SearchControl] = None,
+                       profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """プロセスプールで順列空間を分割して並列に厳密探索"""
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    initial = seed.order if seed is not None else None
+    with _phase(profile, "dominance"):
+        precedence = dominance_precedence(table.durations, table.deadlines, obj_type)
+    with _phase(profile, "search"):
+        order, value, nodes = parallel_exhaustive_search(table.tasks(), obj_type, initial_order=initial,
+                                                         control=control, precedence=precedence)
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(order, value, elapsed, candidates=nodes, obj_type=obj_type), profile)
+
+
+def run_polynomial(table: TaskTable, obj_type: ObjectiveType,
+                   profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """SPT / EDD / Moore–Hodgson で厳密解を求める（O(n log n)）"""
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    with _phase(profile, "search"):
+        order = solve_polynomial(table.durations, table.deadlines, obj_type)
+    with _phase(profile, "evaluate"):
+        obj_value = calculate_objectives_indexed(table, order)[obj_type]
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(order, obj_value, elapsed, candidates=1, obj_type=obj_type, table=table),
+                   profile)
+
+
+def run_metaheuristic(table: TaskTable, obj_type: ObjectiveType, method: str = "anneal",
+                      time_budget: float = METAHEURISTIC_BUDGET, seed: Optional[int] = None,
+                      initial: Optional[ScheduleResult] = None,
+                      profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """焼きなまし法 / タブー探索 / 遺伝的アルゴリズム（time_budget 秒で打ち切り、candidates=評価した移動数）"""
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    if initial is not None:
+        base = list(initial.index_order)
+    else:
+        with _phase(profile, "sort"):
+            base = sorted(range(len(table)), key=table.deadlines.__getitem__)
+    search = {"anneal": anneal_order, "genetic": genetic_order}.get(method, tabu_search_order)
+    order, value, moves = search(table.durations, table.deadlines, base, obj_type,
+                                 time_budget=time_budget, seed=seed, profile=profile)
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(order, value, elapsed, candidates=moves, obj_type=obj_type, table=table),
+                   profile)
+
+
+def run_genetic(table: TaskTable, obj_type: ObjectiveType, population_size: int = GA_POPULATION,
+                generations: int = GA_GENERATIONS, time_budget: Optional[float] = None,
+                seed: Optional[int] = None, polish: bool = True, initial: Optional[ScheduleResult] = None,
+                profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """遺伝的アルゴリズム（generations 世代か time_budget 秒で打ち切り、candidates=評価した順序と移動の数）"""
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    if initial is not None:
+        base = list(initial.index_order)
+    else:
+        with _phase(profile, "sort"):
+            base = sorted(range(len(table)), key=table.deadlines.__getitem__)
+    order, value, evaluations = genetic_order(
+        table.durations, table.deadlines, base, obj_type, population_size=population_size,
+        generations=generations, time_budget=time_budget, seed=seed,
+        polish_positions=GA_POLISH_POSITIONS if polish else 0, profile=profile)
+    elapsed = time.perf_counter() - start
+    return _finish(ScheduleResult(order, value, elapsed, candidates=evaluations, obj_type=obj_type, table=table),
+                   profile)
+
+
+def run_warm_start(table: TaskTable, obj_type: ObjectiveType, previous: Sequence[int],
+                   inserted: Iterable[int] = (), touched: Iterable[int] = ()) -> ScheduleResult:
+    """
+    前回の順序 previous から再最適化（candidates=評価した挿入位置と移動の数）:
+    inserted のタスクを1つずつ最良の位置に挿入し、挿入した位置と touched の周りだけ局所探索する。
+    """
+    start = time.perf_counter()
+    durations, deadlines = table.durations, table.deadlines
+    order = list(previous)
+    positions = list(touched)
+    candidates = 0
+    for j in inserted:
+        values = insertion_values(durations, deadlines, order, j, obj_type)
+        k = min(range(len(values)), key=values.__getitem__)
+        order.insert(k, j)
+        positions = [p + 1 if p >= k else p for p in positions]
+        positions.append(k)
+        candidates += len(values)
+    order, value, evaluated = repair_order(durations, deadlines, order, positions, obj_type)
+    elapsed = time.perf_counter() - start
+    return ScheduleResult(order, value, elapsed, candidates=candidates + evaluated, obj_type=obj_type,
+                          table=table)
+
+
+def run_exact(table: TaskTable, obj_type: ObjectiveType, seed: Optional[ScheduleResult] = None,
+              parallel: bool = False, control: Optional[SearchControl] = None,
+              profile: Optional[SolverProfile] = None) -> ScheduleResult:
+    """
+    目的関数に応じて厳密解法を選ぶ:
+    多項式時間の解法があればそれを使い、総遅延時間だけ
+    タスク数に応じて DP / Lawler の分解法を使う（分枝限定法は 17〜30 タスクでも分解法より遅いので使わない）。
+    並列モードでも、プロセスプールの順列探索は PARALLEL_MAX_TASKS 以下のときだけ使う
+    （順列は n! 通りあるので、それより大きいと1コアの DP / 分解法の方がずっと速い）。
+    seed（暫定解）が最適値の下界に届いていれば、それが最適なので探索しない。
+    control を渡すと途中経過の通知と中止ができる。
+    結果の lower_bound には、最後まで探索したら最適値を、中止したら下界を入れる。
+    """
+    if obj_type in POLYNOMIAL_OBJECTIVES:
+        result = run_polynomial(table, obj_type, profile)
+        result.lower_bound = result.obj_value
+        return result
+
+    if profile is not None:
+        profile.start()
+    start = time.perf_counter()
+    with _phase(profile, "lower_bound"):
+        bound = objective_lower_bound(table.durations, table.deadlines, obj_type)
+    if seed is not None and seed.obj_value <= bound:
+        result = ScheduleResult(table_index_order(table, seed), seed.obj_value, time.perf_counter() - start,
+                                candidates=1, obj_type=obj_type, table=table)
+        result.strategy = "lower_bound"
+        result.lower_bound = bound
+        return _finish(result, profile)
+
+    if seed is not None and profile is not None:
+        profile.improved(seed.obj_value, 0)
+    if parallel and len(table) <= PARALLEL_MAX_TASKS:
+        result = run_parallel_exact(table, obj_type, seed, control, profile)
+    elif len(table) <= DP_AUTO_TASKS:
+        result = run_exact_dp(table, obj_type, seed, control, profile)
+    else:
+        result = run_decomposition(table, obj_type, seed, control, profile)
+    result.lower_bound = bound if control is not None and control.cancelled else result.obj_value
+    return result
+
+
+# -----------------------------
+# Portfolio（締切までに複数の戦略を競わせる）
+# -----------------------------
+PORTFOLIO_DEADLINE = 1.0           # 既定の締切（秒）
+PORTFOLIO_SEEDS = (1, 2, 3, 4)     # 焼きなましを走らせる乱数シード
+PORTFOLIO_MARGIN = 0.05            # 結果の受け渡しに残す時間（締切に対する割合）
+
+
+def portfolio_strategies(n: int, seeds: Sequence[int] = PORTFOLIO_SEEDS) -> List[str]:
+    """
+    競わせる戦略の名前（"anneal:シード" のように引数はコロンの後ろ）。
+    厳密解法は最適性を証明できれば締切前に打ち切れるので先に投入する。
+    """
+    strategies = ["edf_swap", "spt_swap"] + [f"anneal:{seed}" for seed in seeds]
+    if n <= LAWLER_MAX_TASKS:
+        strategies.insert(0, "exact")
+    return strategies
+
+
+def _run_portfolio_strategy(strategy: str, durations: List[int], deadlines: List[int], obj_value: str,
+                            deadline_at: float) -> Optional[Tuple[List[int], int, int, bool]]:
+    """
+    ポートフォリオの1戦略を実行する（ワーカープロセスで実行）。
+    deadline_at はプロセス間で比べられるよう time.time() の値で渡し、着手時点で過ぎていれば何もしない。
+    返り値: (index 順序, 目的関数値, 候補数, 最適性を証明したか) or None
+    """
+    budget = deadline_at - time.time()
+    if budget <= 0:
+        return None
+    obj_type = ObjectiveType(obj_value)
+    table = TaskTable()
+    for j, (p, d) in enumerate(zip(durations, deadlines)):
+        table.append(str(j), p, d)
+
+    name, _, arg = strategy.partition(":")
+    proven = False
+    if name == "edf_swap":
+        result = run_edf_improve(table, obj_type, time_budget=budget)
+    elif name == "spt_swap":
+        result = run_spt_improve(table, obj_type, time_budget=budget)
+    elif name == "anneal":
+        result = run_metaheuristic(table, obj_type, "anneal", time_budget=budget, seed=int(arg))
+    elif name == "exact":
+        # 締切で中止させると、厳密解法はその時点の暫定解を返す
+        control = SearchControl()
+        timer = threading.Timer(budget, control.cancel)
+        timer.start()
+        try:
+            seed = run_edf_improve(table, obj_type, time_budget=budget / 2)
+            result = run_exact(table, obj_type, seed=seed, control=control)
+        finally:
+            timer.cancel()
+        proven = not control.cancelled
+    else:
+        raise ValueError(f"不明な戦略: {strategy}")
+    return list(table_index_order(table, result)), result.obj_value, result.candidates, proven
+
+
+@dataclass
+class PortfolioResult:
+    """ポートフォリオの結果"""
+    result: ScheduleResult          # 締切までに見つかった最良の結果
+    winner: str                     # それを出した戦略（締切までにどれも終わらなければ "edf"）
+    optimal: bool                   # 厳密解法が締切内に終わって最適性を証明したか
+    values: Dict[str, int]          # 締切までに終わった戦略ごとの目的関数値
+    unfinished: List[str]           # 締切までに結果を返さなかった戦略
+
+
+class PortfolioSolver:
+    """
+    複数の戦略をプロセスプールで同時に走らせ、締切の時点で最良の結果を返す。
+    プールは使い回すので、2回目以降はプロセス起動の時間が締切に食い込まない。
+    workers を省くと戦略ごとに1プロセス（コアが足りなければ OS が時分割する）。
+    どの戦略も自分で締切を見て終わるので、締切後に残ったプロセスが次の呼び出しを長く塞ぐことはない。
+    """
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> PortfolioSolver:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def solve(self, table: TaskTable, obj_type: ObjectiveType, deadline: float = PORTFOLIO_DEADLINE,
+              seeds: Sequence[int] = PORTFOLIO_SEEDS) -> PortfolioResult:
+        """deadline 秒以内に最良の結果を返す"""
+        start = time.perf_counter()
+        if obj_type in POLYNOMIAL_OBJECTIVES:
+            result = run_polynomial(table, obj_type)
+            result.strategy = "polynomial"
+            result.lower_bound = result.obj_value
+            return PortfolioResult(result, "polynomial", True, {"polynomial": result.obj_value}, [])
+
+        # どの戦略も間に合わなかったときのために、EDF をこのプロセスで先に求めておく
+        best = run_edf(table, obj_type)
+        best_order, best_value, candidates = list(best.index_order), best.obj_value, best.candidates
+        winner, optimal = "edf", False
+        values: Dict[str, int] = {}
+
+        strategies = portfolio_strategies(len(table), seeds)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers or len(strategies))
+        deadline_at = time.time() + deadline * (1 - PORTFOLIO_MARGIN) - (time.perf_counter() - start)
+        durations, deadlines = list(table.durations), list(table.deadlines)
+        futures = {self._pool.submit(_run_portfolio_strategy, strategy, durations, deadlines, obj_type.value,
+                                     deadline_at): strategy
+                   for strategy in strategies}
+
+        pending = set(futures)
+        while pending and not optimal:
+            remaining = deadline - (time.perf_counter() - start)
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for fut in done:
+                try:
+                    outcome = fut.result()
+                except Exception:
+                    continue  # 失敗した戦略は負けとして扱う
+                if outcome is None:
+                    continue
+                order, value, cands, proven = outcome
+                values[futures[fut]] = value
+                if value < best_value or (proven and value <= best_value):
+                    best_order, best_value, candidates, winner = order, value, cands, futures[fut]
+                optimal = optimal or proven
+
+        # 間に合わなかった戦略は待たない（未着手なら取り消し、実行中のものは各自の締切で終わる）
+        for fut in pending:
+            fut.cancel()
+        unfinished = [strategy for strategy in futures.values() if strategy not in values]
+
+        result = ScheduleResult(best_order, best_value, time.perf_counter() - start, candidates=candidates,
+                                obj_type=obj_type, table=table)
+        result.strategy = winner
+        if optimal:
+            result.lower_bound = best_value  # 最適性を証明した戦略の値（= 最良値）
+        return PortfolioResult(result, winner, optimal, values, unfinished)
+
+
+def run_portfolio(table: TaskTable, obj_type: ObjectiveType, deadline: float = PORTFOLIO_DEADLINE,
+                  seeds: Sequence[int] = PORTFOLIO_SEEDS, workers: Optional[int] = None) -> PortfolioResult:
+    """PortfolioSolver を1回だけ使う（プロセスの起動時間も締切に含まれる）"""
+    with PortfolioSolver(workers) as solver:
+        return solver.solve(table, obj_type, deadline, seeds)
+
+
+# -----------------------------
+# Solution Cache
+# -----------------------------
+CACHE_MAX_ENTRIES = 256  # メモリに置く結果の上限（古く使われていないものから捨てる）
+
+
+class SolutionCache:
+    """
+    解法の結果のキャッシュ（LRU、path を渡すと JSON ファイルに保存して次回も使う）。
+    キーは (所要時間, 締切) の組を並べ替えた列と (目的関数, 解法名) のハッシュなので、
+    タスク名やタスクの並びだけ違う同じインスタンスでも当たる。順序は並べ替えた後の番号で持ち、
+    get で今の table の index に戻す。
+    put ではファイルに書かずに印を付けるだけで、flush()（または with を抜けたとき）にまとめて書く。
+    """
+    VERSION = 2
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False  # ファイルに書いていない変更があるか
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self) -> "SolutionCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
+
+    @staticmethod
+    def canonical_order(table: TaskTable) -> List[int]:
+        """(所要時間, 締切) の順に並べた table の index 列（同じ組のタスクは入れ替えても同じ）"""
+        durations, deadlines = table.durations, table.deadlines
+        return sorted(range(len(table)), key=lambda i: (durations[i], deadlines[i]))
+
+    @staticmethod
+    def make_key(table: TaskTable, obj_type: ObjectiveType, algorithm: str,
+                 canonical: Optional[Sequence[int]] = None) -> str:
+        """タスク名と並びを含まない正規形のハッシュ（canonical は canonical_order の結果）"""
+        if canonical is None:
+            canonical = SolutionCache.canonical_order(table)
+        h = hashlib.sha256()
+        h.update(len(table).to_bytes(8, "little"))
+        h.update(array("q", [table.durations[i] for i in canonical]).tobytes())
+        h.update(array("q", [table.deadlines[i] for i in canonical]).tobytes())
+        h.update(f"{obj_type.value}|{algorithm}".encode())
+        return h.hexdigest()
+
+    def get(self, table: TaskTable, obj_type: ObjectiveType, algorithm: str) -> Optional[ScheduleResult]:
+        canonical = self.canonical_order(table)
+        key = self.make_key(table, obj_type, algorithm, canonical)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        order = [canonical[c] for c in entry["order"]]
+        result = ScheduleResult(order, entry["value"], entry["time"], candidates=entry["candidates"],
+                                obj_type=obj_type, table=table)
+        result.cached = True
+        result.lower_bound = entry.get("lower_bound")
+        return result
+
+    def put(self, table: TaskTable, obj_type: ObjectiveType, algorithm: str, result: ScheduleResult) -> None:
+        canonical = self.canonical_order(table)
+        key = self.make_key(table, obj_type, algorithm, canonical)
+        rank = [0] * len(canonical)
+        for c, i in enumerate(canonical):
+            rank[i] = c
+        entry = {
+            "order": [rank[i] for i in table_index_order(table, result)],
+            "value": result.obj_value,
+            "time": result.computation_time,
+            "candidates": result.candidates,
+        }
+        if result.lower_bound is not None:
+            entry["lower_bound"] = result.lower_bound
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def get_or_solve(self, table: TaskTable, obj_type: ObjectiveType, algorithm: str,
+                     solve: Callable[[], ScheduleResult]) -> ScheduleResult:
+        """キャッシュにあればそれを、なければ solve() を実行して結果を覚える"""
+        result = self.get(table, obj_type, algorithm)
+        if result is None:
+            result = solve()
+            self.put(table, obj_type, algorithm, result)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def load(self) -> None:
+        """ファイルから読み込む（壊れている・形式が違う場合は空のまま）"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        with self._lock:
+            self._entries = OrderedDict(data.get("entries", []))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = False
+
+    def flush(self) -> None:
+        """前回の保存から変わっていればファイルに書き出す（path がなければ何もしない）"""
+        if self.path is not None and self._dirty:
+            self.save()
+
+    def save(self) -> None:
+        """ファイルに書き出す（一時ファイルに書いてから置き換える）"""
+        with self._lock:
+            data = {"version": self.VERSION, "entries": list(self._entries.items())}
+            self._dirty = False
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path)
+
+
+def table_index_order(table: TaskTable, result: ScheduleResult) -> Sequence[int]:
+    """結果の順序を table の index 列にする（Task のリストで作られた結果は中身で対応づける）"""
+    if result.source is table:
+        return result.index_order
+    positions: Dict[Tuple[str, int, int], List[int]] = {}
+    for i in range(len(table) - 1, -1, -1):
+        t = table.task(i)
+        positions.setdefault((t.name, t.duration, t.deadline), []).append(i)
+    return [positions[(t.name, t.duration, t.deadline)].pop() for t in result.order]
@@ -0,0 +1,166 @@
+"""
+Day 80: 厳密解法のセルフチェック（GUIなし）
+- シード付きの乱数で n ≤ 8 の小さいインスタンスを作り、全順列（itertools.permutations）で求めた最適値と
+  solve_by_subset_dp / solve_by_branch_and_bound / solve_by_decomposition / exhaustive_search /
+  solve_polynomial / pareto_front_search の結果を比べる
+- 返ってきた順序がタスクの並べ替えになっているか、計算し直した値が返ってきた値と同じかも確かめる
+- 食い違いがあれば1件ずつ表示して終了コード 1 を返す
+
+使い方:
+  python selfcheck.py                          # n=1..8 を 20 インスタンスずつ
+  python selfcheck.py --instances 100 --seed 7 --max-n 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from itertools import permutations
+from typing import Callable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from scheduler_core import (
+    POLYNOMIAL_OBJECTIVES, ObjectiveType, ObjectiveVector, Task, calculate_objective, dominance_precedence,
+    evaluate_orders_batch, exhaustive_search, pareto_front_search, solve_by_branch_and_bound,
+    solve_by_decomposition, solve_by_subset_dp, solve_polynomial,
+)
+
+SELFCHECK_MAX_TASKS = 8  # 全順列は 8! = 40320 通り（1インスタンス 0.1 秒ほど）
+SELFCHECK_INSTANCES = 20  # タスク数ごとのインスタンス数
+
+
+# -----------------------------
+# Reference（全順列）
+# -----------------------------
+def generate_case(rng: random.Random, n: int) -> Tuple[List[int], List[int]]:
+    """所要時間と締切を作る（所要時間の幅を変えて、同じ長さのタスクや締切の同着も混ぜる）"""
+    spread = rng.choice((3, 10, 50))
+    durations = [rng.randint(1, spread) for _ in range(n)]
+    total = sum(durations)
+    tightness = rng.choice((0.2, 0.5, 0.8))
+    deadlines = [max(1, round(rng.uniform(total * (0.6 - tightness), total * (1.4 - tightness))))
+                 for _ in range(n)]
+    return durations, deadlines
+
+
+def all_vectors(durations: Sequence[int], deadlines: Sequence[int]) -> Set[ObjectiveVector]:
+    """全順列の目的関数値4つの組（ObjectiveType の定義順）"""
+    orders = list(permutations(range(len(durations))))
+    values = evaluate_orders_batch(durations, deadlines, orders)
+    columns = [values[obj_type] for obj_type in ObjectiveType]
+    return {tuple(int(c[r]) for c in columns) for r in range(len(orders))}
+
+
+def pareto_vectors(vectors: Set[ObjectiveVector]) -> Set[ObjectiveVector]:
+    """ほかのどの組にも支配されない組（辞書式順に見ると、支配する組は必ず先に来る）"""
+    front: List[ObjectiveVector] = []
+    for v in sorted(vectors):
+        if not any(all(a <= b for a, b in zip(f, v)) for f in front):
+            front.append(v)
+    return set(front)
+
+
+# -----------------------------
+# Checks
+# -----------------------------
+def _check_order(label: str, tasks: List[Task], order: Sequence[Task], value: int, optimum: int,
+                 obj_type: ObjectiveType) -> Iterator[str]:
+    if sorted(t.name for t in order) != sorted(t.name for t in tasks):
+        yield f"{label}: 順序がタスクの並べ替えになっていません"
+        return
+    actual = calculate_objective(list(order), obj_type)
+    if actual != value:
+        yield f"{label}: 返した値 {value} と順序を計算し直した値 {actual} が違います"
+    if value != optimum:
+        yield f"{label}: {value}（最適値 {optimum}）"
+
+
+def check_case(durations: List[int], deadlines: List[int]) -> List[str]:
+    """1インスタンスを全解法で解き、全順列の結果と食い違ったものを返す"""
+    n = len(durations)
+    tasks = [Task(f"T{i + 1}", p, d) for i, (p, d) in enumerate(zip(durations, deadlines))]
+    vectors = all_vectors(durations, deadlines)
+    problems: List[str] = []
+
+    for k, obj_type in enumerate(ObjectiveType):
+        optimum = min(v[k] for v in vectors)
+        precedence = dominance_precedence(durations, deadlines, obj_type)
+        tag = obj_type.value
+
+        order, value, _ = solve_by_subset_dp(tasks, obj_type)
+        problems += _check_order(f"subset_dp/{tag}", tasks, order, value, optimum, obj_type)
+        order, value, _ = solve_by_subset_dp(tasks, obj_type, precedence=precedence)
+        problems += _check_order(f"subset_dp+dominance/{tag}", tasks, order, value, optimum, obj_type)
+        order, value, _ = solve_by_branch_and_bound(tasks, obj_type, precedence=precedence)
+        problems += _check_order(f"branch_and_bound/{tag}", tasks, order, value, optimum, obj_type)
+        if obj_type == ObjectiveType.TOTAL_TARDINESS:
+            order, value, _ = solve_by_decomposition(tasks)
+            problems += _check_order(f"decomposition/{tag}", tasks, order, value, optimum, obj_type)
+
+        index_order, value, _ = exhaustive_search(durations, deadlines, obj_type, precedence)
+        problems += _check_order(f"exhaustive/{tag}", tasks, [tasks[i] for i in index_order], value, optimum,
+                                 obj_type)
+        if obj_type in POLYNOMIAL_OBJECTIVES:
+            index_order = solve_polynomial(durations, deadlines, obj_type)
+            if index_order is None:
+                problems.append(f"polynomial/{tag}: 順序を返しませんでした")
+            else:
+                ordered = [tasks[i] for i in index_order]
+                problems += _check_order(f"polynomial/{tag}", tasks, ordered,
+                                         calculate_objective(ordered, obj_type), optimum, obj_type)
+
+    front, _ = pareto_front_search(durations, deadlines)
+    expected = pareto_vectors(vectors)
+    found = {vec for vec, _ in front}
+    if found != expected:
+        problems.append(f"pareto: フロント {sorted(found)}（全順列では {sorted(expected)}）")
+    for vec, index_order in front:
+        ordered = [tasks[i] for i in index_order]
+        actual = tuple(calculate_objective(ordered, obj_type) for obj_type in ObjectiveType)
+        if sorted(index_order) != list(range(n)) or actual != vec:
+            problems.append(f"pareto: 点 {vec} の順序を計算し直すと {actual} です")
+    return problems
+
+
+def run_selfcheck(instances: int = SELFCHECK_INSTANCES, max_n: int = SELFCHECK_MAX_TASKS, seed: int = 1,
+                  progress: Optional[Callable[[int], None]] = None) -> Tuple[int, List[str]]:
+    """n=1..max_n を instances 個ずつ確かめる。返り値: (確かめたインスタンス数, 食い違いの説明)"""
+    rng = random.Random(seed)
+    checked = 0
+    problems: List[str] = []
+    for n in range(1, max_n + 1):
+        for _ in range(instances):
+            durations, deadlines = generate_case(rng, n)
+            for problem in check_case(durations, deadlines):
+                problems.append(f"n={n} p={durations} d={deadlines} {problem}")
+            checked += 1
+        if progress is not None:
+            progress(n)
+    return checked, problems
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="厳密解法を全順列の結果と比べるセルフチェック")
+    parser.add_argument("--instances", type=int, default=SELFCHECK_INSTANCES, help="タスク数ごとのインスタンス数")
+    parser.add_argument("--max-n", type=int, default=SELFCHECK_MAX_TASKS, help="最大のタスク数")
+    parser.add_argument("--seed", type=int, default=1, help="乱数シード")
+    args = parser.parse_args(argv)
+    if not 1 <= args.max_n <= SELFCHECK_MAX_TASKS:
+        parser.error(f"--max-n は 1〜{SELFCHECK_MAX_TASKS} で指定してください")
+
+    start = time.perf_counter()
+    checked, problems = run_selfcheck(args.instances, args.max_n, args.seed,
+                                      progress=lambda n: print(f"n={n} 完了", flush=True))
+    elapsed = time.perf_counter() - start
+    if problems:
+        print(f"\n❌ 全順列の結果と食い違いました（{len(problems)}件）:")
+        for p in problems:
+            print("  " + p)
+        return 1
+    print(f"\n✅ {checked} インスタンスすべてで全順列の結果と一致しました（{elapsed:.1f}秒）")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Day 80: タスク一覧（ttk.Treeview の仮想化）
+- 画面に入る行数ぶんの行だけを作り、スクロールしたら中身（値）を書き換えて使い回す
+- 10万件のタスクでも Treeview に入る行は数十行なので、追加・削除・スクロールが重くならない
+- スクロールバーとホイール・キー操作は自前で受け持ち、選択はタスクの番号で覚える
+"""
+
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, List, Optional
+
+from scheduler_core import TaskTable
+
+DEFAULT_ROW_HEIGHT = 20  # テーマから行の高さが取れないとき
+WHEEL_ROWS = 3           # ホイール1段で動かす行数
+
+
+class VirtualTaskList:
+    """
+    TaskTable の中身を表示するだけの一覧。データは持たず、表示のたびに table から読む。
+    on_select(i) は利用者が i 番目のタスクを選んだときに呼ばれる。
+    """
+
+    def __init__(self, parent: tk.Misc, on_select: Optional[Callable[[int], None]] = None):
+        self.on_select = on_select
+        self.table = TaskTable()
+        self.top = 0                         # 先頭に表示しているタスクの番号
+        self.selected: Optional[int] = None  # 選択中のタスクの番号（画面外でも覚えておく）
+        self.iids: List[str] = []            # 使い回す行（上から順）
+
+        self.frame = tk.Frame(parent, bg=parent.cget("bg"))
+        columns = ("name", "duration", "deadline")
+        self.tree = ttk.Treeview(self.frame, columns=columns, show="headings", height=8, selectmode="browse")
+        self.tree.heading("name", text="タスク名")
+        self.tree.heading("duration", text="所要時間")
+        self.tree.heading("deadline", text="締切")
+        self.tree.column("name", width=160)
+        self.tree.column("duration", width=90, anchor=tk.CENTER)
+        self.tree.column("deadline", width=90, anchor=tk.CENTER)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        try:
+            self.row_height = int(ttk.Style().lookup("Treeview", "rowheight") or DEFAULT_ROW_HEIGHT)
+        except (tk.TclError, ValueError):
+            self.row_height = DEFAULT_ROW_HEIGHT
+        self._resize(8)
+
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", lambda e: self._scroll_by(-WHEEL_ROWS if e.delta > 0 else WHEEL_ROWS))
+        self.tree.bind("<Button-4>", lambda _e: self._scroll_by(-WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda _e: self._scroll_by(WHEEL_ROWS))
+        self.tree.bind("<Up>", lambda _e: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda _e: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda _e: self._move_selection(-self.page_rows))
+        self.tree.bind("<Next>", lambda _e: self._move_selection(self.page_rows))
+        self.tree.bind("<Home>", lambda _e: self._move_selection(-len(self.table)))
+        self.tree.bind("<End>", lambda _e: self._move_selection(len(self.table)))
+
+    def pack(self, **kwargs) -> None:
+        self.frame.pack(**kwargs)
+
+    # -------------------------
+    # Data
+    # -------------------------
+    @property
+    def page_rows(self) -> int:
+        return max(1, len(self.iids))
+
+    def set_table(self, table: TaskTable) -> None:
+        """別の表に差し替える（選択と表示位置は先頭に戻す）"""
+        self.table = table
+        self.top = 0
+        self.selected = None
+        self.refresh()
+
+    def selected_index(self) -> Optional[int]:
+        """選択中のタスクの番号（なければ None）"""
+        if self.selected is not None and self.selected < len(self.table):
+            return self.selected
+        return None
+
+    def clear_selection(self) -> None:
+        self.selected = None
+        self.refresh()
+
+    def see(self, i: int) -> None:
+        """i 番目のタスクが見える位置までスクロールする"""
+        if i < self.top:
+            self.top = i
+        elif i >= self.top + self.page_rows:
+            self.top = i - self.page_rows + 1
+        self.refresh()
+
+    # -------------------------
+    # Render
+    # -------------------------
+    def refresh(self) -> None:
+        """表示している行の値・選択・スクロールバーを table に合わせる（行数ぶんの手間だけ）"""
+        table = self.table
+        n = len(table)
+        self.top = max(0, min(self.top, n - self.page_rows))
+
+        selected_iid = None
+        for k, iid in enumerate(self.iids):
+            i = self.top + k
+            if i < n:
+                values = (table.names[i], f"{table.durations[i]}分", f"{table.deadlines[i]}分後")
+                if i == self.selected:
+                    selected_iid = iid
+            else:
+                values = ("", "", "")
+            self.tree.item(iid, values=values)
+
+        # 選択の変更で <<TreeviewSelect>> が来ても、番号が同じなら _on_tree_select は何もしない
+        if selected_iid is not None:
+            self.tree.selection_set(selected_iid)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+
+        if n > 0:
+            self.scrollbar.set(self.top / n, min(1.0, (self.top + self.page_rows) / n))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _resize(self, rows: int) -> None:
+        """使い回す行の数を rows に合わせる"""
+        rows = max(1, rows)
+        while len(self.iids) < rows:
+            self.iids.append(self.tree.insert("", tk.END, values=("", "", "")))
+        if len(self.iids) > rows:
+            self.tree.delete(*self.iids[rows:])
+            del self.iids[rows:]
+
+    def _on_configure(self, event) -> None:
+        # 見出しの高さは1行目の位置から分かる（まだ描かれていなければ1行分とみなす）
+        bbox = self.tree.bbox(self.iids[0]) if self.iids else ""
+        heading = bbox[1] if bbox else self.row_height
+        rows = (event.height - heading) // self.row_height
+        if rows != len(self.iids):
+            self._resize(rows)
+            self.refresh()
+
+    # -------------------------
+    # Scroll / select
+    # -------------------------
+    def yview(self, *args) -> None:
+        """スクロールバーから呼ばれる（"moveto", 位置） / ("scroll", 量, "units" | "pages")"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.top = int(float(args[1]) * len(self.table))
+        elif args[0] == "scroll":
+            step = self.page_rows if args[2] == "pages" else 1
+            self.top += int(args[1]) * step
+        self.refresh()
+
+    def _scroll_by(self, rows: int) -> str:
+        self.top += rows
+        self.refresh()
+        return "break"
+
+    def _move_selection(self, delta: int) -> str:
+        n = len(self.table)
+        if n == 0:
+            return "break"
+        current = self.selected_index()
+        if current is None:
+            # 未選択なら画面の先頭の行から数える（↓/↑ で先頭の行、End で最後の行）
+            current = self.top - 1 if delta > 0 else self.top + 1
+        i = max(0, min(n - 1, current + delta))
+        self.selected = i
+        self.see(i)
+        if self.on_select is not None:
+            self.on_select(i)
+        return "break"  # Treeview 既定のキー操作（使い回している行の間の移動）はさせない
+
+    def _on_tree_select(self, _event=None) -> None:
+        selection = self.tree.selection()
+        if not selection or selection[0] not in self.iids:
+            return
+        i = self.top + self.iids.index(selection[0])
+        if i >= len(self.table):
+            self.refresh()  # タスクのない空行は選ばせない
+            return
+        if i == self.selected:
+            return
+        self.selected = i
+        if self.on_select is not None:
+            self.on_select(i)
@@ -1,6 +1,7 @@
 """
 Day 80: 作業スケジューラ最適化アプリ（目的を選べる）
-- 総当たり法（最適） vs ヒューリスティック法（EDF / SPT） vs 改善（EDF+Swap）
+（解法は scheduler_core.py、GUI なしで使うなら scheduler_cli.py）
+- 厳密解（部分集合DP） vs ヒューリスティック法（EDF / SPT） vs 改善（EDF+Swap）
 - 目的関数を切り替え可能：
   1. 総遅延時間（Σ tardiness）
   2. 遅延タスク数（tardy count）
@@ -11,204 +12,28 @@ Day 80: 作業スケジューラ最適化アプリ（目的を選べる）
 from __future__ import annotations
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-from itertools import permutations
-import time
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
-from enum import Enum
+from tkinter import filedialog, messagebox
+import json
 import math
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
+from gantt_canvas import TASK_COLORS, GanttCanvas
+from scheduler_core import (
+    DP_AUTO_TASKS, IMPORT_CHUNK_SIZE, LAWLER_MAX_TASKS, METAHEURISTIC_BUDGET, OBJECTIVE_DESCRIPTIONS, OBJECTIVE_LABELS,
+    PARETO_MAX_TASKS, POLYNOMIAL_OBJECTIVES, SWAP_TIME_BUDGET,
+    ObjectiveType, ParetoFront, ScheduleResult, SearchControl, SearchProgress, SolutionCache, SolverProfile,
+    TaskTable,
+    WarmStartState,
+    iter_task_chunks, objective_lower_bound, run_brute_force, run_edf, run_edf_improve, run_exact,
+    run_metaheuristic, run_pareto, run_spt, table_index_order,
+)
+from task_list_view import VirtualTaskList
 
-# -----------------------------
-# Objective Types
-# -----------------------------
-class ObjectiveType(Enum):
-    TOTAL_TARDINESS = "total_tardiness"      # 総遅延時間（Σ max(0, 完了-締切)）
-    TARDY_COUNT = "tardy_count"              # 遅延タスク数
-    MAX_TARDINESS = "max_tardiness"          # 最大遅延
-    TOTAL_COMPLETION = "total_completion"    # 総完了時刻（Σ 完了時刻）
-
-
-OBJECTIVE_LABELS = {
-    ObjectiveType.TOTAL_TARDINESS: "遅延時間",
-    ObjectiveType.TARDY_COUNT: "遅延タスク数",
-    ObjectiveType.MAX_TARDINESS: "最大遅延",
-    ObjectiveType.TOTAL_COMPLETION: "完了時刻",
-}
-
-OBJECTIVE_DESCRIPTIONS = {
-    ObjectiveType.TOTAL_TARDINESS: "締切を過ぎた時間の合計を最小化",
-    ObjectiveType.TARDY_COUNT: "遅れたタスクの件数を最小化",
-    ObjectiveType.MAX_TARDINESS: "最も遅れたタスクの遅延を最小化",
-    ObjectiveType.TOTAL_COMPLETION: "全タスク完了時刻の合計を最小化（SPTが最適）",
-}
-
-
-# -----------------------------
-# Data Models
-# -----------------------------
-@dataclass(frozen=True)
-class Task:
-    """タスクを表すデータクラス"""
-    name: str
-    duration: int      # 所要時間（分）
-    deadline: int      # 締切（開始からの分数）
-
-    def __str__(self) -> str:
-        return f"{self.name} ({self.duration}分, 締切:{self.deadline}分)"
-
-
-# -----------------------------
-# Core Calculation Functions
-# -----------------------------
-def calculate_total_tardiness(order: List[Task]) -> int:
-    """総遅延時間（Σ max(0, 完了 - 締切)）を計算"""
-    current_time = 0
-    total = 0
-    for task in order:
-        current_time += task.duration
-        total += max(0, current_time - task.deadline)
-    return total
-
-
-def calculate_tardy_count(order: List[Task]) -> int:
-    """遅延タスク数を計算"""
-    current_time = 0
-    count = 0
-    for task in order:
-        current_time += task.duration
-        if current_time > task.deadline:
-            count += 1
-    return count
-
-
-def calculate_max_tardiness(order: List[Task]) -> int:
-    """最大遅延を計算"""
-    current_time = 0
-    max_delay = 0
-    for task in order:
-        current_time += task.duration
-        delay = max(0, current_time - task.deadline)
-        max_delay = max(max_delay, delay)
-    return max_delay
-
-
-def calculate_total_completion(order: List[Task]) -> int:
-    """総完了時刻（Σ 完了時刻）を計算"""
-    current_time = 0
-    total = 0
-    for task in order:
-        current_time += task.duration
-        total += current_time
-    return total
-
-
-def calculate_objective(order: List[Task], obj_type: ObjectiveType) -> int:
-    """指定された目的関数の値を計算"""
-    if obj_type == ObjectiveType.TOTAL_TARDINESS:
-        return calculate_total_tardiness(order)
-    elif obj_type == ObjectiveType.TARDY_COUNT:
-        return calculate_tardy_count(order)
-    elif obj_type == ObjectiveType.MAX_TARDINESS:
-        return calculate_max_tardiness(order)
-    elif obj_type == ObjectiveType.TOTAL_COMPLETION:
-        return calculate_total_completion(order)
-    return calculate_total_tardiness(order)
-
-
-class ScheduleResult:
-    """スケジューリング結果"""
-    def __init__(self, order: List[Task], obj_value: int, computation_time: float,
-                 candidates: int = 1, obj_type: ObjectiveType = ObjectiveType.TOTAL_TARDINESS):
-        self.order = order
-        self.obj_value = obj_value  # 最適化対象の目的関数値
-        self.obj_type = obj_type
-        self.computation_time = computation_time
-        self.candidates = candidates
-        self.schedule: List[Tuple[Task, int, int, int]] = []  # (task, start, end, delay)
-        self._calculate_schedule()
-        self._calc_all_objectives()
-
-    def _calculate_schedule(self) -> None:
-        """スケジュール詳細を計算"""
-        self.schedule.clear()
-        current_time = 0
-        for task in self.order:
-            start = current_time
-            end = current_time + task.duration
-            delay = max(0, end - task.deadline)
-            self.schedule.append((task, start, end, delay))
-            current_time = end
-
-    def _calc_all_objectives(self) -> None:
-        """全目的関数の値を計算"""
-        self.total_tardiness = calculate_total_tardiness(self.order)
-        self.tardy_count = calculate_tardy_count(self.order)
-        self.max_tardiness = calculate_max_tardiness(self.order)
-        self.total_completion = calculate_total_completion(self.order)
-
-    def get_objective_value(self, obj_type: ObjectiveType) -> int:
-        """指定した目的関数の値を取得"""
-        if obj_type == ObjectiveType.TOTAL_TARDINESS:
-            return self.total_tardiness
-        elif obj_type == ObjectiveType.TARDY_COUNT:
-            return self.tardy_count
-        elif obj_type == ObjectiveType.MAX_TARDINESS:
-            return self.max_tardiness
-        elif obj_type == ObjectiveType.TOTAL_COMPLETION:
-            return self.total_completion
-        return self.total_tardiness
-
-    @property
-    def makespan(self) -> int:
-        if not self.schedule:
-            return 0
-        return self.schedule[-1][2]
-
-    # 後方互換性
-    @property
-    def total_delay(self) -> int:
-        return self.total_tardiness
-
-    @property
-    def max_delay(self) -> int:
-        return self.max_tardiness
-
-
-# -----------------------------
-# Core Optimization Logic
-# -----------------------------
-def improve_by_swaps(order: List[Task], obj_type: ObjectiveType = ObjectiveType.TOTAL_TARDINESS,
-                     max_iters: int = 4000) -> Tuple[List[Task], int]:
-    """
-    ローカル探索（swap改善）:
-    2つのタスクを入れ替えて目的関数値が改善するなら採用、を繰り返す。
-    """
-    best = order[:]
-    best_value = calculate_objective(best, obj_type)
-    n = len(best)
-    candidates = 0
-
-    for _ in range(max_iters):
-        improved = False
-        for i in range(n):
-            for j in range(i + 1, n):
-                candidates += 1
-                trial = best[:]
-                trial[i], trial[j] = trial[j], trial[i]
-                v = calculate_objective(trial, obj_type)
-                if v < best_value:
-                    best, best_value = trial, v
-                    improved = True
-                    break
-            if improved:
-                break
-        if not improved:
-            break
-
-    return best, candidates
+PARETO_DISPLAY_LIMIT = 30  # 結果欄に並べる非劣解の数
+PLOT_WIDTH = 520            # 収束グラフの大きさ（結果欄に埋め込む）
+PLOT_HEIGHT = 170
 
 
 # -----------------------------
@@ -224,13 +49,14 @@ class TaskSchedulerApp:
         self.font_family = "Yu Gothic UI"
         self.font_mono = "MS Gothic"
 
-        self.tasks: List[Task] = []
+        self.table = TaskTable()
 
         # results
         self.res_edf: Optional[ScheduleResult] = None
         self.res_spt: Optional[ScheduleResult] = None
         self.res_edf_improved: Optional[ScheduleResult] = None
-        self.res_bruteforce: Optional[ScheduleResult] = None
+        self.res_optimal: Optional[ScheduleResult] = None
+        self.optimal_label = "最適（厳密解）"  # 厳密解が無理な規模では近似解法の名前になる
 
         # objective selection
         self.objective_var = tk.StringVar(value=ObjectiveType.TOTAL_TARDINESS.value)
@@ -238,6 +64,27 @@ class TaskSchedulerApp:
         # selection for gantt
         self.gantt_mode = tk.StringVar(value="4")
 
+        # exact search on all cores
+        self.parallel_var = tk.BooleanVar(value=False)
+
+        # record phase timings / convergence of the solvers that actually ran
+        self.profile_var = tk.BooleanVar(value=False)
+        self.convergence_plot: Optional[tk.Canvas] = None
+
+        # results of previous runs (same durations/deadlines/objective → no recomputation)
+        self.cache = SolutionCache()
+
+        # previous best orders, kept in sync with task edits (warm start for the next run)
+        self.warm: Optional[WarmStartState] = None
+
+        # running exact search (for progress / cancel)
+        self.search_control: Optional[SearchControl] = None
+        self.search_progress: Optional[SearchProgress] = None
+
+        # 4つの解法を同時に走らせ、終わったものから表示する
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="solver")
+        self.pending = 0
+        self.busy = False  # set_busy: 計算・読み込み中は表を書き換えない
 
         self.setup_ui()
         self.add_sample_tasks()
@@ -311,23 +158,40 @@ class TaskSchedulerApp:
         btn_frame = tk.Frame(input_frame, bg="#16213e")
         btn_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
 
-        tk.Button(
+        self.add_btn = tk.Button(
             btn_frame, text="➕ タスク追加", command=self.add_task,
             bg="#0f3460", fg="white", font=(self.font_family, 10, "bold"),
             relief=tk.FLAT, padx=15, pady=5
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.add_btn.pack(side=tk.LEFT, padx=5)
 
-        tk.Button(
+        self.delete_btn = tk.Button(
             btn_frame, text="🗑️ 選択削除", command=self.delete_task,
             bg="#e94560", fg="white", font=(self.font_family, 10, "bold"),
             relief=tk.FLAT, padx=15, pady=5
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.delete_btn.pack(side=tk.LEFT, padx=5)
 
-        tk.Button(
+        self.edit_btn = tk.Button(
+            btn_frame, text="✏️ 選択更新", command=self.edit_task,
+            bg="#0f3460", fg="white", font=(self.font_family, 10, "bold"),
+            relief=tk.FLAT, padx=15, pady=5
+        )
+        self.edit_btn.pack(side=tk.LEFT, padx=5)
+
+        self.clear_btn = tk.Button(
             btn_frame, text="🔄 全クリア", command=self.clear_tasks,
             bg="#6c757d", fg="white", font=(self.font_family, 10, "bold"),
             relief=tk.FLAT, padx=15, pady=5
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.clear_btn.pack(side=tk.LEFT, padx=5)
+
+        self.import_btn = tk.Button(
+            btn_frame, text="📂 CSV/JSON 読み込み", command=self.import_tasks,
+            bg="#0f3460", fg="white", font=(self.font_family, 10, "bold"),
+            relief=tk.FLAT, padx=15, pady=5
+        )
+        self.import_btn.pack(side=tk.LEFT, padx=5)
 
         # Radio: Gantt show mode
         mode_frame = tk.Frame(btn_frame, bg="#16213e")
@@ -350,6 +214,26 @@ class TaskSchedulerApp:
             command=self.draw_gantt_chart_safe
         ).pack(side=tk.LEFT)
 
+        tk.Checkbutton(
+            btn_frame, text="⚙️ 並列探索（マルチコア）", variable=self.parallel_var,
+            bg="#16213e", fg="white", selectcolor="#16213e",
+            activebackground="#16213e", activeforeground="white",
+            font=(self.font_family, 10)
+        ).pack(side=tk.LEFT, padx=10)
+
+        tk.Checkbutton(
+            btn_frame, text="🔬 計測", variable=self.profile_var,
+            bg="#16213e", fg="white", selectcolor="#16213e",
+            activebackground="#16213e", activeforeground="white",
+            font=(self.font_family, 10)
+        ).pack(side=tk.LEFT, padx=5)
+
+        tk.Button(
+            btn_frame, text="💾 計測をJSON保存", command=self.export_profiles,
+            bg="#0f3460", fg="white", font=(self.font_family, 10),
+            relief=tk.FLAT, padx=8, pady=5
+        ).pack(side=tk.LEFT, padx=5)
+
         self.optimize_btn = tk.Button(
             btn_frame, text="⚡ 最適化実行", command=self.optimize,
             bg="#00d9ff", fg="black", font=(self.font_family, 11, "bold"),
@@ -357,6 +241,24 @@ class TaskSchedulerApp:
         )
         self.optimize_btn.pack(side=tk.RIGHT, padx=5)
 
+        self.cancel_btn = tk.Button(
+            btn_frame, text="⏹ 中止", command=self.cancel_search, state=tk.DISABLED,
+            bg="#e94560", fg="white", font=(self.font_family, 11, "bold"),
+            relief=tk.FLAT, padx=12, pady=5
+        )
+        self.cancel_btn.pack(side=tk.RIGHT, padx=5)
+
+        self.pareto_btn = tk.Button(
+            btn_frame, text="🎯 4目的まとめて", command=self.pareto_optimize,
+            bg="#ffd460", fg="black", font=(self.font_family, 10, "bold"),
+            relief=tk.FLAT, padx=12, pady=5
+        )
+        self.pareto_btn.pack(side=tk.RIGHT, padx=5)
+
+        # 解法のスレッドが表を読んでいる間は止めるボタン
+        self.busy_buttons = [self.add_btn, self.delete_btn, self.edit_btn, self.clear_btn, self.import_btn,
+                             self.optimize_btn, self.pareto_btn]
+
         # -------------------------
         # Middle: list + results
         # -------------------------
@@ -372,15 +274,9 @@ class TaskSchedulerApp:
             bg="#16213e", fg="#00d9ff"
         ).pack(pady=5)
 
-        columns = ("name", "duration", "deadline")
-        self.task_tree = ttk.Treeview(left_frame, columns=columns, show="headings", height=8)
-        self.task_tree.heading("name", text="タスク名")
-        self.task_tree.heading("duration", text="所要時間")
-        self.task_tree.heading("deadline", text="締切")
-        self.task_tree.column("name", width=160)
-        self.task_tree.column("duration", width=90, anchor=tk.CENTER)
-        self.task_tree.column("deadline", width=90, anchor=tk.CENTER)
-        self.task_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # 見えている行だけを作って使い回す一覧（大量のタスクを読み込んでも重くならない）
+        self.task_list = VirtualTaskList(left_frame, on_select=self.on_task_select)
+        self.task_list.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         self.info_label = tk.Label(
             left_frame, text="", font=(self.font_family, 10),
@@ -412,13 +308,24 @@ class TaskSchedulerApp:
         chart_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
 
         tk.Label(
-            chart_frame, text="📈 スケジュール比較（ガントチャート）",
+            chart_frame, text="📈 スケジュール比較（ガントチャート・ホイールで拡大縮小、ドラッグで移動）",
             font=(self.font_family, 12, "bold"),
             bg="#16213e", fg="#00d9ff"
         ).pack(pady=5)
 
         self.canvas = tk.Canvas(chart_frame, bg="#0f3460", height=260, highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.gantt = GanttCanvas(self.canvas, self.font_family)
+
+    def set_busy(self, busy: bool) -> None:
+        """
+        最適化・パレート計算・読み込みの間は、表を書き換える操作と次の計算を止める
+        （解法のスレッドは self.table をそのまま読み、終わったら前回の解としてその表の順序を覚えるため）。
+        """
+        self.busy = busy
+        state = tk.DISABLED if busy else tk.NORMAL
+        for button in self.busy_buttons:
+            button.config(state=state)
 
     # -------------------------
     # Task operations
@@ -431,66 +338,165 @@ class TaskSchedulerApp:
             ("データ整理", 25, 90),
             ("資料確認", 10, 40),
         ]
-        self.tasks.clear()
+        self.table.clear()
         for name, duration, deadline in samples:
-            self.tasks.append(Task(name, duration, deadline))
+            self.table.append(name, duration, deadline)
         self.update_task_list()
 
-    def add_task(self) -> None:
+    def read_task_entry(self) -> Optional[Tuple[str, int, int]]:
+        """入力欄の (タスク名, 所要時間, 締切)。不正ならメッセージを出して None"""
         try:
             name = self.name_entry.get().strip()
             duration = int(self.duration_entry.get())
             deadline = int(self.deadline_entry.get())
+        except ValueError:
+            messagebox.showwarning("入力エラー", "数値を正しく入力してください")
+            return None
+        if not name:
+            messagebox.showwarning("入力エラー", "タスク名を入力してください")
+            return None
+        if duration <= 0 or deadline <= 0:
+            messagebox.showwarning("入力エラー", "正の数を入力してください")
+            return None
+        return name, duration, deadline
+
+    def clear_task_entry(self) -> None:
+        self.name_entry.delete(0, tk.END)
+        self.duration_entry.delete(0, tk.END)
+        self.deadline_entry.delete(0, tk.END)
 
-            if not name:
-                messagebox.showwarning("入力エラー", "タスク名を入力してください")
-                return
-            if duration <= 0 or deadline <= 0:
-                messagebox.showwarning("入力エラー", "正の数を入力してください")
-                return
+    def add_task(self) -> None:
+        if self.busy:
+            return
+        entry = self.read_task_entry()
+        if entry is None:
+            return
+        self.table.append(*entry)
+        if self.warm is not None:
+            self.warm.task_added(len(self.table) - 1)
+        self.update_task_list()
+        self.task_list.see(len(self.table) - 1)
+        self.clear_task_entry()
 
-            self.tasks.append(Task(name, duration, deadline))
-            self.update_task_list()
+    def edit_task(self) -> None:
+        """選択したタスクを入力欄の内容で更新"""
+        if self.busy:
+            return
+        idx = self.task_list.selected_index()
+        if idx is None:
+            messagebox.showwarning("入力エラー", "更新するタスクを選択してください")
+            return
+        entry = self.read_task_entry()
+        if entry is None:
+            return
+        self.table.update(idx, *entry)
+        if self.warm is not None:
+            self.warm.task_edited(idx)
+        self.update_task_list()
+        self.clear_task_entry()
 
-            self.name_entry.delete(0, tk.END)
-            self.duration_entry.delete(0, tk.END)
-            self.deadline_entry.delete(0, tk.END)
-
-        except ValueError:
-            messagebox.showwarning("入力エラー", "数値を正しく入力してください")
+    def on_task_select(self, idx: int) -> None:
+        """選択したタスクを入力欄に出す（「選択更新」で書き換えられるように）"""
+        if 0 <= idx < len(self.table):
+            self.clear_task_entry()
+            self.name_entry.insert(0, self.table.names[idx])
+            self.duration_entry.insert(0, str(self.table.durations[idx]))
+            self.deadline_entry.insert(0, str(self.table.deadlines[idx]))
 
     def delete_task(self) -> None:
-        selected = self.task_tree.selection()
-        if selected:
-            idx = self.task_tree.index(selected[0])
-            if 0 <= idx < len(self.tasks):
-                del self.tasks[idx]
+        if self.busy:
+            return
+        idx = self.task_list.selected_index()
+        if idx is not None:
+            self.table.delete(idx)
+            if self.warm is not None:
+                self.warm.task_deleted(idx)
+            self.task_list.clear_selection()
             self.update_task_list()
 
     def clear_tasks(self) -> None:
-        self.tasks.clear()
+        if self.busy:
+            return
+        self.table.clear()
+        self.warm = None
         self.update_task_list()
         self.result_text.delete(1.0, tk.END)
-        self.canvas.delete("all")
-        self.res_edf = self.res_spt = self.res_edf_improved = self.res_bruteforce = None
+        self.gantt.clear()
+        self.res_edf = self.res_spt = self.res_edf_improved = self.res_optimal = None
 
     def update_task_list(self) -> None:
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
-
-        for task in self.tasks:
-            self.task_tree.insert("", tk.END, values=(task.name, f"{task.duration}分", f"{task.deadline}分後"))
+        # 一覧は見えている行だけを書き換える（タスク数によらず一定の手間）
+        if self.task_list.table is not self.table:
+            self.task_list.set_table(self.table)
+        else:
+            self.task_list.refresh()
 
-        n = len(self.tasks)
+        n = len(self.table)
         if n > 0:
-            factorial = math.factorial(n)
-            info = f"タスク数: {n}個 | 総当たり: {n}! = {factorial:,}通り"
-            if n > 10:
-                info += " ⚠️ 非常に時間がかかる可能性"
+            if n <= 20:
+                info = f"タスク数: {n}個 | 総当たり: {n}! = {math.factorial(n):,}通り | DP: 2^{n} = {2 ** n:,}状態"
+            else:
+                # 巨大な整数を作らずに桁数だけ出す
+                digits = int(math.lgamma(n + 1) / math.log(10))
+                info = f"タスク数: {n:,}個 | 総当たり: {n}! ≈ 10^{digits}通り"
+            if n > LAWLER_MAX_TASKS:
+                info += " → 遅延時間は焼きなまし法（近似）"
+            elif n > 40:
+                info += " → 遅延時間は Lawler の分解法 ⚠️ 時間がかかる可能性"
+            elif n > DP_AUTO_TASKS:
+                info += " → 遅延時間は Lawler の分解法"
             self.info_label.config(text=info)
         else:
             self.info_label.config(text="")
 
+    def import_tasks(self) -> None:
+        """
+        CSV / JSON のタスクを読み込んで今の一覧と置き換える。
+        読み込みはワーカースレッドで chunk ごとに新しい表へ追加し、件数だけをメインスレッドに知らせる
+        （読み終わるまで今の表には触らないので、途中でも画面は固まらない。置き換える表の編集と計算は止める）。
+        """
+        if self.busy:
+            return
+        path = filedialog.askopenfilename(
+            title="タスクを読み込む",
+            filetypes=[("CSV / JSON", "*.csv *.json"), ("すべてのファイル", "*.*")],
+        )
+        if not path:
+            return
+
+        self.set_busy(True)
+        self.info_label.config(text="⏳ 読み込み中...")
+
+        def worker():
+            table = TaskTable()
+            try:
+                with open(path, encoding="utf-8-sig", newline="") as f:
+                    for chunk in iter_task_chunks(f, chunk_size=IMPORT_CHUNK_SIZE):
+                        table.extend(chunk)
+                        n = len(table)
+                        self.root.after(0, lambda n=n: self.info_label.config(text=f"⏳ 読み込み中... {n:,}件"))
+            except (OSError, ValueError) as e:
+                error = str(e)
+                self.root.after(0, lambda: self.import_failed(error))
+                return
+            self.root.after(0, lambda: self.import_finished(table))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def import_finished(self, table: TaskTable) -> None:
+        self.table = table
+        self.warm = None
+        self.res_edf = self.res_spt = self.res_edf_improved = self.res_optimal = None
+        self.result_text.delete(1.0, tk.END)
+        self.gantt.clear()
+        self.update_task_list()
+        self.set_busy(False)
+
+    def import_failed(self, error: str) -> None:
+        self.update_task_list()
+        self.set_busy(False)
+        messagebox.showerror("読み込みエラー", error)
+
     def get_current_objective(self) -> ObjectiveType:
         """現在選択されている目的関数を取得"""
         val = self.objective_var.get()
@@ -502,89 +508,232 @@ class TaskSchedulerApp:
     # -------------------------
     # Optimization methods
     # -------------------------
-    def heuristic_edf(self, obj_type: ObjectiveType) -> ScheduleResult:
+    def heuristic_edf(self, obj_type: ObjectiveType, profile: Optional[SolverProfile] = None) -> ScheduleResult:
         """EDF/EDD: 締切が早い順"""
-        start = time.perf_counter()
-        order = sorted(self.tasks, key=lambda t: t.deadline)
-        obj_value = calculate_objective(order, obj_type)
-        elapsed = time.perf_counter() - start
-        return ScheduleResult(order, obj_value, elapsed, candidates=1, obj_type=obj_type)
+        return run_edf(self.table, obj_type, profile)
 
-    def heuristic_spt(self, obj_type: ObjectiveType) -> ScheduleResult:
+    def heuristic_spt(self, obj_type: ObjectiveType, profile: Optional[SolverProfile] = None) -> ScheduleResult:
         """SPT: 所要時間が短い順"""
-        start = time.perf_counter()
-        order = sorted(self.tasks, key=lambda t: t.duration)
-        obj_value = calculate_objective(order, obj_type)
-        elapsed = time.perf_counter() - start
-        return ScheduleResult(order, obj_value, elapsed, candidates=1, obj_type=obj_type)
-
-    def heuristic_edf_improve(self, obj_type: ObjectiveType) -> ScheduleResult:
-        """EDF → swap改善（ローカル探索）"""
-        start = time.perf_counter()
-        base = sorted(self.tasks, key=lambda t: t.deadline)
-        improved, cands = improve_by_swaps(base, obj_type, max_iters=6000)
-        obj_value = calculate_objective(improved, obj_type)
-        elapsed = time.perf_counter() - start
-        return ScheduleResult(improved, obj_value, elapsed, candidates=(1 + cands), obj_type=obj_type)
+        return run_spt(self.table, obj_type, profile)
+
+    def heuristic_edf_improve(self, obj_type: ObjectiveType, best_improvement: bool = False,
+                              profile: Optional[SolverProfile] = None) -> ScheduleResult:
+        """EDF → swap改善（ローカル探索、SWAP_TIME_BUDGET 秒で打ち切り）"""
+        return run_edf_improve(self.table, obj_type, best_improvement, time_budget=SWAP_TIME_BUDGET,
+                               profile=profile)
 
     def brute_force_optimize(self, obj_type: ObjectiveType) -> ScheduleResult:
         """総当たりで最適解を探す"""
-        start = time.perf_counter()
-
-        best_order: Optional[List[Task]] = None
-        best_value = float("inf")
-        candidates = 0
-
-        for perm in permutations(self.tasks):
-            candidates += 1
-            order = list(perm)
-            value = calculate_objective(order, obj_type)
-            if value < best_value:
-                best_value = value
-                best_order = order
-
-        elapsed = time.perf_counter() - start
-        return ScheduleResult(best_order or [], int(best_value), elapsed, candidates=candidates, obj_type=obj_type)
+        return run_brute_force(self.table, obj_type)
+
+    def metaheuristic_optimize(self, obj_type: ObjectiveType, method: str = "anneal",
+                               time_budget: float = METAHEURISTIC_BUDGET, seed: Optional[int] = None,
+                               initial: Optional[ScheduleResult] = None,
+                               profile: Optional[SolverProfile] = None) -> ScheduleResult:
+        """焼きなまし法 / タブー探索（time_budget 秒で打ち切り）"""
+        return run_metaheuristic(self.table, obj_type, method, time_budget, seed, initial, profile)
+
+    def exact_optimize(self, obj_type: ObjectiveType, seed: Optional[ScheduleResult] = None,
+                       parallel: bool = False, control: Optional[SearchControl] = None,
+                       profile: Optional[SolverProfile] = None) -> ScheduleResult:
+        """目的関数とタスク数に応じた厳密解法（scheduler_core.run_exact）"""
+        return run_exact(self.table, obj_type, seed, parallel, control, profile)
+
+    def cancel_search(self) -> None:
+        """実行中の厳密探索を中止（暫定解が結果になる）"""
+        if self.search_control is not None:
+            self.search_control.cancel()
+            self.cancel_btn.config(state=tk.DISABLED)
+
+    def show_progress(self, obj_type: ObjectiveType, progress: SearchProgress) -> None:
+        """厳密探索の途中経過を、まだ終わっていない最適解の行に表示（メインスレッドで呼ぶ）"""
+        if self.search_control is None:
+            return
+        self.search_progress = progress
+        self.display_results(obj_type)
 
     # -------------------------
     # Optimize (threaded)
     # -------------------------
     def optimize(self) -> None:
-        if len(self.tasks) < 2:
+        if self.busy:
+            return
+        if len(self.table) < 2:
             messagebox.showwarning("エラー", "2つ以上のタスクを追加してください")
             return
 
-        n = len(self.tasks)
-        if n > 10:
-            if not messagebox.askyesno(
-                "確認",
-                f"タスクが{n}個あります。\n総当たり計算（{n}!）は時間がかかる可能性があります。\n続行しますか？"
-            ):
-                return
-
         obj_type = self.get_current_objective()
         obj_label = OBJECTIVE_LABELS[obj_type]
 
-        self.optimize_btn.config(state=tk.DISABLED)
+        # 多項式時間の解法がない目的関数だけ、指数時間の厳密解法のタスク数を確認する
+        # （上限を超えたら厳密解の代わりに焼きなまし法を使う）
+        n = len(self.table)
+        use_metaheuristic = obj_type not in POLYNOMIAL_OBJECTIVES and n > LAWLER_MAX_TASKS
+        if obj_type not in POLYNOMIAL_OBJECTIVES and not use_metaheuristic:
+            if n > 40:
+                if not messagebox.askyesno(
+                    "確認",
+                    f"タスクが{n}個あります。\n厳密解（Lawler の分解法）は時間がかかる可能性があります。\n続行しますか？"
+                ):
+                    return
+        parallel = self.parallel_var.get()
+        profiling = self.profile_var.get()
+        # 前回と同じ目的関数でタスクを少し変えただけなら、前回の順序から再最適化する
+        warm = self.warm
+        if warm is None or warm.obj_type != obj_type or not warm.changed:
+            warm = None
+        if use_metaheuristic:
+            if warm is not None:
+                self.optimal_label = "近似（前回の解から再最適化）"
+            else:
+                self.optimal_label = f"近似（焼きなまし {METAHEURISTIC_BUDGET * 1000:.0f}ms）"
+        else:
+            self.optimal_label = "最適（厳密解）"
+
+        # 途中経過はワーカースレッドから届くので、表示はメインスレッドに回す
+        control = SearchControl(
+            on_progress=lambda p: self.root.after(0, self.show_progress, obj_type, p))
+        self.search_control = control
+        self.search_progress = None
+
+        self.res_edf = self.res_spt = self.res_edf_improved = self.res_optimal = None
+        self.set_busy(True)
+        if not use_metaheuristic and obj_type not in POLYNOMIAL_OBJECTIVES:
+            self.cancel_btn.config(state=tk.NORMAL)
+        self.gantt.clear()
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, f"⏳ 計算中... 目的関数: {obj_label}（終わった解法から表示）\n")
+
+        cache = self.cache
+        table = self.table
+
+        def new_profile() -> Optional[SolverProfile]:
+            # 計測しないときは None を渡す（解法側は何も記録しない）
+            return SolverProfile() if profiling else None
+
+        # 最適値の下界: ヒューリスティックの解が届いていれば最適なので、厳密探索も焼きなましも省く
+        fut_bound = self.executor.submit(objective_lower_bound, table.durations, table.deadlines, obj_type)
+
+        def bounded(result: ScheduleResult) -> ScheduleResult:
+            result.raise_lower_bound(fut_bound.result())
+            return result
+
+        def edf() -> ScheduleResult:
+            return bounded(cache.get_or_solve(table, obj_type, "edf",
+                                              lambda: self.heuristic_edf(obj_type, new_profile())))
+
+        def spt() -> ScheduleResult:
+            return bounded(cache.get_or_solve(table, obj_type, "spt",
+                                              lambda: self.heuristic_spt(obj_type, new_profile())))
+
+        def edf_improve() -> ScheduleResult:
+            if warm is not None:
+                # 変更箇所の周りだけ局所探索（前回の解の履歴に依存するのでキャッシュには入れない）
+                return bounded(cache.get(table, obj_type, "edf_swap") or warm.solve(table, "edf_swap"))
+            return bounded(cache.get_or_solve(table, obj_type, "edf_swap",
+                                              lambda: self.heuristic_edf_improve(obj_type, profile=new_profile())))
+
+        # 軽い解法は数ミリ秒で終わるので、厳密解を待たずにすぐ表示される
+        fut_edf = self.executor.submit(edf)
+        fut_spt = self.executor.submit(spt)
+        fut_improve = self.executor.submit(edf_improve)
+
+        def optimal() -> ScheduleResult:
+            # 暫定解にはヒューリスティックの最良を使う（先に投入した future なので待っても詰まらない）
+            res_warm = warm.solve(table, "optimal") if warm is not None else None
+            bound = fut_bound.result()
+            res_edf_imp = fut_improve.result()
+            best_h = min((r for r in (res_edf_imp, res_warm, fut_edf.result(), fut_spt.result()) if r is not None),
+                         key=lambda r: r.obj_value)
+            if use_metaheuristic and best_h.obj_value > bound:
+                if res_warm is not None:
+                    res_opt = res_warm
+                else:
+                    res_opt = cache.get_or_solve(table, obj_type, f"anneal:{METAHEURISTIC_BUDGET}",
+                                                 lambda: self.metaheuristic_optimize(obj_type, initial=res_edf_imp,
+                                                                                     profile=new_profile()))
+                res_opt.lower_bound = bound
+                return res_opt
+            res_opt = cache.get(table, obj_type, "exact")
+            if res_opt is None:
+                res_opt = self.exact_optimize(obj_type, seed=best_h, parallel=parallel, control=control,
+                                              profile=new_profile())
+                if not control.cancelled:  # 中止時の暫定解は覚えない
+                    cache.put(table, obj_type, "exact", res_opt)
+            return res_opt
+
+        def on_solver_done(attr: str, fut: Future) -> None:
+            """1つの解法が終わるたびに呼ばれる（メインスレッド）"""
+            try:
+                setattr(self, attr, fut.result())
+            except Exception as e:
+                messagebox.showerror("エラー", f"計算に失敗しました: {e}")
+            res_opt = self.res_optimal
+            if attr == "res_optimal":
+                self.search_control = None
+                self.search_progress = None
+                self.cancel_btn.config(state=tk.DISABLED)
+                if control.cancelled:
+                    self.optimal_label = "暫定（中止時点）"
+                elif res_opt is not None and (res_opt.strategy == "lower_bound"
+                                              or (use_metaheuristic and res_opt.gap == 0)):
+                    self.optimal_label = "最適（下界と一致・探索省略）"
+
+            self.pending -= 1
+            if self.pending == 0:
+                if (obj_type in POLYNOMIAL_OBJECTIVES or control.cancelled
+                        or self.res_edf_improved is None or res_opt is None):
+                    self.warm = None
+                else:
+                    self.warm = WarmStartState(obj_type, {
+                        "edf_swap": table_index_order(table, self.res_edf_improved),
+                        "optimal": table_index_order(table, res_opt),
+                    })
+                self.set_busy(False)
+
+            self.display_results(obj_type)
+            self.draw_gantt_chart_safe()
+
+        jobs = [
+            ("res_edf", fut_edf),
+            ("res_spt", fut_spt),
+            ("res_edf_improved", fut_improve),
+            ("res_optimal", self.executor.submit(optimal)),
+        ]
+        self.pending = len(jobs)
+        for attr, fut in jobs:
+            # 完了時のコールバックはワーカースレッドで呼ばれるので、画面の更新は after でメインスレッドへ渡す
+            fut.add_done_callback(lambda f, attr=attr: self.root.after(0, on_solver_done, attr, f))
+
+    def pareto_optimize(self) -> None:
+        """
+        全順列を1回だけ評価して4目的のパレートフロントを求める。
+        各目的関数の最適解はキャッシュに入れるので、目的を切り替えて「最適化実行」しても再計算しない。
+        """
+        if self.busy:
+            return
+        n = len(self.table)
+        if n < 2:
+            messagebox.showwarning("エラー", "2つ以上のタスクを追加してください")
+            return
+        if n > PARETO_MAX_TASKS:
+            messagebox.showwarning("エラー", f"4目的まとめての総当たりは{PARETO_MAX_TASKS}タスクまでです")
+            return
+
+        self.set_busy(True)
         self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, f"⏳ 計算中... 目的関数: {obj_label}\n")
+        self.result_text.insert(tk.END, f"⏳ {n}! = {math.factorial(n):,}通りを4目的まとめて評価中...\n")
         self.root.update()
 
         def worker():
-            res_edf = self.heuristic_edf(obj_type)
-            res_spt = self.heuristic_spt(obj_type)
-            res_edf_imp = self.heuristic_edf_improve(obj_type)
-            res_bf = self.brute_force_optimize(obj_type)
+            table = self.table
+            front = run_pareto(table)
+            for obj_type, result in front.optima.items():
+                self.cache.put(table, obj_type, "exact", result)
 
             def done():
-                self.res_edf = res_edf
-                self.res_spt = res_spt
-                self.res_edf_improved = res_edf_imp
-                self.res_bruteforce = res_bf
-
-                self.display_results(obj_type)
-                self.draw_gantt_chart_safe()
-                self.optimize_btn.config(state=tk.NORMAL)
+                self.display_pareto(front)
+                self.set_busy(False)
 
             self.root.after(0, done)
 
@@ -593,11 +742,37 @@ class TaskSchedulerApp:
     # -------------------------
     # Display
     # -------------------------
+    def display_pareto(self, front: ParetoFront) -> None:
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        self.result_text.insert(tk.END, "🎯 4目的のパレートフロント（1回の総当たり）\n")
+        self.result_text.insert(tk.END, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        self.result_text.insert(tk.END, f"計算: {front.computation_time * 1000:.3f} ms | 候補: {front.candidates:,}"
+                                        f" | 非劣解: {len(front.points)}個\n\n")
+
+        for obj_type, result in front.optima.items():
+            order = " → ".join(t.name for t in result.order)
+            self.result_text.insert(tk.END, f"[最適: {OBJECTIVE_LABELS[obj_type]}] {result.obj_value}\n")
+            self.result_text.insert(tk.END, f"  順序: {order}\n")
+
+        header = "".join(f" {OBJECTIVE_LABELS[ot]:>10}" for ot in ObjectiveType)
+        self.result_text.insert(tk.END, f"\n{'#':<4}{header}\n")
+        self.result_text.insert(tk.END, "-" * 65 + "\n")
+        for k, (vec, _) in enumerate(front.points[:PARETO_DISPLAY_LIMIT], 1):
+            self.result_text.insert(tk.END, f"{k:<4}" + "".join(f" {v:>10}" for v in vec) + "\n")
+        if len(front.points) > PARETO_DISPLAY_LIMIT:
+            self.result_text.insert(tk.END, f"...（ほか {len(front.points) - PARETO_DISPLAY_LIMIT}個）\n")
+        self.result_text.insert(tk.END, "\n（各目的の最適解を覚えたので、目的を切り替えた「最適化実行」はすぐ終わります）\n")
+
     def display_results(self, obj_type: ObjectiveType) -> None:
         self.result_text.delete(1.0, tk.END)
+        if self.convergence_plot is not None:
+            self.convergence_plot.destroy()
+            self.convergence_plot = None
 
-        if not (self.res_edf and self.res_spt and self.res_edf_improved and self.res_bruteforce):
-            self.result_text.insert(tk.END, "結果がありません。\n")
+        if not (self.res_edf or self.res_spt or self.res_edf_improved or self.res_optimal):
+            if not self.pending:
+                self.result_text.insert(tk.END, "結果がありません。\n")
             return
 
         obj_label = OBJECTIVE_LABELS[obj_type]
@@ -607,15 +782,22 @@ class TaskSchedulerApp:
             ("EDF（締切順）", self.res_edf),
             ("SPT（短い順）", self.res_spt),
             ("EDF+改善（swap）", self.res_edf_improved),
-            ("最適（総当たり）", self.res_bruteforce),
+            (self.optimal_label, self.res_optimal),
         ]
 
         def line_res(name: str, r: ScheduleResult) -> str:
             order = " → ".join(t.name for t in r.order)
+            cached = "（キャッシュ）" if r.cached else ""
+            if r.gap is None:
+                bound = ""
+            elif r.gap == 0:
+                bound = f" | 下界: {r.lower_bound}（最適を証明）"
+            else:
+                bound = f" | 下界: {r.lower_bound}（差 {r.gap}）"
             return (
                 f"[{name}]\n"
-                f"  計算: {r.computation_time*1000:.3f} ms | 候補: {r.candidates:,}\n"
-                f"  【{obj_label}】: {r.obj_value}\n"
+                f"  計算: {r.computation_time*1000:.3f} ms | 候補: {r.candidates:,}{cached}\n"
+                f"  【{obj_label}】: {r.obj_value}{bound}\n"
                 f"  順序: {order}\n"
             )
 
@@ -624,22 +806,47 @@ class TaskSchedulerApp:
         self.result_text.insert(tk.END, f"   {obj_desc}\n")
         self.result_text.insert(tk.END, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n")
 
+        def line_progress(p: SearchProgress) -> str:
+            text = (f"  進捗: {p.fraction * 100:6.2f}%   経過: {p.elapsed:.1f}秒\n"
+                    f"  探索数: {p.candidates:,}  ({p.rate:,.0f} 候補/秒)\n")
+            if p.best_value is not None:
+                text += f"  暫定最良値: {p.best_value}\n"
+            if p.best_order:
+                names = [t.name for t in p.best_order[:10]]
+                more = " → ..." if len(p.best_order) > 10 else ""
+                text += f"  暫定順序: {' → '.join(names)}{more}\n"
+            return text + "  「⏹ 中止」で打ち切ると、その時点の暫定解を表示します。\n"
+
         for name, r in rows:
-            self.result_text.insert(tk.END, line_res(name, r))
+            if r is not None:
+                self.result_text.insert(tk.END, line_res(name, r))
+            elif name == self.optimal_label and self.search_progress is not None:
+                self.result_text.insert(tk.END, f"[{name}]\n  ⏳ 厳密探索中...\n" + line_progress(self.search_progress))
+            else:
+                self.result_text.insert(tk.END, f"[{name}]\n  ⏳ 計算中...\n")
             self.result_text.insert(tk.END, "\n")
 
+        if self.res_optimal is None:
+            return
+
         # 最適との比較
-        opt = self.res_bruteforce.obj_value
+        opt = self.res_optimal.obj_value
         self.result_text.insert(tk.END, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
-        self.result_text.insert(tk.END, f"📊 最適（総当たり）との比較 ({obj_label})\n")
+        self.result_text.insert(tk.END, f"📊 {self.optimal_label}との比較 ({obj_label})\n")
         self.result_text.insert(tk.END, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
 
         for name, r in rows[:-1]:
+            if r is None:
+                continue
             diff = r.obj_value - opt
             if diff == 0:
                 self.result_text.insert(tk.END, f"✅ {name}: 最適と同じ（差分0）\n")
             else:
-                self.result_text.insert(tk.END, f"⚠️ {name}: 差分 +{diff}\n")
+                self.result_text.insert(tk.END, f"⚠️ {name}: 差分 {diff:+}\n")
+        if self.res_optimal.gap:
+            # 近似・中止時の解は、最適値との差が最大でも下界との差まで
+            self.result_text.insert(tk.END, f"📉 {self.optimal_label}: 下界 {self.res_optimal.lower_bound}"
+                                            f" まで最大 {self.res_optimal.gap} 改善の余地\n")
 
         # 全目的関数での比較表
         self.result_text.insert(tk.END, "\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
@@ -653,6 +860,8 @@ class TaskSchedulerApp:
         self.result_text.insert(tk.END, "-" * 65 + "\n")
 
         for name, r in rows:
+            if r is None:
+                continue
             line = f"{name:<18}"
             for ot in ObjectiveType:
                 val = r.get_objective_value(ot)
@@ -663,140 +872,144 @@ class TaskSchedulerApp:
         self.result_text.insert(tk.END, "\n（★=今回の最適化対象）\n")
 
         # 速度比較
-        bf_ms = max(self.res_bruteforce.computation_time * 1000, 0.001)
-        edf_ms = max(self.res_edf.computation_time * 1000, 0.001)
-        spt_ms = max(self.res_spt.computation_time * 1000, 0.001)
-        imp_ms = max(self.res_edf_improved.computation_time * 1000, 0.001)
+        opt_ms = max(self.res_optimal.computation_time * 1000, 0.001)
+
+        self.result_text.insert(tk.END, f"\n⚡ 速度（{self.optimal_label}を1.0xとした相対）\n")
+        for name, r in (("EDF", self.res_edf), ("SPT", self.res_spt), ("EDF+改善", self.res_edf_improved)):
+            if r is not None:
+                self.result_text.insert(tk.END, f"  {name}: {opt_ms / max(r.computation_time * 1000, 0.001):.1f}x\n")
 
-        self.result_text.insert(tk.END, "\n⚡ 速度（総当たりを1.0xとした相対）\n")
-        self.result_text.insert(tk.END, f"  EDF: {bf_ms/edf_ms:.1f}x\n")
-        self.result_text.insert(tk.END, f"  SPT: {bf_ms/spt_ms:.1f}x\n")
-        self.result_text.insert(tk.END, f"  EDF+改善: {bf_ms/imp_ms:.1f}x\n")
+        profiled = [(name, r) for name, r in rows if r is not None and r.profile is not None]
+        if profiled:
+            self.display_profiles(profiled)
+
+    def display_profiles(self, profiled: List[Tuple[str, ScheduleResult]]) -> None:
+        """計測した解法の段階ごとの時間・評価数/秒と、収束グラフ（結果欄に埋め込む）"""
+        self.result_text.insert(tk.END, "\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        self.result_text.insert(tk.END, "🔬 計測（段階ごとの時間・評価数/秒・改善回数）\n")
+        self.result_text.insert(tk.END, "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        for name, r in profiled:
+            p = r.profile
+            phases = " / ".join(f"{phase} {sec * 1000:.2f}ms" for phase, sec in p.phases.items())
+            memory = f" | メモリ {p.peak_memory / 1024:.0f}KB" if p.peak_memory is not None else ""
+            self.result_text.insert(
+                tk.END,
+                f"[{name}]\n  {phases}\n"
+                f"  評価 {p.evaluations:,}回（{p.evaluations_per_second:,.0f}/秒） | 改善 {p.improvements:,}回{memory}\n")
+
+        series = [(name, r.profile.points()) for name, r in profiled if len(r.profile.points()) > 1]
+        if not series:
+            return
+        self.result_text.insert(tk.END, "\n📉 収束（横: 経過時間、縦: 目的関数値）\n")
+        self.convergence_plot = tk.Canvas(self.result_text, width=PLOT_WIDTH, height=PLOT_HEIGHT,
+                                          bg="#16213e", highlightthickness=0)
+        self.draw_convergence(self.convergence_plot, series)
+        self.result_text.window_create(tk.END, window=self.convergence_plot)
+        self.result_text.insert(tk.END, "\n")
+
+    def draw_convergence(self, canvas: tk.Canvas, series: List[Tuple[str, List[Tuple[float, int, int]]]]) -> None:
+        """(名前, [(経過秒, 評価数, 値), ...]) の列を階段状の折れ線で描く"""
+        left, right, top, bottom = 60, PLOT_WIDTH - 10, 10, PLOT_HEIGHT - 40
+        t_max = max(points[-1][0] for _, points in series) or 1e-9
+        values = [v for _, points in series for _, _, v in points]
+        v_min, v_max = min(values), max(values)
+        v_span = (v_max - v_min) or 1
+
+        def xy(t: float, v: int) -> Tuple[float, float]:
+            return (left + (right - left) * t / t_max,
+                    bottom - (bottom - top) * (v - v_min) / v_span)
+
+        canvas.create_line(left, top, left, bottom, right, bottom, fill="white")
+        canvas.create_text(left - 5, top, text=f"{v_max:,}", anchor=tk.NE, fill="white", font=(self.font_family, 8))
+        canvas.create_text(left - 5, bottom, text=f"{v_min:,}", anchor=tk.E, fill="white", font=(self.font_family, 8))
+        canvas.create_text(right, bottom + 3, text=f"{t_max * 1000:.1f}ms", anchor=tk.NE, fill="white",
+                           font=(self.font_family, 8))
+
+        for k, (name, points) in enumerate(series):
+            color = TASK_COLORS[k % len(TASK_COLORS)]
+            coords: List[float] = []
+            prev_y = None
+            for t, _, v in points:
+                x, y = xy(t, v)
+                if prev_y is not None:
+                    coords.extend((x, prev_y))  # 次の改善までは値が変わらない
+                coords.extend((x, y))
+                prev_y = y
+            coords.extend((right, prev_y))
+            canvas.create_line(*coords, fill=color, width=2)
+            canvas.create_text(left + 5 + 150 * k, PLOT_HEIGHT - 12, text=f"■ {name}", anchor=tk.W, fill=color,
+                               font=(self.font_family, 8))
+
+    def export_profiles(self) -> None:
+        """計測した結果を JSON ファイルに保存する"""
+        rows = [("EDF", self.res_edf), ("SPT", self.res_spt), ("EDF+改善", self.res_edf_improved),
+                (self.optimal_label, self.res_optimal)]
+        records = [{"algorithm": name, "value": r.obj_value, "profile": r.profile.to_dict()}
+                   for name, r in rows if r is not None and r.profile is not None]
+        if not records:
+            messagebox.showwarning("計測", "「🔬 計測」をオンにして最適化を実行してください")
+            return
+        path = filedialog.asksaveasfilename(title="計測を保存", defaultextension=".json",
+                                            filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        obj_type = next(r.obj_type for _, r in rows if r is not None and r.profile is not None)
+        data = {"objective": obj_type.value, "n": len(self.table), "results": records}
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            messagebox.showerror("保存エラー", str(e))
 
     def draw_gantt_chart_safe(self) -> None:
-        if not self.res_bruteforce:
+        # 終わった解法から順に描く
+        if not (self.res_edf or self.res_spt or self.res_edf_improved or self.res_optimal):
             return
         self.draw_gantt_chart()
 
     def draw_gantt_chart(self) -> None:
-        """ガントチャートを描画"""
-        self.canvas.delete("all")
-
-        if not (self.res_edf and self.res_spt and self.res_edf_improved and self.res_bruteforce):
+        """ガントチャートを描画（図形の作成・使い回しと拡大縮小は GanttCanvas が受け持つ）"""
+        results = [r for r in (self.res_edf, self.res_spt, self.res_edf_improved, self.res_optimal) if r]
+        if not results:
+            self.gantt.clear()
             return
 
         obj_type = self.get_current_objective()
         obj_label = OBJECTIVE_LABELS[obj_type]
 
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-        if canvas_width < 200:
-            canvas_width = 1100
-        if canvas_height < 200:
-            canvas_height = 260
-
         max_time = max(
-            sum(t.duration for t in self.tasks),
-            max((t.deadline for t in self.tasks), default=0),
-            self.res_bruteforce.makespan
-        )
-        max_time = max(max_time, 1)
-
-        margin_left = 180
-        margin_right = 20
-        margin_top = 30
-        bar_height = 30
-        gap = 12
-
-        chart_width = canvas_width - margin_left - margin_right
-        scale = chart_width / max_time
-
-        self.canvas.create_text(
-            canvas_width // 2, 15,
-            text=f"スケジュール比較（目的: {obj_label}）",
-            fill="white", font=(self.font_family, 11, "bold")
+            sum(self.table.durations),
+            max(self.table.deadlines, default=0),
+            max(r.makespan for r in results)
         )
 
-        colors = ["#e94560", "#00d9ff", "#f39c12", "#2ecc71", "#9b59b6", "#1abc9c", "#ff9ff3", "#48dbfb"]
-
         rows_all = [
             ("EDF（締切順）", self.res_edf),
             ("SPT（短い順）", self.res_spt),
             ("EDF+改善（swap）", self.res_edf_improved),
-            ("最適（総当たり）", self.res_bruteforce),
+            (self.optimal_label, self.res_optimal),
         ]
 
         if self.gantt_mode.get() == "2":
-            best_h = min(
-                [("EDF", self.res_edf), ("SPT", self.res_spt), ("EDF+改善", self.res_edf_improved)],
-                key=lambda x: x[1].obj_value
-            )
+            heuristics = [(name, r) for name, r in
+                          [("EDF", self.res_edf), ("SPT", self.res_spt), ("EDF+改善", self.res_edf_improved)] if r]
+            best_h = min(heuristics, key=lambda x: x[1].obj_value) if heuristics else ("", None)
             rows = [
                 (f"{best_h[0]}（ヒューリ）", best_h[1]),
-                ("最適（総当たり）", self.res_bruteforce),
+                (self.optimal_label, self.res_optimal),
             ]
         else:
             rows = rows_all
 
-        for row_idx, (label, result) in enumerate(rows):
-            y = margin_top + 10 + row_idx * (bar_height + gap + 14)
-
-            # 目的関数値を表示
-            obj_val = result.obj_value
-            self.canvas.create_text(
-                margin_left - 10, y + bar_height // 2,
-                text=f"{label}\n{obj_label}:{obj_val}",
-                fill="white", anchor=tk.E, font=(self.font_family, 10)
-            )
-
-            current_x = margin_left
-            for i, (task, start, end, delay) in enumerate(result.schedule):
-                width = (end - start) * scale
-                color = colors[i % len(colors)]
-
-                self.canvas.create_rectangle(
-                    current_x, y, current_x + width, y + bar_height,
-                    fill=color, outline="white", width=1
-                )
-
-                if width > 35:
-                    self.canvas.create_text(
-                        current_x + width / 2, y + bar_height / 2,
-                        text=task.name[:8], fill="white",
-                        font=(self.font_family, 9, "bold")
-                    )
-
-                if delay > 0:
-                    self.canvas.create_text(
-                        current_x + width / 2, y + bar_height + 10,
-                        text=f"⚠️{delay}分遅延", fill="#ff6b6b",
-                        font=(self.font_family, 8)
-                    )
-                current_x += width
-
-            for task in self.tasks:
-                deadline_x = margin_left + task.deadline * scale
-                self.canvas.create_line(
-                    deadline_x, y - 5, deadline_x, y + bar_height + 5,
-                    fill="#ff6b6b", dash=(3, 3), width=1
-                )
-
-        axis_y = margin_top + 10 + len(rows) * (bar_height + gap + 14) + 10
-        axis_y = min(axis_y, canvas_height - 35)
-
-        self.canvas.create_line(
-            margin_left, axis_y, canvas_width - margin_right, axis_y,
-            fill="white", width=2
+        self.gantt.show(
+            f"スケジュール比較（目的: {obj_label}）",
+            # まだ終わっていない解法は行だけ確保しておく（後から来ても行の位置が変わらない）
+            [(f"{label}\n{obj_label}:{result.obj_value}", result.schedule) if result is not None
+             else (f"{label}\n⏳ 計算中", []) for label, result in rows],
+            self.table.deadlines,
+            max_time,
         )
 
-        step = max(10, max_time // 10)
-        for t in range(0, max_time + 1, step):
-            x = margin_left + t * scale
-            self.canvas.create_line(x, axis_y - 5, x, axis_y + 5, fill="white", width=1)
-            self.canvas.create_text(x, axis_y + 15, text=f"{t}分", fill="white",
-                                    font=(self.font_family, 9))
-
-
 def main() -> None:
     root = tk.Tk()
     app = TaskSchedulerApp(root)